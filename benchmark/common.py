@@ -0,0 +1,69 @@
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.telemetry.noop import NoopTelemetry
+
+
+class SdkTelemetry(NoopTelemetry):
+    # Настоящие SDK-провайдеры без экспортеров: учитывает стоимость создания спанов и записи метрик
+    def __init__(self):
+        super().__init__("benchmark")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.trace import TracerProvider
+
+        self._tracer = TracerProvider().get_tracer("benchmark")
+        self._meter = MeterProvider().get_meter("benchmark")
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1] if len(samples) >= 20 else samples[-1]
+    print(
+        f"{name:<40} n={len(samples):<6} "
+        f"mean={statistics.mean(samples) * 1e6:9.1f}us "
+        f"median={statistics.median(samples) * 1e6:9.1f}us "
+        f"p95={p95 * 1e6:9.1f}us"
+    )
+
+
+def bench_sync(name: str, fn: Callable[[], object], iterations: int = 10000, warmup: int = 100) -> list[float]:
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    report(name, samples)
+    return samples
+
+
+async def bench_async(
+        name: str,
+        fn: Callable[[], Awaitable[object]],
+        iterations: int = 1000,
+        warmup: int = 20
+) -> list[float]:
+    for _ in range(warmup):
+        await fn()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+
+    report(name, samples)
+    return samples
+
+
+def run(coro) -> None:
+    asyncio.run(coro)
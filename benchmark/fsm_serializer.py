@@ -0,0 +1,109 @@
+"""
+Размер и скорость сериализации data FSM-хранилища на типичных ключах aiogram_dialog.
+
+Для каждого формата печатает байты на ключ и время encode/decode. Форматы,
+для которых не установлены msgpack или zstandard, пропускаются.
+
+    python benchmark/fsm_serializer.py --iterations 20000
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from common import bench_sync
+
+from infrastructure.fsm_storage.serializer import FsmSerializer, JSON_FORMAT, MSGPACK_FORMAT
+
+
+def release_dict(release_id: int) -> dict:
+    created_at = datetime(2025, 1, 1) + timedelta(hours=release_id)
+    return {
+        "id": release_id,
+        "service_name": f"loom-service-{release_id % 12}",
+        "release_tag": f"v1.{release_id // 10}.{release_id % 10}",
+        "rollback_to_tag": "",
+        "status": "manual_testing",
+        "initiated_by": "release-bot",
+        "github_run_id": str(9000000000 + release_id),
+        "github_action_link": f"https://github.com/example/loom-service/actions/runs/{9000000000 + release_id}",
+        "github_ref": "refs/tags/v1.0.0",
+        "approved_list": ["approver-one", "approver-two"],
+        "created_at": created_at.isoformat(),
+        "started_at": created_at.isoformat(),
+        "completed_at": (created_at + timedelta(minutes=30)).isoformat(),
+    }
+
+
+def dialog_keys() -> dict[str, dict]:
+    stack = {
+        "id": "",
+        "intents": ["a1b2c3d4e5", "f6g7h8i9j0"],
+        "last_message_id": 4242,
+        "last_reply_keyboard": False,
+        "last_media_id": None,
+        "last_media_unique_id": None,
+        "last_income_media_group_id": None,
+        "access_settings": None,
+    }
+    context = {
+        "intent_id": "f6g7h8i9j0",
+        "stack_id": "",
+        "state": "ActiveReleaseStates:view_releases",
+        "start_data": {"release_id": 120},
+        "widget_data": {},
+    }
+    return {
+        "stack": stack,
+        # Текущий формат: в dialog_data только навигация по id
+        "context (navigation)": {
+            **context,
+            "dialog_data": {
+                "navigation": {"release_ids": list(range(100, 140)), "current_index": 20, "total_count": 40},
+            },
+        },
+        # Прежний формат: списки релизов целиком внутри dialog_data
+        "context (embedded releases)": {
+            **context,
+            "dialog_data": {
+                "releases": [release_dict(release_id) for release_id in range(100, 140)],
+                "current_index": 20,
+            },
+        },
+    }
+
+
+def serializers() -> dict[str, FsmSerializer]:
+    variants = {
+        "json": (JSON_FORMAT, 0),
+        "json+zstd": (JSON_FORMAT, 256),
+        "msgpack": (MSGPACK_FORMAT, 0),
+        "msgpack+zstd": (MSGPACK_FORMAT, 256),
+    }
+
+    result = {}
+    for name, (format, threshold) in variants.items():
+        try:
+            result[name] = FsmSerializer(format, threshold)
+        except RuntimeError as err:
+            print(f"{name}: пропущен ({err})")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+
+    keys = dialog_keys()
+    for name, serializer in serializers().items():
+        print(f"\n{name}")
+        for key_name, data in keys.items():
+            encoded = serializer.dumps(data)
+            assert serializer.loads(encoded) == data
+
+            print(f"{key_name:<40} {len(encoded)} bytes")
+            bench_sync("  encode", lambda: serializer.dumps(data), args.iterations)
+            bench_sync("  decode", lambda: serializer.loads(encoded), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
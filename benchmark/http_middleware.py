@@ -0,0 +1,129 @@
+"""
+Накладные расходы HTTP middleware: три middleware FastAPI против одного ASGI middleware.
+
+Запросы подаются прямо в ASGI-приложение, без сети: как wrk, держим заданное число
+одновременных запросов в течение duration секунд и печатаем req/s и задержку
+на /health и POST /release. Сервис релизов заглушен, Idempotency-Key не передается, поэтому разница между
+режимами - это стоимость middleware.
+
+    python benchmark/http_middleware.py --duration 5 --concurrency 32 --sdk
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI
+
+from common import NoopTelemetry, SdkTelemetry, report, run
+
+from internal.app.server.app import include_http_middleware, include_release_handlers
+from internal.controller.http.handler.release.handler import ReleaseController
+from internal.controller.http.middlerware.middleware import HttpMiddleware
+
+PREFIX = "/api/tg-bot"
+
+RELEASE_BODY = json.dumps({
+    "service_name": "loom-service",
+    "release_tag": "v1.0.0",
+    "initiated_by": "release-bot",
+    "github_run_id": "9000000000",
+    "github_action_link": "https://github.com/example/loom-service/actions/runs/9000000000",
+    "github_ref": "refs/tags/v1.0.0",
+}).encode()
+
+
+class StubReleaseService:
+    async def create_release(self, **kwargs) -> int:
+        return 1
+
+
+async def health():
+    return "ok"
+
+
+def build_app(tel, mode: str) -> FastAPI:
+    app = FastAPI()
+    if mode != "none":
+        include_http_middleware(app, HttpMiddleware(tel, PREFIX), mode == "combined")
+
+    include_release_handlers(app, ReleaseController(tel, StubReleaseService(), None, 0), PREFIX)
+    app.add_api_route(PREFIX + "/health", health, methods=["GET"])
+    return app
+
+
+async def call(app: FastAPI, method: str, path: str, body: bytes = b"") -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"benchmark"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    received = False
+    status = 0
+
+    async def receive():
+        nonlocal received
+        if received:
+            await asyncio.sleep(3600)
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def load(name: str, app: FastAPI, method: str, path: str, body: bytes, duration: float, concurrency: int):
+    samples: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status = await call(app, method, path, body)
+            samples.append(time.perf_counter() - start)
+            assert status < 400, f"{name}: статус {status}"
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    print(f"{name:<40} {len(samples) / duration:10.0f} req/s")
+    report(f"{name} latency", samples)
+
+
+async def main(duration: float, concurrency: int, sdk: bool):
+    tel = SdkTelemetry() if sdk else NoopTelemetry()
+
+    for mode in ["none", "chain", "combined"]:
+        app = build_app(tel, mode)
+        # Прогрев: FastAPI собирает стек middleware на первом запросе
+        await call(app, "GET", PREFIX + "/health")
+
+        await load(f"{mode} GET /health", app, "GET", PREFIX + "/health", b"", duration, concurrency)
+        await load(f"{mode} POST /release", app, "POST", PREFIX + "/release", RELEASE_BODY, duration, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--sdk", action="store_true", help="Настоящие SDK-провайдеры OpenTelemetry вместо no-op")
+    args = parser.parse_args()
+
+    run(main(args.duration, args.concurrency, args.sdk))
@@ -0,0 +1,43 @@
+"""
+Сравнение PG.select (ORM-сессия + commit) и PG.select_readonly (asyncpg без транзакции)
+на запросе get_active_releases.
+
+Нужна доступная база с таблицей releases, параметры подключения задаются через
+BENCH_DB_USER, BENCH_DB_PASSWORD, BENCH_DB_HOST, BENCH_DB_PORT и BENCH_DB_NAME.
+
+    python benchmark/pg_select.py --iterations 2000
+"""
+import argparse
+import os
+
+from common import NoopTelemetry, bench_async, run
+
+from infrastructure.pg.pg import PG
+from internal.repo.release.query import get_active_releases
+
+
+def db_params() -> tuple:
+    return (
+        os.getenv("BENCH_DB_USER", "postgres"),
+        os.getenv("BENCH_DB_PASSWORD", "postgres"),
+        os.getenv("BENCH_DB_HOST", "localhost"),
+        os.getenv("BENCH_DB_PORT", "5432"),
+        os.getenv("BENCH_DB_NAME", "postgres"),
+    )
+
+
+async def main(iterations: int):
+    db = PG(NoopTelemetry(), *db_params())
+
+    await bench_async("PG.select get_active_releases", lambda: db.select(get_active_releases, {}), iterations)
+    await bench_async(
+        "PG.select_readonly get_active_releases",
+        lambda: db.select_readonly(get_active_releases, {}),
+        iterations
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=1000)
+    run(main(parser.parse_args().iterations))
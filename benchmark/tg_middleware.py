@@ -0,0 +1,68 @@
+"""
+Накладные расходы middleware Telegram: цепочка из трех middleware против одного прохода.
+
+Обработчик пустой, поэтому замер показывает только стоимость трассировки, метрик, логов
+и извлечения метаданных на синтетических Update.
+
+    python benchmark/tg_middleware.py --iterations 20000
+"""
+import argparse
+from datetime import datetime
+from functools import partial
+
+from aiogram import Bot
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+from common import NoopTelemetry, SdkTelemetry, bench_async, run
+
+from internal.controller.tg.middleware.middleware import TgMiddleware
+
+
+def synthetic_updates() -> dict[str, Update]:
+    user = User(id=1, is_bot=False, first_name="Bench", username="bench")
+    chat = Chat(id=1, type="private")
+    message = Message(message_id=1, date=datetime.now(), chat=chat, from_user=user, text="/start")
+
+    return {
+        "message": Update(update_id=1, message=message),
+        "callback_query": Update(
+            update_id=2,
+            callback_query=CallbackQuery(
+                id="1",
+                from_user=user,
+                chat_instance="bench",
+                data="confirm_release",
+                message=message,
+            ),
+        ),
+    }
+
+
+async def handler(event, data):
+    return None
+
+
+async def main(iterations: int, sdk: bool):
+    tel = SdkTelemetry() if sdk else NoopTelemetry()
+    middleware = TgMiddleware(tel, Bot(token="123456:BENCHMARK"))
+
+    chain = partial(
+        middleware.trace_middleware01,
+        partial(middleware.metric_middleware02, partial(middleware.logger_middleware03, handler))
+    )
+
+    for name, update in synthetic_updates().items():
+        await bench_async(f"chain {name}", lambda: chain(update, {}), iterations)
+        await bench_async(
+            f"combined {name}",
+            lambda: middleware.update_middleware(handler, update, {}),
+            iterations
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--sdk", action="store_true", help="Использовать SDK-провайдеры OpenTelemetry вместо no-op")
+    args = parser.parse_args()
+    run(main(args.iterations, args.sdk))
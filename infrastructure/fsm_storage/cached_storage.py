@@ -0,0 +1,205 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Mapping
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from infrastructure.fsm_storage.storage import SerializedRedisStorage
+from internal import interface, common
+from pkg.cache.lru import TTLCache, MISSING
+
+AFFINITY_MODE = "affinity"
+VERSIONED_MODE = "versioned"
+
+
+@dataclass
+class CachedEntry:
+    # Значения храним в том виде, в котором они лежат в Redis:
+    # сравнение при записи идет по байтам, а вызывающий код получает свою копию data
+    state: str | None
+    data: bytes | None
+    version: int
+
+
+class CachedRedisStorage(BaseStorage):
+    """Кеш FSM-состояний недавно активных чатов поверх RedisStorage.
+
+    Режим affinity доверяет кешу без обращения к Redis: подходит, когда апдейты
+    одного чата всегда обрабатывает один процесс (одна реплика или маршрутизация по чату).
+    Режим versioned хранит рядом с ключом счетчик версии, который растет при каждой
+    записи с любой реплики. Чтение по-прежнему стоит одного запроса в Redis, но при
+    совпадении версии вместо значения читается короткий счетчик и JSON не разбирается.
+    Промах загружает состояние, данные и версию одной транзакцией MULTI/EXEC. Запись
+    идет одной транзакцией вместе с INCR версии, как и без кеша.
+
+    Запись, не меняющая значение, пропускается только в режиме affinity: в режиме
+    versioned проверка свежести кеша перед записью стоила бы отдельного запроса.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            storage: SerializedRedisStorage,
+            mode: str,
+            max_size: int,
+            ttl: float,
+    ):
+        if mode not in (AFFINITY_MODE, VERSIONED_MODE):
+            raise ValueError(f"Неизвестный режим кеша FSM: {mode}")
+
+        self.logger = tel.logger()
+        self.storage = storage
+        self.redis = storage.redis
+        self.key_builder = storage.key_builder
+        self.serializer = storage.serializer
+        self.mode = mode
+
+        # Запись не должна жить в кеше дольше, чем ключ в Redis
+        storage_ttls = [self._ttl_seconds(value) for value in (storage.state_ttl, storage.data_ttl) if value]
+        self.version_ttl = max(storage_ttls) if storage_ttls else None
+        self.entries = TTLCache(max_size, min([ttl, *storage_ttls]))
+
+        meter = tel.meter()
+        self.hit_counter = meter.create_counter(
+            name=common.FSM_CACHE_HIT_METRIC,
+            description="FSM storage cache hits",
+            unit="1"
+        )
+        self.miss_counter = meter.create_counter(
+            name=common.FSM_CACHE_MISS_METRIC,
+            description="FSM storage cache misses",
+            unit="1"
+        )
+        self.skipped_write_counter = meter.create_counter(
+            name=common.FSM_CACHE_SKIPPED_WRITE_METRIC,
+            description="FSM storage writes skipped because the value did not change",
+            unit="1"
+        )
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        raw_state = state.state if isinstance(state, State) else state
+        entry = self.entries.get(key)
+        if self._can_skip(entry) and entry.state == raw_state:
+            self.skipped_write_counter.add(1, {common.FSM_DESTINY_KEY: key.destiny})
+            return
+
+        version = await self._write(key, "state", raw_state, self.storage.state_ttl)
+        self._remember(key, entry, version, state=raw_state)
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        entry = await self._load(key)
+        return entry.state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        raw_data = self.serializer.dumps(data) if data else None
+        entry = self.entries.get(key)
+        if self._can_skip(entry) and entry.data == raw_data:
+            self.skipped_write_counter.add(1, {common.FSM_DESTINY_KEY: key.destiny})
+            return
+
+        version = await self._write(key, "data", raw_data, self.storage.data_ttl)
+        self._remember(key, entry, version, data=raw_data)
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        entry = await self._load(key)
+        if entry.data is None:
+            return {}
+        return self.serializer.loads(entry.data)
+
+    async def close(self) -> None:
+        self.entries.clear()
+        await self.storage.close()
+
+    async def _load(self, key: StorageKey) -> CachedEntry:
+        attributes = {common.FSM_DESTINY_KEY: key.destiny}
+        entry = await self._cached(key)
+
+        if entry is not MISSING:
+            self.hit_counter.add(1, attributes)
+            return entry
+
+        self.miss_counter.add(1, attributes)
+
+        # Транзакция нужна, чтобы запись другой реплики не попала между чтением частей и версии
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.get(self.key_builder.build(key, "state"))
+            pipe.get(self.key_builder.build(key, "data"))
+            pipe.get(self._version_key(key))
+            raw_state, raw_data, version = await pipe.execute()
+
+        entry = CachedEntry(
+            state=self._to_str(raw_state),
+            data=self._to_bytes(raw_data),
+            version=self._to_int(version),
+        )
+        self.entries.set(key, entry)
+        return entry
+
+    async def _cached(self, key: StorageKey) -> Any:
+        entry = self.entries.get(key)
+        if entry is MISSING or self.mode == AFFINITY_MODE:
+            return entry
+
+        # Ключ могла изменить другая реплика
+        if self._to_int(await self.redis.get(self._version_key(key))) != entry.version:
+            self.entries.delete(key)
+            return MISSING
+        return entry
+
+    def _can_skip(self, entry: Any) -> bool:
+        return entry is not MISSING and self.mode == AFFINITY_MODE
+
+    async def _write(self, key: StorageKey, part: str, value: str | bytes | None, ttl: Any) -> int:
+        redis_key = self.key_builder.build(key, part)
+
+        async with self.redis.pipeline(transaction=self.mode == VERSIONED_MODE) as pipe:
+            if value is None:
+                pipe.delete(redis_key)
+            else:
+                pipe.set(redis_key, value, ex=ttl)
+            if self.mode == VERSIONED_MODE:
+                pipe.incr(self._version_key(key))
+                if self.version_ttl is not None:
+                    pipe.expire(self._version_key(key), self.version_ttl)
+            results = await pipe.execute()
+
+        if self.mode != VERSIONED_MODE:
+            return 0
+        return int(results[1])
+
+    def _remember(self, key: StorageKey, entry: Any, version: int, **values: str | bytes | None) -> None:
+        # Вторую часть ключа мы знаем, только если она уже была в кеше. В режиме versioned
+        # с момента кеширования ключ могла изменить другая реплика: тогда версия
+        # выросла больше чем на единицу, и дополнять кешированную запись нельзя
+        if entry is MISSING or (self.mode == VERSIONED_MODE and version != entry.version + 1):
+            self.entries.delete(key)
+            return
+
+        self.entries.set(key, CachedEntry(
+            state=values.get("state", entry.state),
+            data=values.get("data", entry.data),
+            version=version,
+        ))
+
+    def _version_key(self, key: StorageKey) -> str:
+        return self.key_builder.build(key, "version")
+
+    @staticmethod
+    def _ttl_seconds(value: Any) -> int:
+        return int(value.total_seconds()) if isinstance(value, timedelta) else int(value)
+
+    @staticmethod
+    def _to_str(value: Any) -> str | None:
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    @staticmethod
+    def _to_bytes(value: Any) -> bytes | None:
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return value
+
+    @staticmethod
+    def _to_int(value: Any) -> int:
+        return int(value) if value is not None else 0
@@ -0,0 +1,74 @@
+import json
+from typing import Any, Mapping
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+JSON_FORMAT = "json"
+MSGPACK_FORMAT = "msgpack"
+
+# Первый байт значения определяет формат. JSON-объект всегда начинается с "{",
+# поэтому значения, записанные до появления сериализатора, читаются без миграции
+MSGPACK_MARKER = b"\x01"
+ZSTD_MSGPACK_MARKER = b"\x02"
+ZSTD_JSON_MARKER = b"\x03"
+
+
+class FsmSerializer:
+    """Сериализация data FSM-хранилища: JSON или msgpack, со сжатием zstd крупных значений"""
+
+    def __init__(
+            self,
+            format: str = JSON_FORMAT,
+            compress_threshold: int = 0,
+            compress_level: int = 3,
+    ):
+        if format not in (JSON_FORMAT, MSGPACK_FORMAT):
+            raise ValueError(f"Неизвестный формат сериализации FSM: {format}")
+        if format == MSGPACK_FORMAT and msgpack is None:
+            raise RuntimeError("Для формата msgpack нужен пакет msgpack")
+        if compress_threshold > 0 and zstandard is None:
+            raise RuntimeError("Для сжатия FSM нужен пакет zstandard")
+
+        self.format = format
+        self.compress_threshold = compress_threshold
+
+        self._compressor = zstandard.ZstdCompressor(level=compress_level) if compress_threshold > 0 else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+    def dumps(self, data: Mapping[str, Any]) -> bytes:
+        if self.format == MSGPACK_FORMAT:
+            payload = msgpack.packb(data, use_bin_type=True)
+            marker, compressed_marker = MSGPACK_MARKER, ZSTD_MSGPACK_MARKER
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            marker, compressed_marker = b"", ZSTD_JSON_MARKER
+
+        if self._compressor is not None and len(payload) >= self.compress_threshold:
+            return compressed_marker + self._compressor.compress(payload)
+        return marker + payload
+
+    def loads(self, value: bytes | str) -> dict[str, Any]:
+        if isinstance(value, str):
+            return json.loads(value)
+
+        marker = value[:1]
+        if marker == MSGPACK_MARKER:
+            return msgpack.unpackb(value[1:], raw=False)
+        if marker == ZSTD_MSGPACK_MARKER:
+            return msgpack.unpackb(self._decompress(value[1:]), raw=False)
+        if marker == ZSTD_JSON_MARKER:
+            return json.loads(self._decompress(value[1:]))
+        return json.loads(value)
+
+    def _decompress(self, value: bytes) -> bytes:
+        if self._decompressor is None:
+            raise RuntimeError("Значение FSM сжато zstd, но пакет zstandard не установлен")
+        return self._decompressor.decompress(value)
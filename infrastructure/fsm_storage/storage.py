@@ -0,0 +1,31 @@
+from typing import Any, Mapping
+
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.redis import RedisStorage
+
+from infrastructure.fsm_storage.serializer import FsmSerializer
+
+
+class SerializedRedisStorage(RedisStorage):
+    """RedisStorage, который хранит data в формате FsmSerializer.
+
+    Стандартный RedisStorage декодирует значение как UTF-8 перед json_loads,
+    поэтому бинарные форматы требуют своей реализации чтения и записи data.
+    """
+
+    def __init__(self, *args, serializer: FsmSerializer, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.serializer = serializer
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        redis_key = self.key_builder.build(key, "data")
+        if not data:
+            await self.redis.delete(redis_key)
+            return
+        await self.redis.set(redis_key, self.serializer.dumps(data), ex=self.data_ttl)
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        value = await self.redis.get(self.key_builder.build(key, "data"))
+        if value is None:
+            return {}
+        return self.serializer.loads(value)
@@ -0,0 +1,201 @@
+import asyncio
+import re
+from collections import defaultdict
+
+from opentelemetry.metrics import CallbackOptions, Observation
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from infrastructure.fsm_storage.serializer import FsmSerializer
+from internal import interface, common
+
+# aiogram_dialog 2.x пишет destiny как aiogd:context:<intent_id> и aiogd:stack:<stack_id>;
+# id стека по умолчанию пустой, поэтому его ключ выглядит как ...:aiogd:stack::data
+DESTINY_PREFIX = "aiogd"
+CONTEXT_KIND = "context"
+STACK_KIND = "stack"
+
+
+class FsmSweeper(interface.IBackgroundService):
+    """Периодически обходит ключи aiogram_dialog в Redis через SCAN.
+
+    Считает стеки и контексты диалогов, а контексты, на которые не ссылается ни один
+    стек того же пользователя, удаляет. Кандидат удаляется только если остался
+    сиротой два обхода подряд: контекст нового диалога записывается раньше стека,
+    и между этими записями он выглядит брошенным. Контексты пользователя с
+    нечитаемым стеком не трогаются.
+
+    Память берется из INFO memory и относится ко всему инстансу Redis, а не
+    только к базе FSM: отдельной статистики по базе Redis не ведет.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            redis,
+            serializer: FsmSerializer,
+            interval: float,
+            key_prefix: str = "fsm",
+            separator: str = ":",
+            scan_count: int = 1000,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.redis = redis
+        self.serializer = serializer
+        self.interval = interval
+        self.key_prefix = key_prefix
+        self.separator = separator
+        self.scan_count = scan_count
+
+        # {prefix}:{chat_id}[:{thread_id}]:{user_id}:aiogd:{context|stack}:{id}:{part}
+        sep = re.escape(separator)
+        self._key_pattern = re.compile(
+            rf"^{re.escape(key_prefix)}{sep}(?P<owner>.+){sep}{DESTINY_PREFIX}:"
+            rf"(?P<kind>{CONTEXT_KIND}|{STACK_KIND}):(?P<item_id>[^:]*){sep}(?P<part>[^:]+)$"
+        )
+
+        self.orphan_candidates: set[tuple] = set()
+        self.key_counts: dict[str, int] = {}
+        self.used_memory = 0
+        self._task: asyncio.Task | None = None
+
+        meter = tel.meter()
+        meter.create_observable_gauge(
+            name=common.FSM_KEYS_METRIC,
+            callbacks=[self._observe_key_counts],
+            description="aiogram_dialog keys in the FSM storage by kind",
+            unit="1"
+        )
+        meter.create_observable_gauge(
+            name=common.FSM_REDIS_INSTANCE_MEMORY_METRIC,
+            callbacks=[self._observe_memory],
+            description="Memory used by the whole Redis instance hosting the FSM storage",
+            unit="by"
+        )
+        self.deleted_counter = meter.create_counter(
+            name=common.FSM_ORPHAN_DELETED_METRIC,
+            description="Orphaned aiogram_dialog contexts removed by the sweeper",
+            unit="1"
+        )
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as err:
+                self.logger.error(f"Ошибка очистки FSM-хранилища: {err}")
+            await asyncio.sleep(self.interval)
+
+    async def sweep(self) -> int:
+        with self.tracer.start_as_current_span(
+                "FsmSweeper.sweep",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                stack_keys: dict[tuple, list[str]] = defaultdict(list)
+                context_keys: dict[tuple, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+
+                match = f"{self.key_prefix}{self.separator}*{self.separator}{DESTINY_PREFIX}:*"
+                async for raw_key in self.redis.scan_iter(match=match, count=self.scan_count):
+                    key = raw_key.decode("utf-8") if isinstance(raw_key, bytes) else raw_key
+                    parsed = self._parse_key(key)
+                    if parsed is None:
+                        continue
+
+                    owner, kind, item_id, part = parsed
+                    if kind == STACK_KIND and part == "data":
+                        stack_keys[owner].append(key)
+                    elif kind == CONTEXT_KIND:
+                        context_keys[owner][item_id].append(key)
+
+                referenced, unreadable = await self._referenced_intents(stack_keys)
+
+                orphans = {
+                    (owner, intent_id): keys
+                    for owner, intents in context_keys.items()
+                    if owner not in unreadable
+                    for intent_id, keys in intents.items()
+                    if intent_id not in referenced.get(owner, set())
+                }
+
+                expired = [orphans[candidate] for candidate in orphans.keys() & self.orphan_candidates]
+                self.orphan_candidates = set(orphans.keys()) - self.orphan_candidates
+
+                deleted = 0
+                for keys in expired:
+                    deleted += await self.redis.delete(*keys)
+                if expired:
+                    self.deleted_counter.add(len(expired))
+
+                self.key_counts = {
+                    "stack": sum(len(keys) for keys in stack_keys.values()),
+                    "context": sum(len(intents) for intents in context_keys.values()),
+                    "orphan": len(orphans) - len(expired),
+                }
+                self.used_memory = (await self.redis.info("memory")).get("used_memory", 0)
+
+                self.logger.info(
+                    f"Очистка FSM-хранилища: удалено контекстов {len(expired)}, ключей {deleted}",
+                    self.key_counts
+                )
+
+                span.set_attribute("deleted_contexts", len(expired))
+                span.set_attribute("unreadable_stacks", len(unreadable))
+                span.set_status(Status(StatusCode.OK))
+                return len(expired)
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _referenced_intents(
+            self,
+            stack_keys: dict[tuple, list[str]]
+    ) -> tuple[dict[tuple, set[str]], set[tuple]]:
+        referenced: dict[tuple, set[str]] = defaultdict(set)
+        unreadable: set[tuple] = set()
+        for owner, keys in stack_keys.items():
+            for key, value in zip(keys, await self.redis.mget(keys)):
+                # Стек мог истечь между SCAN и MGET
+                if value is None:
+                    continue
+                try:
+                    referenced[owner].update(self.serializer.loads(value).get("intents", []))
+                except Exception as err:
+                    # Одно битое значение не должно останавливать обход; без стека не знаем,
+                    # какие контексты живы, поэтому контексты владельца в этот раз не удаляем
+                    self.logger.warning(f"Не удалось разобрать стек диалогов {key}: {err}")
+                    unreadable.add(owner)
+        return referenced, unreadable
+
+    def _parse_key(self, key: str) -> tuple[tuple, str, str, str] | None:
+        match = self._key_pattern.match(key)
+        if match is None:
+            return None
+        owner = tuple(match.group("owner").split(self.separator))
+        return owner, match.group("kind"), match.group("item_id"), match.group("part")
+
+    def _observe_key_counts(self, options: CallbackOptions):
+        return [
+            Observation(count, {common.FSM_KEY_KIND_KEY: kind})
+            for kind, count in self.key_counts.items()
+        ]
+
+    def _observe_memory(self, options: CallbackOptions):
+        return [Observation(self.used_memory)]
@@ -0,0 +1,118 @@
+import asyncio
+import json
+from typing import Awaitable, Callable
+
+import asyncpg
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from infrastructure.pg.pg import NewConnection
+from internal import interface
+
+
+class PGListener(interface.IDBListener):
+    """Подписка на LISTEN/NOTIFY канала на отдельном соединении.
+
+    Подписчики получают распарсенный JSON из уведомления. После переподключения
+    подписчики вызываются с None: уведомления за время разрыва потеряны,
+    и состояние нужно пересобрать целиком.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            db_user,
+            db_pass,
+            db_host,
+            db_port,
+            db_name,
+            channel: str,
+            reconnect_delay: float = 1,
+            max_reconnect_delay: float = 30,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.db_params = (db_user, db_pass, db_host, db_port, db_name)
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.handlers: list[Callable[[dict | None], Awaitable[None]]] = []
+        self._task: asyncio.Task | None = None
+        self._handler_tasks: set[asyncio.Task] = set()
+
+    def subscribe(self, handler: Callable[[dict | None], Awaitable[None]]) -> None:
+        self.handlers.append(handler)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        connected_before = False
+
+        while True:
+            conn: asyncpg.Connection | None = None
+            try:
+                conn = await NewConnection(*self.db_params)
+                terminated = asyncio.Event()
+                conn.add_termination_listener(lambda _: terminated.set())
+                await conn.add_listener(self.channel, self._on_notification)
+
+                self.logger.info(f"Подписка на канал {self.channel} установлена")
+                delay = self.reconnect_delay
+
+                if connected_before:
+                    self._dispatch(None)
+                connected_before = True
+
+                await terminated.wait()
+                self.logger.warning(f"Соединение LISTEN {self.channel} разорвано")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.error(f"Ошибка подписки на канал {self.channel}: {err}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _on_notification(self, conn: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self._dispatch(json.loads(payload))
+        except json.JSONDecodeError:
+            self.logger.warning(f"Некорректное уведомление в канале {channel}: {payload}")
+
+    def _dispatch(self, payload: dict | None) -> None:
+        for handler in self.handlers:
+            task = asyncio.create_task(self._handle(handler, payload))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+
+    async def _handle(self, handler: Callable[[dict | None], Awaitable[None]], payload: dict | None) -> None:
+        with self.tracer.start_as_current_span(
+                "PGListener.handle",
+                kind=SpanKind.CONSUMER,
+                attributes={"channel": self.channel}
+        ) as span:
+            try:
+                await handler(payload)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                self.logger.error(f"Ошибка обработки уведомления {payload}: {err}")
@@ -1,5 +1,9 @@
+import asyncio
+import re
+from functools import lru_cache
 from typing import Any, Sequence
 
+import asyncpg
 from opentelemetry.trace import Status, StatusCode, SpanKind
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -32,12 +36,80 @@ def NewPool(
     return pool
 
 
+class Record(asyncpg.Record):
+    # Доступ к колонкам через атрибуты, как у строк SQLAlchemy
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+_named_param = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+@lru_cache(maxsize=512)
+def to_positional(query: str) -> tuple[str, tuple[str, ...]]:
+    # Переводит :name в $n для asyncpg, результат кешируется по тексту запроса
+    names: list[str] = []
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    return _named_param.sub(replace, query), tuple(names)
+
+
+def NewReadonlyPool(
+        db_user,
+        db_pass,
+        db_host,
+        db_port,
+        db_name
+):
+    return asyncpg.create_pool(
+        user=db_user,
+        password=db_pass,
+        host=db_host,
+        port=db_port,
+        database=db_name,
+        min_size=1,
+        max_size=15,
+        max_inactive_connection_lifetime=300,
+        statement_cache_size=512,
+        record_class=Record,
+    )
+
+
+def NewConnection(
+        db_user,
+        db_pass,
+        db_host,
+        db_port,
+        db_name
+):
+    # Отдельное соединение вне пулов, например для LISTEN
+    return asyncpg.connect(
+        user=db_user,
+        password=db_pass,
+        host=db_host,
+        port=db_port,
+        database=db_name,
+    )
+
+
 class PG(interface.IDB):
 
     def __init__(self, tel: interface.ITelemetry, db_user, db_pass, db_host, db_port, db_name):
         self.pool = NewPool(db_user, db_pass, db_host, db_port, db_name)
         self.tracer = tel.tracer()
 
+        self.db_params = (db_user, db_pass, db_host, db_port, db_name)
+        self.readonly_pool: asyncpg.Pool | None = None
+        self.readonly_pool_lock = asyncio.Lock()
+
     async def insert(self, query: str, query_params: dict) -> int:
         with self.tracer.start_as_current_span(
                 "PG.insert",
@@ -86,6 +158,23 @@ class PG(interface.IDB):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def update_returning(self, query: str, query_params: dict) -> Sequence[Any]:
+        with self.tracer.start_as_current_span(
+                "PG.update_returning",
+                kind=SpanKind.CLIENT,
+        ) as span:
+            try:
+                async with self.pool() as session:
+                    result = await session.execute(text(query), query_params)
+                    rows = result.all()
+                    await session.commit()
+                    span.set_status(Status(StatusCode.OK))
+                    return rows
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
     async def select(self, query: str, query_params: dict) -> Sequence[Any]:
         with self.tracer.start_as_current_span(
                 "PG.select",
@@ -103,6 +192,45 @@ class PG(interface.IDB):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def select_readonly(self, query: str, query_params: dict) -> Sequence[Any]:
+        with self.tracer.start_as_current_span(
+                "PG.select_readonly",
+                kind=SpanKind.CLIENT,
+        ) as span:
+            try:
+                positional_query, names = to_positional(query)
+                args = [query_params[name] for name in names]
+
+                # Без транзакции и commit: asyncpg выполняет запрос в autocommit
+                # и переиспользует подготовленный statement из кеша соединения
+                pool = await self._get_readonly_pool()
+                async with pool.acquire() as conn:
+                    rows = await conn.fetch(positional_query, *args)
+
+                span.set_status(Status(StatusCode.OK))
+                return rows
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def start(self) -> None:
+        # Пулы создаются лениво при первом запросе
+        pass
+
+    async def stop(self) -> None:
+        async with self.readonly_pool_lock:
+            if self.readonly_pool is not None:
+                await self.readonly_pool.close()
+                self.readonly_pool = None
+
+    async def _get_readonly_pool(self) -> asyncpg.Pool:
+        if self.readonly_pool is None:
+            async with self.readonly_pool_lock:
+                if self.readonly_pool is None:
+                    self.readonly_pool = await NewReadonlyPool(*self.db_params)
+        return self.readonly_pool
+
     async def multi_query(
             self,
             queries: list[str]
@@ -47,6 +47,14 @@ class RedisClient(interface.IRedis):
         except Exception as e:
             raise e
 
+    async def set_nx(self, key: str, value: Any, ttl: int) -> bool:
+        try:
+            client = await self.get_async_client()
+            result = await client.set(key, self._serialize_value(value), ex=ttl, nx=True)
+            return bool(result)
+        except Exception as e:
+            raise e
+
     async def get(self, key: str, default: Any = None) -> Any:
         try:
             client = await self.get_async_client()
@@ -0,0 +1,30 @@
+from opentelemetry import metrics, trace
+
+from internal import interface
+
+
+class NoopLogger(interface.IOtelLogger):
+    def debug(self, message: str, fields: dict = None) -> None: pass
+
+    def info(self, message: str, fields: dict = None) -> None: pass
+
+    def warning(self, message: str, fields: dict = None) -> None: pass
+
+    def error(self, message: str, fields: dict = None) -> None: pass
+
+
+class NoopTelemetry(interface.ITelemetry):
+    # Телеметрия без экспорта: для бенчмарков и тестов, где OTLP не нужен
+    def __init__(self, name: str = "noop"):
+        self._tracer = trace.NoOpTracer()
+        self._meter = metrics.NoOpMeter(name)
+        self._logger = NoopLogger()
+
+    def tracer(self):
+        return self._tracer
+
+    def meter(self):
+        return self._meter
+
+    def logger(self):
+        return self._logger
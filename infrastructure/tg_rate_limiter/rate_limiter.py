@@ -0,0 +1,188 @@
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import AnswerCallbackQuery, AnswerInlineQuery, Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from internal import interface, common
+from pkg.cache.lru import TTLCache, MISSING
+
+
+class Priority(IntEnum):
+    # Меньше - раньше
+    INTERACTIVE = 0
+    EDIT = 1
+    DEFAULT = 2
+    ALERT = 3
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """Забирает токен и возвращает, сколько ждать до его появления"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        return 0 if tokens >= 1 else (1 - tokens) / self.rate
+
+
+class TelegramRateLimiter:
+    """Общий лимитер исходящих запросов к Bot API.
+
+    Глобальное ведро выдается по приоритетам: ответы на callback идут раньше правок
+    сообщений, а те раньше рассылок и алертов. Личные ведра на чат ограничивают
+    отправку в один чат. После 429 все запросы ждут retry_after.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            global_rate: float = 30,
+            chat_rate: float = 1,
+            group_chat_rate: float = 20 / 60,
+            max_retries: int = 3,
+    ):
+        self.logger = tel.logger()
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self.chat_rate = chat_rate
+        self.group_chat_rate = group_chat_rate
+        self.max_retries = max_retries
+
+        self.chat_buckets = TTLCache(max_size=10000, ttl=600)
+        self.paused_until = 0.0
+
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+
+        meter = tel.meter()
+        self.wait_time = meter.create_histogram(
+            name=common.TELEGRAM_OUTBOUND_WAIT_METRIC,
+            description="Time an outgoing Bot API request waited for rate limit tokens",
+            unit="s"
+        )
+        self.retry_after_counter = meter.create_counter(
+            name=common.TELEGRAM_OUTBOUND_RETRY_AFTER_METRIC,
+            description="Bot API responses with 429 retry_after",
+            unit="1"
+        )
+
+    async def acquire(self, priority: Priority, bot_id: int, chat_id: int | str | None) -> None:
+        start_time = time.monotonic()
+
+        if chat_id is not None:
+            bucket = self._chat_bucket(bot_id, chat_id)
+            delay = bucket.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+
+        await self._acquire_global(priority)
+        self.wait_time.record(
+            time.monotonic() - start_time,
+            {common.TELEGRAM_OUTBOUND_PRIORITY_KEY: priority.name.lower()}
+        )
+
+    def pause(self, retry_after: float) -> None:
+        self.retry_after_counter.add(1)
+        self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+        self.logger.warning(f"Telegram вернул 429, исходящие запросы приостановлены на {retry_after}с")
+
+    async def _acquire_global(self, priority: Priority) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._wakeup.set()
+        await future
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._waiters:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            pause = self.paused_until - time.monotonic()
+            delay = max(pause, self.global_bucket.delay())
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            # Токен достается самому приоритетному ожидающему на момент выдачи
+            _, _, future = heapq.heappop(self._waiters)
+            if future.cancelled():
+                continue
+            self.global_bucket.reserve()
+            future.set_result(None)
+
+    def _chat_bucket(self, bot_id: int, chat_id: int | str) -> TokenBucket:
+        key = (bot_id, chat_id)
+        bucket = self.chat_buckets.get(key)
+        if bucket is MISSING:
+            # Отрицательные id - группы и каналы, у них лимит строже
+            is_group = isinstance(chat_id, str) or chat_id < 0
+            rate = self.group_chat_rate if is_group else self.chat_rate
+            bucket = TokenBucket(rate, 1)
+            self.chat_buckets.set(key, bucket)
+        return bucket
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+    """Middleware сессии бота, пропускающее запросы через TelegramRateLimiter"""
+
+    def __init__(self, limiter: TelegramRateLimiter, priority: Priority = None):
+        self.limiter = limiter
+        # Фиксированный приоритет для всех запросов сессии, например для бота алертов
+        self.priority = priority
+
+    async def __call__(
+            self,
+            make_request: NextRequestMiddlewareType[TelegramType],
+            bot: Bot,
+            method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        priority = self.priority if self.priority is not None else self._priority(method)
+        chat_id = None if isinstance(method, (AnswerCallbackQuery, AnswerInlineQuery)) else getattr(method, "chat_id", None)
+
+        attempt = 0
+        while True:
+            await self.limiter.acquire(priority, bot.id, chat_id)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as err:
+                self.limiter.pause(err.retry_after)
+                attempt += 1
+                if attempt > self.limiter.max_retries:
+                    raise
+
+    @staticmethod
+    def _priority(method: TelegramMethod) -> Priority:
+        if isinstance(method, (AnswerCallbackQuery, AnswerInlineQuery)):
+            return Priority.INTERACTIVE
+        name = type(method).__name__
+        if name.startswith("Edit") or name.startswith("Delete"):
+            return Priority.EDIT
+        return Priority.DEFAULT
@@ -1,13 +1,16 @@
 from fastapi import FastAPI
 
-from internal import model, interface
+from internal import interface
 
 
 def NewServer(
-        db: interface.IDB,
+        migration_manager: interface.IMigrationManager,
+        background_services: list[interface.IBackgroundService],
         http_middleware: interface.IHttpMiddleware,
+        combined_http_middleware: bool,
         tg_webhook_controller: interface.ITelegramWebhookController,
         release_controller: interface.IReleaseController,
+        release_stream_controller: interface.IReleaseStreamController,
         prefix: str
 ):
     app = FastAPI(
@@ -15,24 +18,43 @@ def NewServer(
         docs_url=prefix + "/docs",
         redoc_url=prefix + "/redoc",
     )
-    include_http_middleware(app, http_middleware)
+    include_http_middleware(app, http_middleware, combined_http_middleware)
+    include_lifecycle(app, background_services)
 
-    include_db_handler(app, db, prefix)
+    include_migration_handlers(app, migration_manager, prefix)
     include_tg_webhook(app, tg_webhook_controller, prefix)
     include_release_handlers(app, release_controller, prefix)
+    include_release_stream_handlers(app, release_stream_controller, prefix)
 
     return app
 
 
 def include_http_middleware(
         app: FastAPI,
-        http_middleware: interface.IHttpMiddleware
+        http_middleware: interface.IHttpMiddleware,
+        combined: bool,
 ):
+    if combined:
+        http_middleware.asgi_middleware(app)
+        return
+
     http_middleware.logger_middleware03(app)
     http_middleware.metrics_middleware02(app)
     http_middleware.trace_middleware01(app)
 
 
+def include_lifecycle(
+        app: FastAPI,
+        background_services: list[interface.IBackgroundService]
+):
+    for service in background_services:
+        app.add_event_handler("startup", service.start)
+
+    # Останавливаем в обратном порядке: сначала то, что запускалось последним
+    for service in reversed(background_services):
+        app.add_event_handler("shutdown", service.stop)
+
+
 def include_tg_webhook(
         app: FastAPI,
         tg_webhook_controller: interface.ITelegramWebhookController,
@@ -72,21 +94,81 @@ def include_release_handlers(
         description="Обновляет статус существующего релиза"
     )
 
+    app.add_api_route(
+        prefix + "/release/{release_id:int}",
+        release_controller.get_release,
+        methods=["GET"],
+        summary="Получить релиз",
+        description="Возвращает релиз по id; поддерживает If-None-Match"
+    )
+
+    app.add_api_route(
+        prefix + "/releases",
+        release_controller.get_releases,
+        methods=["GET"],
+        summary="Список релизов",
+        description="Страница релизов по корзине статусов и сервису; поддерживает If-None-Match"
+    )
+
+    app.add_api_route(
+        prefix + "/release/batch",
+        release_controller.update_releases,
+        methods=["PATCH"],
+        summary="Пакетно обновить релизы",
+        description="Применяет список обновлений релизов одной транзакцией и возвращает результат по каждому; пакет больше RELEASE_BATCH_MAX_SIZE отклоняется с 413"
+    )
+
+
+def include_release_stream_handlers(
+        app: FastAPI,
+        release_stream_controller: interface.IReleaseStreamController,
+        prefix: str
+):
+    app.add_api_route(
+        prefix + "/release/events",
+        release_stream_controller.stream_releases,
+        methods=["GET"],
+        summary="Поток событий релизов",
+        description="Server-Sent Events с изменениями релизов, фильтр по сервису или id релиза"
+    )
+
 
-def include_db_handler(app: FastAPI, db: interface.IDB, prefix):
-    app.add_api_route(prefix + "/table/create", create_table_handler(db), methods=["GET"])
-    app.add_api_route(prefix + "/table/drop", drop_table_handler(db), methods=["GET"])
+def include_migration_handlers(
+        app: FastAPI,
+        migration_manager: interface.IMigrationManager,
+        prefix: str
+):
+    app.add_api_route(
+        prefix + "/migration/up",
+        migration_up_handler(migration_manager),
+        methods=["POST"],
+        summary="Применить миграции",
+        description="Применяет все непримененные миграции до указанной версии включительно"
+    )
+    # Откат удаляет данные, поэтому по HTTP не публикуется: только internal/migration/run.py --command down
+    app.add_api_route(
+        prefix + "/migration/explain",
+        migration_explain_handler(migration_manager),
+        methods=["GET"],
+        summary="Планы горячих запросов",
+        description="Возвращает EXPLAIN для запросов списков релизов"
+    )
     app.add_api_route(prefix + "/health", heath_check_handler(), methods=["GET"])
 
 
-def create_table_handler(db: interface.IDB):
-    async def create_table():
-        try:
-            await db.multi_query(model.create_queries)
-        except Exception as err:
-            raise err
+def migration_up_handler(migration_manager: interface.IMigrationManager):
+    async def migration_up(version: str = None):
+        applied = await migration_manager.up(version)
+        return {"applied": applied}
+
+    return migration_up
+
 
-    return create_table
+def migration_explain_handler(migration_manager: interface.IMigrationManager):
+    async def migration_explain(analyze: bool = False):
+        return await migration_manager.explain(analyze)
+
+    return migration_explain
 
 
 def heath_check_handler():
@@ -94,13 +176,3 @@ def heath_check_handler():
         return "ok"
 
     return heath_check
-
-
-def drop_table_handler(db: interface.IDB):
-    async def delete_table():
-        try:
-            await db.multi_query(model.drop_queries)
-        except Exception as err:
-            raise err
-
-    return delete_table
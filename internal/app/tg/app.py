@@ -7,16 +7,28 @@ from internal import interface
 
 def NewTg(
         dp: Dispatcher,
+        tg_middleware: interface.ITelegramMiddleware,
+        combined_tg_middleware: bool,
         command_controller: interface.ICommandController,
+        inline_query_controller: interface.IInlineQueryController,
         main_menu_dialog: interface.IMainMenuDialog,
         active_release_dialog: interface.IActiveReleaseDialog,
         successful_releases_dialog: interface.ISuccessfulReleasesDialog,
         failed_releases_dialog: interface.IFailedReleasesDialog,
 ) -> BgManagerFactory:
+    include_tg_middleware(
+        dp,
+        tg_middleware,
+        combined_tg_middleware
+    )
     include_command_handlers(
         dp,
         command_controller
     )
+    include_inline_handlers(
+        dp,
+        inline_query_controller
+    )
     dialog_bg_factory = include_dialogs(
         dp,
         main_menu_dialog,
@@ -31,7 +43,12 @@ def NewTg(
 def include_tg_middleware(
         dp: Dispatcher,
         tg_middleware: interface.ITelegramMiddleware,
+        combined: bool,
 ):
+    if combined:
+        dp.update.middleware(tg_middleware.update_middleware)
+        return
+
     dp.update.middleware(tg_middleware.trace_middleware01)
     dp.update.middleware(tg_middleware.metric_middleware02)
     dp.update.middleware(tg_middleware.logger_middleware03)
@@ -47,6 +64,13 @@ def include_command_handlers(
     )
 
 
+def include_inline_handlers(
+        dp: Dispatcher,
+        inline_query_controller: interface.IInlineQueryController,
+):
+    dp.inline_query.register(inline_query_controller.search_handler)
+
+
 def include_dialogs(
         dp: Dispatcher,
         main_menu_dialog: interface.IMainMenuDialog,
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, TextIO
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import TelegramObject, Update
+
+from internal import interface
+
+
+async def RunPolling(
+        dp: Dispatcher,
+        bot: Bot,
+        background_services: list[interface.IBackgroundService],
+        delete_webhook: bool = False,
+        record_path: str = None,
+):
+    """Запускает тот же Dispatcher через long polling вместо вебхука"""
+    record_file = include_update_recorder(dp, record_path) if record_path else None
+
+    try:
+        if delete_webhook:
+            await bot.delete_webhook(drop_pending_updates=False)
+
+        for service in background_services:
+            await service.start()
+        try:
+            await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+        finally:
+            for service in reversed(background_services):
+                await service.stop()
+    finally:
+        # Закрываем после остановки сервисов: апдейты пишутся до последнего обработанного
+        if record_file is not None:
+            record_file.close()
+
+
+async def RunReplay(
+        process_update: Callable[[dict], Awaitable[Any]],
+        path: str,
+        logger: interface.IOtelLogger,
+        background_services: list[interface.IBackgroundService],
+        update_scheduler: interface.IUpdateScheduler = None,
+) -> dict:
+    """Прогоняет записанные апдейты через обработку без HTTP-сервера и считает пропускную способность.
+
+    Файл - JSON Lines, по одному апдейту Telegram в строке. С планировщиком апдейты
+    раскладываются по полосам, как в режиме вебхука, без него обрабатываются последовательно.
+    """
+    with open(path, encoding="utf-8") as file:
+        updates = [json.loads(line) for line in file if line.strip()]
+
+    for service in background_services:
+        await service.start()
+    if update_scheduler is not None:
+        await update_scheduler.start()
+
+    start_time = time.perf_counter()
+    try:
+        if update_scheduler is not None:
+            for update in updates:
+                await update_scheduler.put(update)
+            # stop дожидается разбора всех полос
+            await update_scheduler.stop()
+        else:
+            for update in updates:
+                await process_update(update)
+    finally:
+        elapsed = time.perf_counter() - start_time
+        for service in reversed(background_services):
+            await service.stop()
+
+    stats = {
+        "updates": len(updates),
+        "elapsed_seconds": round(elapsed, 3),
+        "updates_per_second": round(len(updates) / elapsed, 1) if elapsed else 0,
+    }
+    logger.info(f"Воспроизведено апдейтов: {stats['updates']} за {stats['elapsed_seconds']}с", stats)
+    return stats
+
+
+def include_update_recorder(dp: Dispatcher, record_path: str) -> TextIO:
+    # Файл закрывает вызывающий код, когда Dispatcher остановлен
+    file = open(record_path, "a", encoding="utf-8")
+
+    async def record_update(
+            handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+            event: Update,
+            data: dict[str, Any]
+    ):
+        file.write(event.model_dump_json(exclude_none=True) + "\n")
+        file.flush()
+        return await handler(event, data)
+
+    dp.update.outer_middleware(record_update)
+    return file
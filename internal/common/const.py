@@ -39,9 +39,40 @@ OK_JOIN_CHAT_TOTAL_METRIC = "telegram.server.ok.join_chat.total"
 ERROR_JOIN_CHAT_TOTAL_METRIC = "telegram.server.error.join_chat.total"
 MESSAGE_DURATION_METRIC = "telegram.server.message.duration"
 ACTIVE_MESSAGES_METRIC = "telegram.server.active_messages"
+TELEGRAM_UPDATE_QUEUE_DEPTH_METRIC = "telegram.update.queue.depth"
+TELEGRAM_UPDATE_QUEUE_LAG_METRIC = "telegram.update.queue.lag"
+TELEGRAM_UPDATE_QUEUE_OVERFLOW_METRIC = "telegram.update.queue.overflow.total"
+TELEGRAM_UPDATE_LANE_KEY = "telegram.update.lane"
+TELEGRAM_UPDATE_DUPLICATE_METRIC = "telegram.update.duplicate.total"
+TELEGRAM_UPDATE_DEDUP_SOURCE_KEY = "telegram.update.dedup.source"
+TELEGRAM_OUTBOUND_WAIT_METRIC = "telegram.outbound.wait"
+TELEGRAM_OUTBOUND_RETRY_AFTER_METRIC = "telegram.outbound.retry_after.total"
+TELEGRAM_OUTBOUND_PRIORITY_KEY = "telegram.outbound.priority"
 
 TRACE_ID_HEADER = "X-Trace-ID"
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
 SPAN_ID_HEADER = "X-Span-ID"
 
 MAX_FILE_SIZE = 50 * 1024 * 1024
 MAX_TEXT_SIZE = 1024
+
+DIALOG_DATA_SIZE_METRIC = "telegram.dialog.data.size"
+
+FSM_CACHE_HIT_METRIC = "telegram.fsm.cache.hit.total"
+FSM_CACHE_MISS_METRIC = "telegram.fsm.cache.miss.total"
+FSM_CACHE_SKIPPED_WRITE_METRIC = "telegram.fsm.cache.skipped_write.total"
+FSM_DESTINY_KEY = "telegram.fsm.destiny"
+FSM_KEYS_METRIC = "telegram.fsm.keys"
+FSM_KEY_KIND_KEY = "telegram.fsm.key.kind"
+FSM_REDIS_INSTANCE_MEMORY_METRIC = "telegram.fsm.redis.instance.memory"
+FSM_ORPHAN_DELETED_METRIC = "telegram.fsm.orphan.deleted.total"
+
+RELEASE_CACHE_HIT_METRIC = "release.cache.hit.total"
+RELEASE_CACHE_MISS_METRIC = "release.cache.miss.total"
+RELEASE_CACHE_BUCKET_KEY = "release.cache.bucket"
+
+RELEASE_CHANGES_CHANNEL = "release_changes"
+
+RELEASE_STREAM_SUBSCRIBERS_METRIC = "release.stream.subscribers"
+RELEASE_STREAM_DROPPED_METRIC = "release.stream.dropped.total"
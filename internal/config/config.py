@@ -12,6 +12,8 @@ class Config:
         self.prefix = os.getenv("LOOM_RELEASE_TG_BOT_PREFIX", "/api/tg-bot")
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.release_tg_bot_token: str = os.environ.get('LOOM_RELEASE_TG_BOT_TOKEN')
+        # Пустое значение - официальный api.telegram.org, иначе локальный Bot API сервер или заглушка
+        self.tg_bot_api_url: str = os.getenv("TG_BOT_API_URL", "")
         self.github_token: str = os.environ.get("LOOM_GITHUB_TOKEN")
         self.prod_host: str = os.environ.get("PROD_HOST")
         self.prod_password: str = os.environ.get("PROD_PASSWORD")
@@ -48,6 +50,67 @@ class Config:
         self.db_user = os.getenv("LOOM_RELEASE_TG_BOT_POSTGRES_USER", "postgres")
         self.db_pass = os.getenv("LOOM_RELEASE_TG_BOT_POSTGRES_PASSWORD", "password")
 
+        # Обработка апдейтов Telegram: быстрый ответ вебхуку и очередь с воркерами
+        self.tg_webhook_async = os.getenv("TG_WEBHOOK_ASYNC", "true").lower() == "true"
+        # Число упорядоченных полос: апдейты одного чата всегда идут в одну полосу
+        self.tg_update_lanes = int(os.getenv("TG_UPDATE_LANES", "8"))
+        self.tg_update_queue_size = int(os.getenv("TG_UPDATE_QUEUE_SIZE", "1000"))
+        self.tg_update_drain_timeout = float(os.getenv("TG_UPDATE_DRAIN_TIMEOUT", "30"))
+
+        # combined - один проход трассировки, метрик и логов, chain - три отдельных middleware
+        self.tg_middleware_mode = os.getenv("TG_MIDDLEWARE_MODE", "combined")
+        # combined - один ASGI middleware на запрос, chain - три middleware FastAPI
+        self.http_middleware_mode = os.getenv("HTTP_MIDDLEWARE_MODE", "combined")
+        self.tg_update_dedup_ttl = int(os.getenv("TG_UPDATE_DEDUP_TTL", "86400"))
+
+        # Лимиты исходящих запросов к Bot API, сообщений в секунду
+        self.tg_global_rate = float(os.getenv("TG_GLOBAL_RATE", "30"))
+        self.tg_chat_rate = float(os.getenv("TG_CHAT_RATE", "1"))
+        self.tg_group_chat_rate = float(os.getenv("TG_GROUP_CHAT_RATE", str(20 / 60)))
+
+        # Статусы, при переходе в которые подтверждающие получают уведомление
+        self.notify_release_statuses = [
+            status.strip()
+            for status in os.getenv("NOTIFY_RELEASE_STATUSES", "manual_testing").split(",")
+            if status.strip()
+        ]
+
+        # Открытые карточки релизов перерисовываются не чаще раза в интервал, секунд
+        self.live_card_update_interval = float(os.getenv("LIVE_CARD_UPDATE_INTERVAL", "2"))
+        self.live_card_ttl = float(os.getenv("LIVE_CARD_TTL", "1800"))
+
+        # Поиск релизов в inline-режиме
+        self.tg_inline_page_size = int(os.getenv("TG_INLINE_PAGE_SIZE", "20"))
+        self.tg_inline_cache_time = int(os.getenv("TG_INLINE_CACHE_TIME", "10"))
+
+        # Кеш FSM-хранилища: off, affinity (апдейты чата всегда в одном процессе) или versioned
+        self.fsm_cache_mode = os.getenv("FSM_CACHE_MODE", "versioned")
+        self.fsm_cache_size = int(os.getenv("FSM_CACHE_SIZE", "10000"))
+        self.fsm_cache_ttl = float(os.getenv("FSM_CACHE_TTL", "600"))
+
+        # Время жизни ключей FSM-хранилища в секундах (0 - без ограничения) и период очистки брошенных диалогов
+        self.fsm_state_ttl = int(os.getenv("FSM_STATE_TTL", str(30 * 24 * 3600)))
+        self.fsm_data_ttl = int(os.getenv("FSM_DATA_TTL", str(30 * 24 * 3600)))
+        self.fsm_sweep_interval = float(os.getenv("FSM_SWEEP_INTERVAL", "3600"))
+
+        # Формат data в FSM-хранилище: json или msgpack, сжатие zstd значений от порога в байтах (0 - без сжатия)
+        self.fsm_serializer = os.getenv("FSM_SERIALIZER", "json")
+        self.fsm_compress_threshold = int(os.getenv("FSM_COMPRESS_THRESHOLD", "0"))
+
+        # Сколько секунд ответ на POST /release хранится по Idempotency-Key
+        self.release_idempotency_ttl = int(os.getenv("RELEASE_IDEMPOTENCY_TTL", "3600"))
+
+        # Сколько релизов принимает PATCH /release/batch за раз: весь пакет держит блокировки строк одним UPDATE
+        self.release_batch_max_size = int(os.getenv("RELEASE_BATCH_MAX_SIZE", "100"))
+
+        # Поток событий релизов: длина очереди подписчика и период heartbeat в секундах
+        self.release_stream_queue_size = int(os.getenv("RELEASE_STREAM_QUEUE_SIZE", "100"))
+        self.release_stream_heartbeat = float(os.getenv("RELEASE_STREAM_HEARTBEAT", "15"))
+
+        # Кеш релизов в памяти процесса
+        self.release_cache_ttl = float(os.getenv("RELEASE_CACHE_TTL", "30"))
+        self.release_cache_size = int(os.getenv("RELEASE_CACHE_SIZE", "1024"))
+
         # Настройки телеметрии
         self.alert_tg_bot_token = os.getenv("LOOM_ALERT_TG_BOT_TOKEN", "")
         self.alert_tg_chat_id = 5667467611
@@ -1,7 +1,11 @@
-from fastapi.responses import JSONResponse
+import hashlib
+from typing import Annotated
+
+from fastapi import Header, Query
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface
+from internal import interface, model, common
 from internal.controller.http.handler.release.model import CreateReleaseBody, UpdateReleaseBody
 
 
@@ -9,13 +13,23 @@ class ReleaseController(interface.IReleaseController):
     def __init__(
             self,
             tel: interface.ITelemetry,
-            release_service: interface.IReleaseService
+            release_service: interface.IReleaseService,
+            redis: interface.IRedis,
+            idempotency_ttl: int,
+            batch_max_size: int,
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_service = release_service
+        self.redis = redis
+        self.idempotency_ttl = idempotency_ttl
+        self.batch_max_size = batch_max_size
 
-    async def create_release(self, body: CreateReleaseBody) -> JSONResponse:
+    async def create_release(
+            self,
+            body: CreateReleaseBody,
+            idempotency_key: Annotated[str | None, Header()] = None
+    ) -> JSONResponse:
         with self.tracer.start_as_current_span(
                 "ReleaseController.create_release",
                 kind=SpanKind.INTERNAL,
@@ -29,6 +43,15 @@ class ReleaseController(interface.IReleaseController):
             try:
                 self.logger.info(f"Получен запрос на создание релиза для сервиса {body.service_name}")
 
+                # Повтор запроса с тем же ключом отвечаем из Redis, не доходя до базы
+                fingerprint = f"{body.service_name}:{body.github_run_id}"
+                if idempotency_key:
+                    cached = await self.redis.get(self._idempotency_key(idempotency_key))
+                    if cached is not None:
+                        span.set_attribute("idempotent_replay", True)
+                        span.set_status(Status(StatusCode.OK))
+                        return self._replay_response(cached, fingerprint)
+
                 release_id = await self.release_service.create_release(
                     service_name=body.service_name,
                     release_tag=body.release_tag,
@@ -40,6 +63,13 @@ class ReleaseController(interface.IReleaseController):
 
                 self.logger.info(f"Релиз успешно создан с ID {release_id}")
 
+                if idempotency_key:
+                    await self.redis.set(
+                        self._idempotency_key(idempotency_key),
+                        {"release_id": release_id, "fingerprint": fingerprint},
+                        self.idempotency_ttl
+                    )
+
                 span.set_status(Status(StatusCode.OK))
                 return JSONResponse(
                     status_code=201,
@@ -82,4 +112,167 @@ class ReleaseController(interface.IReleaseController):
             except Exception as err:
                 span.record_exception(err)
                 span.set_status(Status(StatusCode.ERROR, str(err)))
-                raise
\ No newline at end of file
+                raise
+
+    async def update_releases(self, body: list[UpdateReleaseBody]) -> JSONResponse:
+        with self.tracer.start_as_current_span(
+                "ReleaseController.update_releases",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "updates": len(body),
+                }
+        ) as span:
+            try:
+                self.logger.info(f"Получен запрос на пакетное обновление {len(body)} релизов")
+
+                if len(body) > self.batch_max_size:
+                    span.set_status(Status(StatusCode.OK))
+                    return JSONResponse(
+                        status_code=413,
+                        content={"error": f"batch is too large, max {self.batch_max_size} releases"},
+                    )
+
+                events = await self.release_service.update_releases([
+                    model.ReleaseUpdate(
+                        release_id=item.release_id,
+                        status=item.status,
+                        github_run_id=item.github_run_id,
+                        github_action_link=item.github_action_link,
+                    )
+                    for item in body
+                ])
+
+                statuses = {event.release_id: event.status for event in events}
+                results = [
+                    {
+                        "release_id": item.release_id,
+                        "updated": item.release_id in statuses,
+                        "status": statuses[item.release_id].value if item.release_id in statuses else None,
+                    }
+                    for item in body
+                ]
+
+                self.logger.info(f"Пакетно обновлено релизов: {len(statuses)} из {len(body)}")
+
+                span.set_status(Status(StatusCode.OK))
+                return JSONResponse(
+                    status_code=200,
+                    content={"results": results},
+                )
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise
+
+    async def get_release(
+            self,
+            release_id: int,
+            if_none_match: Annotated[str | None, Header()] = None
+    ) -> Response:
+        with self.tracer.start_as_current_span(
+                "ReleaseController.get_release",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                }
+        ) as span:
+            try:
+                release = await self.release_service.find_release(release_id)
+                if release is None:
+                    span.set_status(Status(StatusCode.OK))
+                    return ORJSONResponse(status_code=404, content={"error": "release not found"})
+
+                etag = f'"{release.id}-{release.version}"'
+                if self._etag_matches(if_none_match, etag):
+                    span.set_attribute("not_modified", True)
+                    span.set_status(Status(StatusCode.OK))
+                    return Response(status_code=304, headers={"ETag": etag})
+
+                span.set_status(Status(StatusCode.OK))
+                return ORJSONResponse(content=release.to_dict(), headers={"ETag": etag})
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise
+
+    async def get_releases(
+            self,
+            bucket: model.ReleaseBucket,
+            service: str = None,
+            cursor: str = None,
+            limit: Annotated[int, Query(ge=1, le=100)] = 20,
+            if_none_match: Annotated[str | None, Header()] = None
+    ) -> Response:
+        with self.tracer.start_as_current_span(
+                "ReleaseController.get_releases",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "bucket": bucket.value,
+                    "service": service or "",
+                }
+        ) as span:
+            try:
+                try:
+                    page_cursor = model.ReleaseCursor.decode(cursor) if cursor else None
+                except ValueError:
+                    span.set_status(Status(StatusCode.OK))
+                    return ORJSONResponse(status_code=400, content={"error": "invalid cursor"})
+
+                releases = await self.release_service.get_releases_page(bucket, limit, page_cursor, service)
+
+                # Страница не изменилась, пока не изменились ее строки: ETag строится из пар (id, version)
+                # и параметров запроса, без сериализации тела
+                fingerprint = hashlib.sha256()
+                fingerprint.update(f"{bucket.value}|{service}|{cursor}|{limit}".encode())
+                for release in releases:
+                    fingerprint.update(f"|{release.id}:{release.version}".encode())
+                etag = f'"{fingerprint.hexdigest()[:32]}"'
+
+                if self._etag_matches(if_none_match, etag):
+                    span.set_attribute("not_modified", True)
+                    span.set_status(Status(StatusCode.OK))
+                    return Response(status_code=304, headers={"ETag": etag})
+
+                next_cursor = releases[-1].cursor().encode() if len(releases) == limit else None
+
+                span.set_status(Status(StatusCode.OK))
+                return ORJSONResponse(
+                    content={
+                        "releases": [release.to_dict() for release in releases],
+                        "next_cursor": next_cursor,
+                    },
+                    headers={"ETag": etag},
+                )
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise
+
+    @staticmethod
+    def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match сравнивается слабо: W/"x" совпадает с "x"
+        return any(value.strip().removeprefix("W/") == etag for value in if_none_match.split(","))
+
+    def _replay_response(self, cached: dict, fingerprint: str) -> JSONResponse:
+        if cached.get("fingerprint") != fingerprint:
+            return JSONResponse(
+                status_code=422,
+                content={"error": f"{common.IDEMPOTENCY_KEY_HEADER} уже использован для другого релиза"},
+            )
+
+        return JSONResponse(
+            status_code=201,
+            content={"release_id": cached["release_id"]},
+            headers={common.IDEMPOTENT_REPLAYED_HEADER: "true"},
+        )
+
+    @staticmethod
+    def _idempotency_key(idempotency_key: str) -> str:
+        return f"release_idempotency:{idempotency_key}"
@@ -0,0 +1,43 @@
+from fastapi.responses import StreamingResponse
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface
+
+
+class ReleaseStreamController(interface.IReleaseStreamController):
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            release_event_hub: interface.IReleaseEventHub,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.release_event_hub = release_event_hub
+
+    async def stream_releases(self, service: str = None, release_id: int = None) -> StreamingResponse:
+        with self.tracer.start_as_current_span(
+                "ReleaseStreamController.stream_releases",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "service": service or "",
+                    "release_id": release_id or 0,
+                }
+        ) as span:
+            try:
+                self.logger.info(f"Открыт поток событий релизов: сервис {service}, релиз {release_id}")
+
+                span.set_status(Status(StatusCode.OK))
+                return StreamingResponse(
+                    self.release_event_hub.stream(service, release_id),
+                    media_type="text/event-stream",
+                    headers={
+                        "Cache-Control": "no-cache",
+                        # Иначе nginx буферизует поток и события приходят пачками
+                        "X-Accel-Buffering": "no",
+                    },
+                )
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
@@ -3,6 +3,7 @@ import traceback
 from typing import Callable
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from opentelemetry import propagate
 from opentelemetry.semconv.trace import SpanAttributes
@@ -23,6 +24,10 @@ class HttpMiddleware(interface.IHttpMiddleware):
         self.logger = tel.logger()
         self.prefix = prefix
 
+    def asgi_middleware(self, app: FastAPI):
+        """Трассировка, метрики и логи за один проход на уровне ASGI, без буферизации ответа"""
+        app.add_middleware(AsgiHttpMiddleware, http_middleware=self)
+
     def trace_middleware01(self, app: FastAPI):
         @app.middleware("http")
         async def _trace_middleware01(request: Request, call_next: Callable):
@@ -247,3 +252,169 @@ class HttpMiddleware(interface.IHttpMiddleware):
                     raise err
 
         return _logger_middleware03
+
+
+class AsgiHttpMiddleware:
+    def __init__(self, app: ASGIApp, http_middleware: HttpMiddleware):
+        self.app = app
+        self.tracer = http_middleware.tracer
+        self.logger = http_middleware.logger
+        self.prefix = http_middleware.prefix
+
+        meter = http_middleware.meter
+        self.ok_request_counter = meter.create_counter(
+            name=common.OK_REQUEST_TOTAL_METRIC,
+            description="Total count of 200 HTTP requests",
+            unit="1"
+        )
+        self.error_request_counter = meter.create_counter(
+            name=common.ERROR_REQUEST_TOTAL_METRIC,
+            description="Total count of 500 HTTP requests",
+            unit="1"
+        )
+        self.request_duration = meter.create_histogram(
+            name=common.REQUEST_DURATION_METRIC,
+            description="HTTP request duration in seconds",
+            unit="s"
+        )
+        self.request_size = meter.create_histogram(
+            name=common.REQUEST_BODY_SIZE_METRIC,
+            description="HTTP request size in bytes",
+            unit="by"
+        )
+        self.response_size = meter.create_histogram(
+            name=common.RESPONSE_BODY_SIZE_METRIC,
+            description="HTTP response size in bytes",
+            unit="by"
+        )
+        self.active_requests = meter.create_up_down_counter(
+            name=common.ACTIVE_REQUESTS_METRIC,
+            description="Number of active HTTP requests",
+            unit="1"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        if self.prefix not in path:
+            await JSONResponse(status_code=404, content={"error": "not found"})(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+
+        with self.tracer.start_as_current_span(
+                f"{method} {path}",
+                context=propagate.extract(headers),
+                kind=SpanKind.SERVER,
+                attributes={
+                    SpanAttributes.HTTP_ROUTE: path,
+                    SpanAttributes.HTTP_METHOD: method,
+                }
+        ) as root_span:
+            span_ctx = root_span.get_span_context()
+            trace_id = format(span_ctx.trace_id, '032x')
+            span_id = format(span_ctx.span_id, '016x')
+
+            # request.state читает scope["state"]: обработчики видят те же trace_id и span_id
+            state = scope.setdefault("state", {})
+            state["trace_id"] = trace_id
+            state["span_id"] = span_id
+
+            # Без id трассировки и длительности: они уникальны для каждого запроса
+            # и плодили бы по временному ряду на запрос
+            metric_attributes = {
+                SpanAttributes.HTTP_METHOD: method,
+                SpanAttributes.HTTP_ROUTE: path,
+            }
+            extra_log = {
+                common.HTTP_METHOD_KEY: method,
+                common.HTTP_ROUTE_KEY: path,
+                common.TRACE_ID_KEY: trace_id,
+                common.SPAN_ID_KEY: span_id,
+            }
+            trace_headers = [
+                (common.TRACE_ID_HEADER.lower().encode("latin-1"), trace_id.encode("latin-1")),
+                (common.SPAN_ID_HEADER.lower().encode("latin-1"), span_id.encode("latin-1")),
+            ]
+
+            content_length = headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > 0:
+                self.request_size.record(int(content_length), attributes=metric_attributes)
+
+            response = {"status": 500, "size": 0, "started": False}
+
+            async def send_with_telemetry(message: Message):
+                if message["type"] == "http.response.start":
+                    response["status"] = message["status"]
+                    response["started"] = True
+                    message = {**message, "headers": [*message.get("headers", []), *trace_headers]}
+                elif message["type"] == "http.response.body":
+                    response["size"] += len(message.get("body", b""))
+                await send(message)
+
+            start_time = time.perf_counter()
+            self.active_requests.add(1)
+            try:
+                self.logger.info("Началась обработка HTTP запроса", extra_log)
+                await self.app(scope, receive, send_with_telemetry)
+
+                duration_seconds = time.perf_counter() - start_time
+                status_code = response["status"]
+                attributes = {**metric_attributes, common.HTTP_STATUS_KEY: status_code}
+
+                self.request_duration.record(duration_seconds, attributes=attributes)
+                self.response_size.record(response["size"], attributes=attributes)
+                root_span.set_attributes({
+                    SpanAttributes.HTTP_STATUS_CODE: status_code,
+                    SpanAttributes.HTTP_RESPONSE_BODY_SIZE: response["size"],
+                })
+
+                extra_log[common.HTTP_REQUEST_DURATION_KEY] = duration_seconds
+                extra_log[common.HTTP_STATUS_KEY] = status_code
+
+                if status_code >= 500:
+                    self.error_request_counter.add(1, attributes=attributes)
+                    root_span.set_status(Status(StatusCode.ERROR, "Internal server error"))
+                    root_span.set_attribute(common.ERROR_KEY, True)
+                    self.logger.error("Обработка HTTP запроса завершена с ошибкой", extra_log)
+                elif status_code >= 400:
+                    self.ok_request_counter.add(1, attributes=attributes)
+                    root_span.set_status(Status(StatusCode.ERROR, "Client error"))
+                    root_span.set_attribute(common.ERROR_KEY, True)
+                    self.logger.warning("Обработка HTTP запроса завершена с ошибкой клиента", extra_log)
+                else:
+                    self.ok_request_counter.add(1, attributes=attributes)
+                    root_span.set_status(Status(StatusCode.OK))
+                    self.logger.info("Обработка HTTP запроса завершена успешно", extra_log)
+
+            except Exception as err:
+                duration_seconds = time.perf_counter() - start_time
+                attributes = {**metric_attributes, common.HTTP_STATUS_KEY: 500}
+
+                self.error_request_counter.add(1, attributes=attributes)
+                self.request_duration.record(duration_seconds, attributes=attributes)
+
+                extra_log[common.HTTP_REQUEST_DURATION_KEY] = duration_seconds
+                extra_log[common.HTTP_STATUS_KEY] = 500
+                extra_log[common.ERROR_KEY] = str(err)
+                extra_log[common.TRACEBACK_KEY] = traceback.format_exc()
+                self.logger.error("Обработка HTTP запроса завершена с ошибкой", extra_log)
+
+                root_span.record_exception(err)
+                root_span.set_status(Status(StatusCode.ERROR, str(err)))
+                root_span.set_attribute(common.ERROR_KEY, True)
+
+                # Если заголовки ответа уже ушли клиенту, заменить ответ нельзя
+                if response["started"]:
+                    raise err
+                await JSONResponse(
+                    status_code=500,
+                    content={"message": "Internal Server Error"},
+                    headers={common.TRACE_ID_HEADER: trace_id, common.SPAN_ID_HEADER: span_id},
+                )(scope, receive, send)
+            finally:
+                self.active_requests.add(-1)
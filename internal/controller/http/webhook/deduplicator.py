@@ -0,0 +1,60 @@
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, common
+from pkg.cache.lru import TTLCache
+
+
+class UpdateDeduplicator(interface.IUpdateDeduplicator):
+    """Отсекает повторные доставки одного update_id.
+
+    Локальный LRU отвечает без сетевого запроса для повторов на этой же реплике,
+    SET NX в Redis — для повторов, пришедших на другую реплику.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            redis: interface.IRedis,
+            ttl: int,
+            local_size: int = 10000,
+            key_prefix: str = "tg_update:",
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.seen = TTLCache(local_size, ttl)
+
+        self.duplicate_counter = tel.meter().create_counter(
+            name=common.TELEGRAM_UPDATE_DUPLICATE_METRIC,
+            description="Redelivered Telegram updates dropped before processing",
+            unit="1"
+        )
+
+    async def is_duplicate(self, update_id: int) -> bool:
+        if update_id in self.seen:
+            self.duplicate_counter.add(1, {common.TELEGRAM_UPDATE_DEDUP_SOURCE_KEY: "local"})
+            return True
+        self.seen.set(update_id, True)
+
+        with self.tracer.start_as_current_span(
+                "UpdateDeduplicator.is_duplicate",
+                kind=SpanKind.INTERNAL,
+                attributes={"update_id": update_id}
+        ) as span:
+            try:
+                first_delivery = await self.redis.set_nx(f"{self.key_prefix}{update_id}", 1, self.ttl)
+
+                span.set_status(Status(StatusCode.OK))
+                if not first_delivery:
+                    self.duplicate_counter.add(1, {common.TELEGRAM_UPDATE_DEDUP_SOURCE_KEY: "redis"})
+                    return True
+                return False
+
+            except Exception as err:
+                # Redis недоступен - лучше обработать апдейт еще раз, чем потерять его
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                self.logger.warning(f"Не удалось проверить повтор апдейта {update_id}: {err}")
+                return False
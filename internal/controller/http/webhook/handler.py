@@ -17,6 +17,8 @@ class TelegramWebhookController(interface.ITelegramWebhookController):
             bot: Bot,
             domain: str,
             prefix: str,
+            update_scheduler: interface.IUpdateScheduler = None,
+            update_deduplicator: interface.IUpdateDeduplicator = None,
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
@@ -27,6 +29,13 @@ class TelegramWebhookController(interface.ITelegramWebhookController):
         self.domain = domain
         self.prefix = prefix
 
+        # Без планировщика апдейты обрабатываются прямо в запросе вебхука
+        self.update_scheduler = update_scheduler
+        if self.update_scheduler is not None:
+            self.update_scheduler.set_handler(self.process_update)
+
+        self.update_deduplicator = update_deduplicator
+
     async def bot_webhook(
             self,
             update: dict,
@@ -39,6 +48,25 @@ class TelegramWebhookController(interface.ITelegramWebhookController):
             if x_telegram_bot_api_secret_token != "secret":
                 return {"status": "error", "message": "Wrong secret token !"}
 
+            # Повторная доставка того же update_id: подтверждаем, но не обрабатываем
+            if self.update_deduplicator is not None and await self.update_deduplicator.is_duplicate(update["update_id"]):
+                span.set_attribute("telegram.update.duplicate", True)
+                span.set_status(Status(StatusCode.OK))
+                return None
+
+            if self.update_scheduler is not None and await self.update_scheduler.put(update):
+                span.set_status(Status(StatusCode.OK))
+                return None
+
+            await self.process_update(update)
+            span.set_status(Status(StatusCode.OK))
+            return None
+
+    async def process_update(self, update: dict):
+        with self.tracer.start_as_current_span(
+                "TelegramWebhookController.process_update",
+                kind=SpanKind.INTERNAL
+        ) as span:
             telegram_update = Update(**update)
             try:
                 await self.dp.feed_webhook_update(
@@ -70,7 +98,7 @@ class TelegramWebhookController(interface.ITelegramWebhookController):
                 await self.bot.set_webhook(
                     f'https://{self.domain}{self.prefix}/update',
                     secret_token='secret',
-                    allowed_updates=["message", "callback_query"],
+                    allowed_updates=["message", "callback_query", "inline_query"],
                 )
                 webhook_info = await self.bot.get_webhook_info()
 
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from opentelemetry import context
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, common
+
+
+class UpdateScheduler(interface.IUpdateScheduler):
+    """Планировщик апдейтов Telegram по упорядоченным полосам.
+
+    Апдейт попадает в полосу по chat_id: внутри одного чата апдейты обрабатываются
+    строго по очереди и не гоняются за одну запись FSM, а разные чаты идут параллельно.
+    Вебхук только кладет апдейт в полосу и сразу отвечает 200.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            lanes: int,
+            queue_size: int,
+            drain_timeout: float,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.drain_timeout = drain_timeout
+
+        # Общий лимит очереди делится между полосами
+        lane_size = max(1, queue_size // lanes)
+        self.lanes: list[asyncio.Queue] = [asyncio.Queue(maxsize=lane_size) for _ in range(lanes)]
+        self.lane_attributes = [{common.TELEGRAM_UPDATE_LANE_KEY: lane} for lane in range(lanes)]
+
+        self.handler: Callable[[dict], Awaitable[None]] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._accepting = False
+
+        meter = tel.meter()
+        self.queue_depth = meter.create_up_down_counter(
+            name=common.TELEGRAM_UPDATE_QUEUE_DEPTH_METRIC,
+            description="Telegram updates waiting in the processing lane",
+            unit="1"
+        )
+        self.queue_lag = meter.create_histogram(
+            name=common.TELEGRAM_UPDATE_QUEUE_LAG_METRIC,
+            description="Time between webhook acknowledgement and start of update processing",
+            unit="s"
+        )
+        self.queue_overflow = meter.create_counter(
+            name=common.TELEGRAM_UPDATE_QUEUE_OVERFLOW_METRIC,
+            description="Telegram updates that waited for space in a full lane",
+            unit="1"
+        )
+
+    def set_handler(self, handler: Callable[[dict], Awaitable[None]]) -> None:
+        self.handler = handler
+
+    async def put(self, update: dict) -> bool:
+        if not self._accepting:
+            return False
+
+        lane = self._lane(update)
+        queue = self.lanes[lane]
+        # Контекст трассировки запроса переносим в воркер, чтобы обработка попала в тот же трейс
+        item = (time.monotonic(), context.get_current(), update)
+
+        if queue.full():
+            # Обработка в обход полосы нарушила бы порядок в чате,
+            # поэтому при переполнении придерживаем ответ вебхуку до освобождения места
+            self.queue_overflow.add(1, self.lane_attributes[lane])
+            await queue.put(item)
+        else:
+            queue.put_nowait(item)
+
+        self.queue_depth.add(1, self.lane_attributes[lane])
+        return True
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+
+        self._accepting = True
+        self._tasks = [asyncio.create_task(self._worker(lane)) for lane in range(len(self.lanes))]
+        self.logger.info(f"Запущено полос обработки апдейтов: {len(self.lanes)}")
+
+    async def stop(self) -> None:
+        # Новые апдейты больше не принимаем и дорабатываем уже поставленные в полосы
+        self._accepting = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self.lanes)),
+                timeout=self.drain_timeout
+            )
+        except asyncio.TimeoutError:
+            left = sum(queue.qsize() for queue in self.lanes)
+            self.logger.warning(f"Полосы апдейтов не разобраны за {self.drain_timeout}с, осталось {left}")
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self, lane: int) -> None:
+        queue = self.lanes[lane]
+        attributes = self.lane_attributes[lane]
+
+        while True:
+            enqueued_at, ctx, update = await queue.get()
+            self.queue_depth.add(-1, attributes)
+            self.queue_lag.record(time.monotonic() - enqueued_at, attributes)
+
+            token = context.attach(ctx)
+            try:
+                with self.tracer.start_as_current_span(
+                        "UpdateScheduler.process",
+                        kind=SpanKind.CONSUMER,
+                        attributes=attributes
+                ) as span:
+                    try:
+                        await self.handler(update)
+                        span.set_status(Status(StatusCode.OK))
+                    except Exception as err:
+                        span.record_exception(err)
+                        span.set_status(Status(StatusCode.ERROR, str(err)))
+                        self.logger.error(f"Ошибка обработки апдейта из полосы {lane}: {err}")
+            finally:
+                context.detach(token)
+                queue.task_done()
+
+    def _lane(self, update: dict) -> int:
+        return hash(self._get_chat_id(update)) % len(self.lanes)
+
+    @staticmethod
+    def _get_chat_id(update: dict) -> int:
+        # Тот же порядок, что и в TelegramWebhookController._get_chat_id, но по сырому апдейту
+        message = update.get("message")
+        if message:
+            return message["chat"]["id"]
+
+        callback_query = update.get("callback_query")
+        if callback_query:
+            if callback_query.get("message"):
+                return callback_query["message"]["chat"]["id"]
+            return callback_query["from"]["id"]
+
+        inline_query = update.get("inline_query")
+        if inline_query:
+            return inline_query["from"]["id"]
+
+        # Апдейты без чата раскладываем по update_id
+        return update.get("update_id", 0)
@@ -12,9 +12,11 @@ class CommandController(interface.ICommandController):
     def __init__(
             self,
             tel: interface.ITelemetry,
+            tg_user_repo: interface.ITgUserRepo,
     ):
         self.logger = tel.logger()
         self.tracer = tel.tracer()
+        self.tg_user_repo = tg_user_repo
 
     async def start_handler(
             self,
@@ -26,6 +28,10 @@ class CommandController(interface.ICommandController):
                 kind=SpanKind.INTERNAL
         ) as span):
             try:
+                # Запоминаем чат, чтобы присылать уведомления о релизах по username
+                if message.from_user.username:
+                    await self.tg_user_repo.save_chat_id(message.from_user.username, message.chat.id)
+
                 await dialog_manager.reset_stack()
 
                 await dialog_manager.start(model.MainMenuStates.main_menu)
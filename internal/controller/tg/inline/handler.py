@@ -0,0 +1,114 @@
+from aiogram.types import InlineQuery, InlineQueryResultArticle, InputTextMessageContent
+from opentelemetry.trace import SpanKind, StatusCode
+
+from internal import model, interface
+
+
+class InlineQueryController(interface.IInlineQueryController):
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            release_repo: interface.IReleaseRepo,
+            allowed_users: list[str],
+            page_size: int,
+            cache_time: int,
+    ):
+        self.logger = tel.logger()
+        self.tracer = tel.tracer()
+        self.release_repo = release_repo
+        self.allowed_users = set(allowed_users)
+        self.page_size = page_size
+        self.cache_time = cache_time
+
+    async def search_handler(self, inline_query: InlineQuery):
+        with self.tracer.start_as_current_span(
+                "InlineQueryController.search_handler",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                # Inline-режим доступен в любом чате, поэтому доступ проверяем так же, как в диалогах.
+                # Ответ персональный: иначе Telegram отдаст закешированную выдачу и чужим
+                if inline_query.from_user.username not in self.allowed_users:
+                    await inline_query.answer([], cache_time=self.cache_time, is_personal=True)
+                    span.set_attribute("results", 0)
+                    span.set_status(StatusCode.OK)
+                    return
+
+                query = inline_query.query.strip()
+                # offset - курсор последнего релиза страницы, который мы сами вернули в next_offset
+                cursor = self._decode_offset(inline_query.offset)
+
+                releases = await self.release_repo.search_releases(query, self.page_size, cursor)
+
+                next_offset = ""
+                if len(releases) == self.page_size:
+                    next_offset = releases[-1].cursor().encode()
+                await inline_query.answer(
+                    [self._to_result(release) for release in releases],
+                    cache_time=self.cache_time,
+                    is_personal=True,
+                    next_offset=next_offset,
+                )
+
+                span.set_attribute("results", len(releases))
+                span.set_status(StatusCode.OK)
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise err
+
+    @staticmethod
+    def _decode_offset(offset: str) -> model.ReleaseCursor | None:
+        if not offset:
+            return None
+        try:
+            return model.ReleaseCursor.decode(offset)
+        except ValueError:
+            # Чужой или устаревший offset - начинаем с первой страницы
+            return None
+
+    def _to_result(self, release: model.ReleaseListItem) -> InlineQueryResultArticle:
+        status_text = self._format_status(release.status)
+        created_at = release.created_at.strftime("%d.%m.%Y %H:%M") if release.created_at else "—"
+
+        lines = [
+            f"{release.service_name} {release.release_tag}",
+            f"Статус: {status_text}",
+            f"Инициатор: {release.initiated_by}",
+            f"Создан: {created_at}",
+        ]
+        if release.rollback_to_tag:
+            lines.append(f"Откат на: {release.rollback_to_tag}")
+        if release.github_action_link:
+            lines.append(release.github_action_link)
+
+        return InlineQueryResultArticle(
+            id=str(release.id),
+            title=f"{release.service_name} {release.release_tag}",
+            description=f"{status_text} • {release.initiated_by} • {created_at}",
+            input_message_content=InputTextMessageContent(message_text="\n".join(lines)),
+        )
+
+    def _format_status(self, status: model.ReleaseStatus) -> str:
+        """Форматирует статус релиза с эмодзи"""
+        status_map = {
+            model.ReleaseStatus.INITIATED: "🔵 Инициирован",
+
+            model.ReleaseStatus.STAGE_BUILDING: "🔨 Сборка stage",
+            model.ReleaseStatus.STAGE_BUILDING_FAILED: "❌ Ошибка сборки stage",
+            model.ReleaseStatus.STAGE_TEST_ROLLBACK: "🔄 Тестовый откат на stage",
+            model.ReleaseStatus.STAGE_ROLLBACK_TEST_FAILED: "❌ Ошибка тестового отката",
+
+            model.ReleaseStatus.MANUAL_TESTING: "🧪 Ручное тестирование",
+            model.ReleaseStatus.MANUAL_TEST_PASSED: "✅ Тест пройден",
+            model.ReleaseStatus.MANUAL_TEST_FAILED: "❌ Тест отклонен",
+
+            model.ReleaseStatus.DEPLOYING: "🚀 Деплой",
+            model.ReleaseStatus.DEPLOYED: "✅ Задеплоен",
+            model.ReleaseStatus.PRODUCTION_FAILED: "❌ Ошибка на prod",
+
+            model.ReleaseStatus.ROLLBACK: "⏪ Откат",
+            model.ReleaseStatus.ROLLBACK_FAILED: "❌ Ошибка отката",
+            model.ReleaseStatus.ROLLBACK_DONE: "✅ Успешный откат",
+        }
+        return status_map.get(status, status.value if hasattr(status, 'value') else str(status))
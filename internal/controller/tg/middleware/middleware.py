@@ -10,6 +10,72 @@ from opentelemetry.trace import SpanKind, Status, StatusCode
 from internal import interface, common
 
 
+class UpdateContext:
+    """Метаданные апдейта, извлекаются один раз на весь проход middleware"""
+    __slots__ = (
+        "event_type",
+        "chat_id",
+        "username",
+        "message_text",
+        "message_id",
+        "callback_query_data",
+    )
+
+    def __init__(self, event: Update):
+        message = None
+        user = None
+        self.callback_query_data = ""
+
+        if event.message is not None:
+            self.event_type = "message"
+            message = event.message
+            user = message.from_user
+        elif event.callback_query is not None:
+            self.event_type = "callback_query"
+            message = event.callback_query.message
+            user = event.callback_query.from_user
+            self.callback_query_data = event.callback_query.data or ""
+        elif event.inline_query is not None:
+            self.event_type = "inline_query"
+            user = event.inline_query.from_user
+        else:
+            self.event_type = event.event_type
+
+        self.username = (user.username if user is not None else None) or ""
+        if message is not None:
+            self.chat_id = message.chat.id
+            self.message_id = message.message_id
+            self.message_text = message.text if message.text is not None else "Изображение"
+        elif event.inline_query is not None:
+            # У inline-запроса нет чата: используем личный чат пользователя
+            self.chat_id = user.id
+            self.message_id = 0
+            self.message_text = event.inline_query.query
+        else:
+            self.chat_id = 0
+            self.message_id = 0
+            self.message_text = ""
+
+    def span_attributes(self) -> dict:
+        return {
+            common.TELEGRAM_EVENT_TYPE_KEY: self.event_type,
+            common.TELEGRAM_CHAT_ID_KEY: self.chat_id,
+            common.TELEGRAM_USER_USERNAME_KEY: self.username,
+            common.TELEGRAM_USER_MESSAGE_KEY: self.message_text,
+            common.TELEGRAM_MESSAGE_ID_KEY: self.message_id,
+            common.TELEGRAM_CALLBACK_QUERY_DATA_KEY: self.callback_query_data,
+        }
+
+    def metric_attributes(self) -> dict:
+        # Без текста, id сообщения и трассировки: они уникальны для каждого апдейта
+        # и плодили бы по временному ряду на сообщение
+        return {
+            common.TELEGRAM_EVENT_TYPE_KEY: self.event_type,
+            common.TELEGRAM_CHAT_ID_KEY: self.chat_id,
+            common.TELEGRAM_USER_USERNAME_KEY: self.username,
+        }
+
+
 class TgMiddleware(interface.ITelegramMiddleware):
     def __init__(
             self,
@@ -46,6 +112,71 @@ class TgMiddleware(interface.ITelegramMiddleware):
             unit="1"
         )
 
+    async def update_middleware(
+            self,
+            handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+            event: Update,
+            data: dict[str, Any]
+    ):
+        """Трассировка, метрики и логи за один проход: один спан и одно извлечение метаданных"""
+        ctx = UpdateContext(event)
+        span_attributes = ctx.span_attributes()
+
+        with self.tracer.start_as_current_span(
+                "TgMiddleware.update_middleware",
+                kind=SpanKind.SERVER,
+                attributes=span_attributes
+        ) as root_span:
+            span_ctx = root_span.get_span_context()
+            extra_log = {
+                **span_attributes,
+                common.TRACE_ID_KEY: format(span_ctx.trace_id, '032x'),
+                common.SPAN_ID_KEY: format(span_ctx.span_id, '016x'),
+            }
+            metric_attributes = ctx.metric_attributes()
+
+            start_time = time.perf_counter()
+            self.active_messages.add(1)
+            try:
+                self.logger.info(f"Начали обработку telegram {ctx.event_type}", extra_log)
+
+                try:
+                    await handler(event, data)
+                except TelegramBadRequest as err:
+                    self.logger.warning(
+                        "TelegramBadRequest в dialog middleware",
+                        {
+                            common.ERROR_KEY: str(err),
+                            common.TELEGRAM_CHAT_ID_KEY: ctx.chat_id,
+                        }
+                    )
+
+                duration_seconds = time.perf_counter() - start_time
+                self.ok_message_counter.add(1, attributes=metric_attributes)
+                self.message_duration.record(duration_seconds, attributes=metric_attributes)
+
+                extra_log[common.TELEGRAM_MESSAGE_DURATION_KEY] = int(duration_seconds * 1000)
+                self.logger.info(f"Закончили обработку telegram {ctx.event_type}", extra_log)
+
+                root_span.set_status(Status(StatusCode.OK))
+            except Exception as err:
+                duration_seconds = time.perf_counter() - start_time
+                self.error_message_counter.add(1, attributes=metric_attributes)
+                self.message_duration.record(duration_seconds, attributes=metric_attributes)
+
+                extra_log[common.TELEGRAM_MESSAGE_DURATION_KEY] = int(duration_seconds * 1000)
+                extra_log[common.TRACEBACK_KEY] = traceback.format_exc()
+                self.logger.error(f"Ошибка обработки telegram {ctx.event_type}: {str(err)}", extra_log)
+
+                root_span.record_exception(err)
+                root_span.set_status(Status(StatusCode.ERROR, str(err)))
+
+                # При критической ошибке пытаемся восстановить пользователя
+                await self._recovery_start_functionality(ctx.chat_id, ctx.username)
+                raise err
+            finally:
+                self.active_messages.add(-1)
+
     async def trace_middleware01(
             self,
             handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
@@ -242,6 +373,11 @@ class TgMiddleware(interface.ITelegramMiddleware):
                     )
 
     def __extract_metadata(self, event: Update):
+        if event.inline_query is not None:
+            # У inline-запроса нет сообщения и чата: используем личный чат пользователя
+            user = event.inline_query.from_user
+            return None, "inline_query", event.inline_query.query, user.username or "", user.id, 0
+
         message = event.message if event.message is not None else event.callback_query.message
         event_type = "message" if event.message is not None else "callback_query"
 
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from aiogram_dialog import DialogManager
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface, model
+from internal import interface, model, common
 
 
 class ActiveReleaseGetter(interface.IActiveReleaseGetter):
@@ -10,12 +10,20 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
             self,
             tel: interface.ITelemetry,
             release_repo: interface.IReleaseRepo,
-            required_approve_list: list[str]
+            required_approve_list: list[str],
+            open_card_registry: interface.IOpenCardRegistry,
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_repo = release_repo
         self.required_approve_list = required_approve_list
+        self.open_card_registry = open_card_registry
+
+        self.dialog_data_size = tel.meter().create_histogram(
+            name=common.DIALOG_DATA_SIZE_METRIC,
+            description="Size of serialized dialog_data stored in FSM storage",
+            unit="by"
+        )
 
     async def get_releases_data(
             self,
@@ -27,42 +35,50 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                # Получаем активные релизы
-                releases = await self.release_repo.get_active_release()
-
-                if not releases:
+                is_first_render = model.NAVIGATION_KEY not in dialog_manager.dialog_data
+                navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
+
+                # Список id загружается при открытии и по кнопке "Обновить"
+                if navigation.release_ids is None:
+                    navigation.release_ids = await self.release_repo.get_active_release_ids()
+
+                    # Диалог открыт из уведомления - сразу показываем нужный релиз
+                    start_data = dialog_manager.start_data
+                    if (
+                            is_first_render and
+                            isinstance(start_data, dict) and
+                            start_data.get("release_id") in navigation.release_ids
+                    ):
+                        navigation.current_index = navigation.release_ids.index(start_data["release_id"])
+
+                navigation.clamp()
+
+                current_release = None
+                while navigation.release_ids and current_release is None:
+                    releases = await self.release_repo.get_release_list_item_by_id(navigation.current_release_id)
+                    if releases:
+                        current_release = releases[0]
+                    else:
+                        # Релиз удален - убираем его из навигации
+                        navigation.remove_current()
+
+                navigation.save(dialog_manager.dialog_data)
+
+                if current_release is None:
                     return {
                         "has_releases": False,
                         "total_count": 0,
-                        "period_text": "",
                     }
 
-                # Сохраняем список для навигации
-                releases_list = []
-                for release in releases:
-                    releases_list.append(release.to_dict())
-
-                dialog_manager.dialog_data["releases_list"] = releases_list
-
-                # Устанавливаем текущий индекс (0 если не был установлен)
-                if "current_index" not in dialog_manager.dialog_data:
-                    dialog_manager.dialog_data["current_index"] = 0
+                # Карточка будет перерисована на месте при изменении релиза
+                self.open_card_registry.track(dialog_manager, current_release.id)
 
-                current_index = dialog_manager.dialog_data["current_index"]
-
-                # Корректируем индекс если он выходит за границы
-                if current_index >= len(releases):
-                    current_index = len(releases) - 1
-                    dialog_manager.dialog_data["current_index"] = current_index
-
-                current_release = releases[current_index]
+                current_index = navigation.current_index
+                total_count = navigation.total_count
 
                 # Рассчитываем время ожидания
                 waiting_time = self._calculate_waiting_time(current_release.created_at)
 
-                # Определяем период
-                period_text = self._get_period_text(releases)
-
                 # Обрабатываем информацию о подтверждениях
                 approved_list = current_release.approved_list or []
                 approval_info = self._process_approval_info(approved_list)
@@ -83,7 +99,7 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
                 }
 
                 # Определяем, показывать ли кнопки подтверждения/отклонения
-                current_user = dialog_manager.event.from_user.username or dialog_manager.event.from_user.first_name
+                current_user = self._current_user(dialog_manager)
                 show_manual_testing_buttons = (
                         current_release.status == model.ReleaseStatus.MANUAL_TESTING and
                         current_user in self.required_approve_list and
@@ -92,19 +108,16 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
 
                 data = {
                     "has_releases": True,
-                    "total_count": len(releases),
-                    "period_text": period_text,
+                    "total_count": total_count,
                     "current_index": current_index + 1,
                     "has_prev": current_index > 0,
-                    "has_next": current_index < len(releases) - 1,
+                    "has_next": current_index < total_count - 1,
                     "has_rollback": bool(current_release.rollback_to_tag),
                     "show_manual_testing_buttons": show_manual_testing_buttons,
                     **release_data,
                 }
 
-                # Сохраняем данные текущего релиза для диалогов подтверждения/отклонения
-                dialog_manager.dialog_data["current_release"] = current_release.to_dict()
-
+                self.dialog_data_size.record(model.dialog_data_size(dialog_manager.dialog_data))
                 self.logger.info("Список активных релизов загружен")
 
                 span.set_status(Status(StatusCode.OK))
@@ -125,7 +138,7 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                current_release = dialog_manager.dialog_data.get("current_release", {})
+                current_release = await self._load_current_release(dialog_manager)
                 approved_list = current_release.get("approved_list", [])
 
                 # Обрабатываем информацию о подтверждениях для диалога подтверждения
@@ -155,7 +168,7 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                current_release = dialog_manager.dialog_data.get("current_release", {})
+                current_release = await self._load_current_release(dialog_manager)
 
                 data = {
                     "service_name": current_release.get("service_name", "Неизвестно"),
@@ -171,6 +184,31 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    def _current_user(self, dialog_manager: DialogManager) -> str:
+        from_user = dialog_manager.event.from_user
+        if from_user.username:
+            # Запоминаем для перерисовок живой карточки: они тоже идут от FakeUser
+            dialog_manager.dialog_data["approver"] = from_user.username
+            return from_user.username
+
+        if dialog_manager.dialog_data.get("approver"):
+            return dialog_manager.dialog_data["approver"]
+
+        # Диалог, запущенный уведомлением, рисуется от FakeUser без username
+        start_data = dialog_manager.start_data
+        if isinstance(start_data, dict) and start_data.get("approver"):
+            return start_data["approver"]
+
+        return from_user.first_name
+
+    async def _load_current_release(self, dialog_manager: DialogManager) -> dict:
+        release_id = model.ReleaseNavigation.load(dialog_manager.dialog_data).current_release_id
+        if not release_id:
+            return {}
+
+        releases = await self.release_repo.get_release_by_id(release_id)
+        return releases[0].to_dict() if releases else {}
+
     def _process_approval_info(self, approved_list: list[str]) -> dict:
         approved_user = []
 
@@ -280,41 +318,3 @@ class ActiveReleaseGetter(interface.IActiveReleaseGetter):
 
         except Exception:
             return ""
-
-    def _get_period_text(self, releases: list) -> str:
-        """Определяет период активных релизов"""
-        if not releases:
-            return "Нет данных"
-
-        # Находим самый старый релиз
-        oldest_date = None
-        for release in releases:
-            if hasattr(release, 'created_at') and release.created_at:
-                if oldest_date is None or release.created_at < oldest_date:
-                    oldest_date = release.created_at
-
-        if not oldest_date:
-            return "Сегодня"
-
-        try:
-            if isinstance(oldest_date, str):
-                oldest_date = datetime.fromisoformat(oldest_date.replace('Z', '+00:00'))
-
-            now = datetime.now(timezone.utc)
-            if oldest_date.tzinfo is None:
-                oldest_date = oldest_date.replace(tzinfo=timezone.utc)
-
-            delta = now - oldest_date
-            hours = delta.total_seconds() / 3600
-
-            if hours < 24:
-                return "За сегодня"
-            elif hours < 48:
-                return "За последние 2 дня"
-            elif hours < 168:  # неделя
-                return "За неделю"
-            else:
-                return "За месяц"
-
-        except Exception:
-            return "За последнее время"
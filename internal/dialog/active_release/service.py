@@ -33,21 +33,19 @@ class ActiveReleaseService(interface.IActiveReleaseService):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
 
                 # Определяем направление навигации
                 if button.widget_id == "prev_release":
-                    new_index = max(0, current_index - 1)
+                    direction = model.PageDirection.PREV
                 else:  # next_release
-                    new_index = min(len(releases_list) - 1, current_index + 1)
+                    direction = model.PageDirection.NEXT
 
-                if new_index == current_index:
+                if not navigation.move(direction):
                     await callback.answer()
                     return
 
-                # Обновляем индекс
-                dialog_manager.dialog_data["current_index"] = new_index
+                navigation.save(dialog_manager.dialog_data)
 
                 self.logger.info("Навигация по релизам")
 
@@ -74,12 +72,8 @@ class ActiveReleaseService(interface.IActiveReleaseService):
             try:
                 dialog_manager.show_mode = ShowMode.EDIT
 
-                # Сбрасываем индекс к первому релизу
-                dialog_manager.dialog_data["current_index"] = 0
-
-                # Очищаем кешированные данные
-                dialog_manager.dialog_data.pop("releases_list", None)
-                dialog_manager.dialog_data.pop("current_release", None)
+                # Сбрасываем навигацию, список id будет загружен заново
+                model.ReleaseNavigation.reset(dialog_manager.dialog_data)
 
                 await callback.answer("✅ Данные обновлены")
 
@@ -134,43 +128,43 @@ class ActiveReleaseService(interface.IActiveReleaseService):
             try:
                 dialog_manager.show_mode = ShowMode.EDIT
 
-                current_release = dialog_manager.dialog_data.get("current_release", {})
-                release_id = current_release.get("id")
+                release_id = model.ReleaseNavigation.load(dialog_manager.dialog_data).current_release_id
                 approver_username = callback.from_user.username
 
                 if not release_id:
                     raise ValueError("Release ID not found in dialog data")
 
-                # Получаем текущий список подтверждений
-                current_approved_list = current_release.get("approved_list", [])
-
                 if approver_username not in self.required_approve_list:
                     await callback.answer("У вас нет прав на подтверждение", show_alert=True)
                     return
 
-                if approver_username in current_approved_list:
-                    await callback.answer("Вы уже подтвердили", show_alert=True)
-                    return
-
-
-                if len(current_approved_list) == len(self.required_approve_list) - 1:
-                    # Все подтверждения собраны - переводим в статус "тест пройден" и запускаем деплой
-                    current_approved_list.append(approver_username)
+                # Подтверждение и переход по кворуму выполняются одним условным UPDATE
+                release = await self.release_service.approve_release(
+                    release_id=release_id,
+                    approver=approver_username,
+                    required_approve_count=len(self.required_approve_list),
+                )
 
-                    await self.release_service.update_release(
-                        release_id=release_id,
-                        status=model.ReleaseStatus.MANUAL_TEST_PASSED,
-                        approved_list=current_approved_list,
-                    )
+                if release is None:
+                    # Релиз мог быть удален, пока карточка была открыта
+                    current_release = await self.release_service.find_release(release_id)
+                    if current_release is not None and approver_username in current_release.approved_list:
+                        await callback.answer("Вы уже подтвердили", show_alert=True)
+                    else:
+                        await callback.answer("Релиз больше не ожидает подтверждения", show_alert=True)
+                        await self._remove_current_release_from_list(dialog_manager)
+                        await dialog_manager.switch_to(model.ActiveReleaseStates.view_releases)
+                    return
 
-                    # Запускаем GitHub workflow для деплоя на продакшн
+                if release.status == model.ReleaseStatus.MANUAL_TEST_PASSED:
+                    # Все подтверждения собраны - запускаем деплой
                     await self.github_client.trigger_workflow(
                         owner="LoomAI-IT",
-                        repo=current_release["service_name"],
+                        repo=release.service_name,
                         workflow_id="on-approve-manual-testing.yaml.yml",
                         inputs={
                             "release_id": str(release_id),
-                            "release_tag": current_release["release_tag"],
+                            "release_tag": release.release_tag,
                         },
                     )
 
@@ -187,21 +181,10 @@ class ActiveReleaseService(interface.IActiveReleaseService):
                         f"Запущен деплой на продакшн"
                     )
                 else:
-                    current_approved_list.append(approver_username)
-
-                    await self.release_service.update_release(
-                        release_id=release_id,
-                        approved_list=current_approved_list,
-                    )
-
                     await callback.answer(f"✅ Ваше подтверждение учтено!", show_alert=True)
 
                     self.logger.info(f"Релиз {release_id} подтвержден пользователем {approver_username}.")
 
-                # Обновляем данные текущего релиза в dialog_data
-                current_release["approved_list"] = current_approved_list
-                dialog_manager.dialog_data["current_release"] = current_release
-
                 await dialog_manager.switch_to(model.ActiveReleaseStates.view_releases)
 
                 span.set_status(Status(StatusCode.OK))
@@ -226,8 +209,7 @@ class ActiveReleaseService(interface.IActiveReleaseService):
             try:
                 dialog_manager.show_mode = ShowMode.EDIT
 
-                current_release = dialog_manager.dialog_data.get("current_release", {})
-                release_id = current_release.get("id")
+                release_id = model.ReleaseNavigation.load(dialog_manager.dialog_data).current_release_id
                 rejector_username = callback.from_user.username
 
                 if not release_id:
@@ -262,17 +244,6 @@ class ActiveReleaseService(interface.IActiveReleaseService):
 
     async def _remove_current_release_from_list(self, dialog_manager: DialogManager) -> None:
         """Удаляет текущий релиз из списка и корректирует индекс"""
-        releases_list = dialog_manager.dialog_data.get("releases_list", [])
-        current_index = dialog_manager.dialog_data.get("current_index", 0)
-
-        if releases_list and current_index < len(releases_list):
-            releases_list.pop(current_index)
-
-            # Корректируем индекс если нужно
-            if current_index >= len(releases_list) and releases_list:
-                dialog_manager.dialog_data["current_index"] = len(releases_list) - 1
-            elif not releases_list:
-                dialog_manager.dialog_data["current_index"] = 0
-
-            # Очищаем данные текущего релиза
-            dialog_manager.dialog_data.pop("current_release", None)
\ No newline at end of file
+        navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
+        navigation.remove_current()
+        navigation.save(dialog_manager.dialog_data)
@@ -2,18 +2,26 @@ from datetime import datetime
 from aiogram_dialog import DialogManager
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface, model
+from internal import interface, model, common
 
 
 class FailedReleasesGetter(interface.IFailedReleasesGetter):
     def __init__(
             self,
             tel: interface.ITelemetry,
-            release_repo: interface.IReleaseRepo
+            release_repo: interface.IReleaseRepo,
+            open_card_registry: interface.IOpenCardRegistry,
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_repo = release_repo
+        self.open_card_registry = open_card_registry
+
+        self.dialog_data_size = tel.meter().create_histogram(
+            name=common.DIALOG_DATA_SIZE_METRIC,
+            description="Size of serialized dialog_data stored in FSM storage",
+            unit="by"
+        )
 
     async def get_releases_data(
             self,
@@ -25,34 +33,40 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                # Получаем провальные релизы
-                releases = await self.release_repo.get_failed_releases()
+                navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
+                navigation.total_count = await self.release_repo.count_failed_releases()
 
-                if not releases:
+                if not navigation.total_count:
+                    model.ReleaseNavigation.reset(dialog_manager.dialog_data)
                     return {
                         "has_releases": False,
                         "total_count": 0,
                     }
 
-                # Сохраняем список для навигации
-                releases_list = []
-                for release in releases:
-                    releases_list.append(release.to_dict())
+                # Загружаем только текущую карточку по курсору (created_at, id)
+                releases = await self.release_repo.get_failed_releases_page(
+                    1,
+                    navigation.cursor,
+                    navigation.direction
+                )
 
-                dialog_manager.dialog_data["releases_list"] = releases_list
+                # Курсор ушел за границы списка - начинаем с первого релиза
+                if not releases:
+                    releases = await self.release_repo.get_failed_releases_page(1)
+                    navigation.current_index = 0
 
-                # Устанавливаем текущий индекс (0 если не был установлен)
-                if "current_index" not in dialog_manager.dialog_data:
-                    dialog_manager.dialog_data["current_index"] = 0
+                navigation.clamp()
+                current_release = releases[0]
 
-                current_index = dialog_manager.dialog_data["current_index"]
+                navigation.cursor = current_release.cursor()
+                navigation.direction = model.PageDirection.CURRENT
+                navigation.save(dialog_manager.dialog_data)
 
-                # Корректируем индекс если он выходит за границы
-                if current_index >= len(releases):
-                    current_index = len(releases) - 1
-                    dialog_manager.dialog_data["current_index"] = current_index
+                # Карточка будет перерисована на месте при изменении релиза
+                self.open_card_registry.track(dialog_manager, current_release.id)
 
-                current_release = releases[current_index]
+                current_index = navigation.current_index
+                total_count = navigation.total_count
 
                 # Форматируем данные релиза
                 release_data = {
@@ -68,13 +82,14 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
 
                 data = {
                     "has_releases": True,
-                    "total_count": len(releases),
+                    "total_count": total_count,
                     "current_index": current_index + 1,
                     "has_prev": current_index > 0,
-                    "has_next": current_index < len(releases) - 1,
+                    "has_next": current_index < total_count - 1,
                     **release_data,
                 }
 
+                self.dialog_data_size.record(model.dialog_data_size(dialog_manager.dialog_data))
                 self.logger.info("Список провальных релизов загружен")
 
                 span.set_status(Status(StatusCode.OK))
@@ -31,21 +31,20 @@ class FailedReleasesService(interface.IFailedReleasesService):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
 
                 # Определяем направление навигации
                 if button.widget_id == "prev_release":
-                    new_index = max(0, current_index - 1)
+                    direction = model.PageDirection.PREV
                 else:  # next_release
-                    new_index = min(len(releases_list) - 1, current_index + 1)
+                    direction = model.PageDirection.NEXT
 
-                if new_index == current_index:
+                if not navigation.move(direction):
                     await callback.answer()
                     return
 
-                # Обновляем индекс
-                dialog_manager.dialog_data["current_index"] = new_index
+                # Следующую карточку геттер загрузит по курсору
+                navigation.save(dialog_manager.dialog_data)
 
                 self.logger.info("Навигация по провальным релизам")
 
@@ -72,11 +71,8 @@ class FailedReleasesService(interface.IFailedReleasesService):
             try:
                 dialog_manager.show_mode = ShowMode.EDIT
 
-                # Сбрасываем индекс к первому релизу
-                dialog_manager.dialog_data["current_index"] = 0
-
-                # Очищаем кешированные данные
-                dialog_manager.dialog_data.pop("releases_list", None)
+                # Сбрасываем навигацию к самому новому релизу
+                model.ReleaseNavigation.reset(dialog_manager.dialog_data)
 
                 await callback.answer("✅ Данные обновлены")
 
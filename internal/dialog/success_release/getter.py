@@ -2,7 +2,7 @@ from datetime import datetime
 from aiogram_dialog import DialogManager
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface, model
+from internal import interface, model, common
 
 
 class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
@@ -15,6 +15,12 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
         self.logger = tel.logger()
         self.release_repo = release_repo
 
+        self.dialog_data_size = tel.meter().create_histogram(
+            name=common.DIALOG_DATA_SIZE_METRIC,
+            description="Size of serialized dialog_data stored in FSM storage",
+            unit="by"
+        )
+
     async def get_releases_data(
             self,
             dialog_manager: DialogManager,
@@ -25,34 +31,37 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                # Получаем успешные релизы
-                releases = await self.release_repo.get_successful_releases()
+                navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
+                navigation.total_count = await self.release_repo.count_successful_releases()
 
-                if not releases:
+                if not navigation.total_count:
+                    model.ReleaseNavigation.reset(dialog_manager.dialog_data)
                     return {
                         "has_releases": False,
                         "total_count": 0,
                     }
 
-                # Сохраняем список для навигации
-                releases_list = []
-                for release in releases:
-                    releases_list.append(release.to_dict())
-
-                dialog_manager.dialog_data["releases_list"] = releases_list
+                # Загружаем только текущую карточку по курсору (created_at, id)
+                releases = await self.release_repo.get_successful_releases_page(
+                    1,
+                    navigation.cursor,
+                    navigation.direction
+                )
 
-                # Устанавливаем текущий индекс (0 если не был установлен)
-                if "current_index" not in dialog_manager.dialog_data:
-                    dialog_manager.dialog_data["current_index"] = 0
+                # Курсор ушел за границы списка - начинаем с первого релиза
+                if not releases:
+                    releases = await self.release_repo.get_successful_releases_page(1)
+                    navigation.current_index = 0
 
-                current_index = dialog_manager.dialog_data["current_index"]
+                navigation.clamp()
+                current_release = releases[0]
 
-                # Корректируем индекс если он выходит за границы
-                if current_index >= len(releases):
-                    current_index = len(releases) - 1
-                    dialog_manager.dialog_data["current_index"] = current_index
+                navigation.cursor = current_release.cursor()
+                navigation.direction = model.PageDirection.CURRENT
+                navigation.save(dialog_manager.dialog_data)
 
-                current_release = releases[current_index]
+                current_index = navigation.current_index
+                total_count = navigation.total_count
 
                 # Форматируем данные релиза
                 release_data = {
@@ -68,14 +77,15 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
 
                 data = {
                     "has_releases": True,
-                    "total_count": len(releases),
+                    "total_count": total_count,
                     "current_index": current_index + 1,
                     "has_prev": current_index > 0,
-                    "has_next": current_index < len(releases) - 1,
+                    "has_next": current_index < total_count - 1,
                     "has_rollback": bool(current_release.rollback_to_tag),
                     **release_data,
                 }
 
+                self.dialog_data_size.record(model.dialog_data_size(dialog_manager.dialog_data))
                 self.logger.info("Список успешных релизов загружен")
 
                 span.set_status(Status(StatusCode.OK))
@@ -100,7 +110,6 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                 # Получаем текущий релиз
                 current_release = dialog_manager.dialog_data.get("rollback_current_release", {})
                 service_name = current_release.get("service_name")
-                current_release_id = current_release.get("id")
 
                 if not service_name:
                     self.logger.warning("Не указано имя сервиса для отката")
@@ -111,17 +120,6 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                         "has_releases": False,
                     }
 
-                # Получаем все успешные релизы для данного сервиса
-                all_releases = await self.release_repo.get_successful_releases()
-
-                # Фильтруем по имени сервиса и исключаем текущий релиз
-                service_releases = [
-                    release for release in all_releases
-                    if release.service_name == service_name and
-                       release.id != current_release_id and
-                       release.release_tag != current_release.get("release_tag")
-                ]
-
                 # Берем только один предыдущий релиз (самый последний перед текущим)
                 available_releases = dialog_manager.dialog_data.get("available_rollback_release", {})
 
@@ -31,21 +31,20 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                navigation = model.ReleaseNavigation.load(dialog_manager.dialog_data)
 
                 # Определяем направление навигации
                 if button.widget_id == "prev_release":
-                    new_index = max(0, current_index - 1)
+                    direction = model.PageDirection.PREV
                 else:  # next_release
-                    new_index = min(len(releases_list) - 1, current_index + 1)
+                    direction = model.PageDirection.NEXT
 
-                if new_index == current_index:
+                if not navigation.move(direction):
                     await callback.answer()
                     return
 
-                # Обновляем индекс
-                dialog_manager.dialog_data["current_index"] = new_index
+                # Следующую карточку геттер загрузит по курсору
+                navigation.save(dialog_manager.dialog_data)
 
                 self.logger.info("Навигация по успешным релизам")
 
@@ -72,11 +71,8 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
             try:
                 dialog_manager.show_mode = ShowMode.EDIT
 
-                # Сбрасываем индекс к первому релизу
-                dialog_manager.dialog_data["current_index"] = 0
-
-                # Очищаем кешированные данные
-                dialog_manager.dialog_data.pop("releases_list", None)
+                # Сбрасываем навигацию к самому новому релизу
+                model.ReleaseNavigation.reset(dialog_manager.dialog_data)
 
                 await callback.answer("✅ Данные обновлены")
 
@@ -137,15 +133,19 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
 
                 dialog_manager.dialog_data["rollback_status"] = "not_run"
 
-                # Получаем текущий релиз из списка
-                current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                # Получаем текущий релиз по id из карточки
+                current_release_id = model.ReleaseNavigation.load(dialog_manager.dialog_data).current_release_id
 
-                if not releases_list or current_index >= len(releases_list):
+                if not current_release_id:
                     await callback.answer("❌ Ошибка получения данных релиза", show_alert=True)
                     return
 
-                current_release = releases_list[current_index]
+                release = await self.release_service.find_release(current_release_id)
+                if release is None:
+                    await callback.answer("❌ Релиз не найден", show_alert=True)
+                    return
+
+                current_release = release.to_dict()
 
                 # Сохраняем информацию о текущем релизе для отката
                 dialog_manager.dialog_data["rollback_current_release"] = current_release
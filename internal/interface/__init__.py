@@ -1,5 +1,7 @@
 from internal.interface.release import *
 from internal.interface.general import *
+from internal.interface.migration import *
+from internal.interface.notification import *
 
 from internal.interface.dialog.main_menu import *
 from internal.interface.dialog.active_release import *
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from typing import Protocol, Sequence, Any, Annotated, Callable, Awaitable
 
-from aiogram.types import TelegramObject, Update, Message
+from aiogram.types import TelegramObject, Update, Message, InlineQuery
 from aiogram_dialog import DialogManager
 from fastapi import FastAPI, Header
 
@@ -20,8 +20,21 @@ class ICommandController(Protocol):
     ): pass
 
 
+class IInlineQueryController(Protocol):
+    @abstractmethod
+    async def search_handler(self, inline_query: InlineQuery): pass
+
+
 class ITelegramMiddleware(Protocol):
 
+    @abstractmethod
+    async def update_middleware(
+            self,
+            handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+            event: Update,
+            data: dict[str, Any]
+    ): pass
+
     @abstractmethod
     async def trace_middleware01(
             self,
@@ -48,6 +61,32 @@ class ITelegramMiddleware(Protocol):
 
 
 
+class IBackgroundService(Protocol):
+    @abstractmethod
+    async def start(self) -> None: pass
+
+    @abstractmethod
+    async def stop(self) -> None: pass
+
+
+class IDBListener(IBackgroundService, Protocol):
+    @abstractmethod
+    def subscribe(self, handler: Callable[[dict | None], Awaitable[None]]) -> None: pass
+
+
+class IUpdateDeduplicator(Protocol):
+    @abstractmethod
+    async def is_duplicate(self, update_id: int) -> bool: pass
+
+
+class IUpdateScheduler(IBackgroundService, Protocol):
+    @abstractmethod
+    def set_handler(self, handler: Callable[[dict], Awaitable[None]]) -> None: pass
+
+    @abstractmethod
+    async def put(self, update: dict) -> bool: pass
+
+
 class ITelegramWebhookController(Protocol):
     @abstractmethod
     async def bot_webhook(
@@ -56,12 +95,18 @@ class ITelegramWebhookController(Protocol):
             x_telegram_bot_api_secret_token: Annotated[str | None, Header()] = None
     ): pass
 
+    @abstractmethod
+    async def process_update(self, update: dict): pass
+
     @abstractmethod
     async def bot_set_webhook(self): pass
 
 
 
 class IHttpMiddleware(Protocol):
+    @abstractmethod
+    def asgi_middleware(self, app: FastAPI): pass
+
     @abstractmethod
     def trace_middleware01(self, app: FastAPI): pass
 
@@ -111,8 +156,11 @@ class IRedis(Protocol):
     @abstractmethod
     async def get(self, key: str, default: Any = None) -> Any: pass
 
+    @abstractmethod
+    async def set_nx(self, key: str, value: Any, ttl: int) -> bool: pass
+
 
-class IDB(Protocol):
+class IDB(IBackgroundService, Protocol):
     @abstractmethod
     async def insert(self, query: str, query_params: dict) -> int: pass
 
@@ -122,8 +170,14 @@ class IDB(Protocol):
     @abstractmethod
     async def update(self, query: str, query_params: dict) -> None: pass
 
+    @abstractmethod
+    async def update_returning(self, query: str, query_params: dict) -> Sequence[Any]: pass
+
     @abstractmethod
     async def select(self, query: str, query_params: dict) -> Sequence[Any]: pass
 
+    @abstractmethod
+    async def select_readonly(self, query: str, query_params: dict) -> Sequence[Any]: pass
+
     @abstractmethod
     async def multi_query(self, queries: list[str]) -> None: pass
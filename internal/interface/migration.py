@@ -0,0 +1,16 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class IMigrationManager(Protocol):
+    @abstractmethod
+    async def up(self, version: str = None) -> list[str]: pass
+
+    @abstractmethod
+    async def down(self, version: str) -> list[str]: pass
+
+    @abstractmethod
+    async def applied_versions(self) -> list[str]: pass
+
+    @abstractmethod
+    async def explain(self, analyze: bool = False) -> dict[str, str]: pass
@@ -0,0 +1,37 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from aiogram_dialog import DialogManager
+
+from internal import model
+from internal.interface.general import IBackgroundService
+from internal.interface.release import IReleaseEventHandler
+
+
+class ITgUserRepo(Protocol):
+    @abstractmethod
+    async def save_chat_id(self, username: str, chat_id: int) -> None: pass
+
+    @abstractmethod
+    async def get_chat_ids(self, usernames: list[str]) -> dict[str, int]: pass
+
+
+class IOpenCardRegistry(Protocol):
+    @abstractmethod
+    def track(self, dialog_manager: DialogManager, release_id: int) -> None: pass
+
+    @abstractmethod
+    def untrack(self, chat_id: int, user_id: int) -> None: pass
+
+    @abstractmethod
+    def find(self, release_ids: set[int]) -> list: pass
+
+
+class ILiveCardUpdater(IReleaseEventHandler, IBackgroundService, Protocol):
+    @abstractmethod
+    async def on_release_changed(self, change: dict | None) -> None: pass
+
+
+class IReleaseNotificationService(IReleaseEventHandler, IBackgroundService, Protocol):
+    @abstractmethod
+    async def on_releases_updated(self, events: list[model.ReleaseEvent]) -> None: pass
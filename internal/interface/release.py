@@ -1,22 +1,77 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import Protocol, Annotated, Any, AsyncIterator
 
-from fastapi.responses import JSONResponse
+from fastapi import Header
+from fastapi.responses import JSONResponse, StreamingResponse, Response
 
 from internal.controller.http.handler.release.model import *
 
 
 class IReleaseController(Protocol):
     @abstractmethod
-    async def create_release(self, body: CreateReleaseBody) -> JSONResponse:
+    async def create_release(
+            self,
+            body: CreateReleaseBody,
+            idempotency_key: Annotated[str | None, Header()] = None
+    ) -> JSONResponse:
         pass
 
     @abstractmethod
     async def update_release(self, body: UpdateReleaseBody) -> JSONResponse:
         pass
 
+    @abstractmethod
+    async def update_releases(self, body: list[UpdateReleaseBody]) -> JSONResponse:
+        pass
+
+    @abstractmethod
+    async def get_release(
+            self,
+            release_id: int,
+            if_none_match: Annotated[str | None, Header()] = None
+    ) -> Response:
+        pass
+
+    @abstractmethod
+    async def get_releases(
+            self,
+            bucket: model.ReleaseBucket,
+            service: str = None,
+            cursor: str = None,
+            limit: int = 20,
+            if_none_match: Annotated[str | None, Header()] = None
+    ) -> Response:
+        pass
+
+
+class IReleaseEventHandler(Protocol):
+    @abstractmethod
+    async def on_releases_updated(self, events: list[model.ReleaseEvent]) -> None: pass
+
+
+class IReleaseEventHub(IReleaseEventHandler, Protocol):
+    @abstractmethod
+    async def on_release_changed(self, change: dict | None) -> None: pass
+
+    @abstractmethod
+    def subscribe(self, service_name: str = None, release_id: int = None) -> Any: pass
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Any) -> None: pass
+
+    @abstractmethod
+    def stream(self, service_name: str = None, release_id: int = None) -> AsyncIterator[str]: pass
+
+
+class IReleaseStreamController(Protocol):
+    @abstractmethod
+    async def stream_releases(self, service: str = None, release_id: int = None) -> StreamingResponse: pass
+
 
 class IReleaseService(Protocol):
+    @abstractmethod
+    def add_event_handler(self, handler: IReleaseEventHandler) -> None: pass
+
     @abstractmethod
     async def create_release(
             self,
@@ -41,9 +96,32 @@ class IReleaseService(Protocol):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def update_releases(self, updates: list[model.ReleaseUpdate]) -> list[model.ReleaseEvent]: pass
+
+    @abstractmethod
+    async def approve_release(
+            self,
+            release_id: int,
+            approver: str,
+            required_approve_count: int,
+    ) -> model.Release | None: pass
+
     @abstractmethod
     async def get_release_by_id(self, release_id: int) -> model.Release: pass
 
+    @abstractmethod
+    async def find_release(self, release_id: int) -> model.Release | None: pass
+
+    @abstractmethod
+    async def get_releases_page(
+            self,
+            bucket: model.ReleaseBucket,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            service_name: str = None,
+    ) -> list[model.ReleaseListItem]: pass
+
     @abstractmethod
     async def get_active_release(self) -> list[model.Release]: pass
 
@@ -53,6 +131,28 @@ class IReleaseService(Protocol):
     @abstractmethod
     async def get_failed_releases(self) -> list[model.Release]: pass
 
+    @abstractmethod
+    async def get_successful_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]: pass
+
+    @abstractmethod
+    async def count_successful_releases(self) -> int: pass
+
+    @abstractmethod
+    async def get_failed_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]: pass
+
+    @abstractmethod
+    async def count_failed_releases(self) -> int: pass
+
     @abstractmethod
     async def rollback_to_tag(
             self,
@@ -73,7 +173,7 @@ class IReleaseRepo(Protocol):
             github_run_id: str,
             github_action_link: str,
             github_ref: str
-    ) -> int:
+    ) -> tuple[int, bool]:
         pass
 
     @abstractmethod
@@ -85,12 +185,29 @@ class IReleaseRepo(Protocol):
             github_action_link: str = None,
             rollback_to_tag: str = None,
             approved_list: list[str] = None,
-    ) -> None:
+    ) -> model.ReleaseStatus | None:
         pass
 
+    @abstractmethod
+    async def update_releases(self, updates: list[model.ReleaseUpdate]) -> list[model.ReleaseEvent]: pass
+
+    @abstractmethod
+    async def approve_release(
+            self,
+            release_id: int,
+            approver: str,
+            required_approve_count: int,
+    ) -> list[model.Release]: pass
+
     @abstractmethod
     async def get_release_by_id(self, release_id: int) -> list[model.Release]: pass
 
+    @abstractmethod
+    async def get_release_list_item_by_id(self, release_id: int) -> list[model.ReleaseListItem]: pass
+
+    @abstractmethod
+    async def get_active_release_ids(self) -> list[int]: pass
+
     @abstractmethod
     async def get_active_release(self) -> list[model.Release]: pass
 
@@ -98,4 +215,43 @@ class IReleaseRepo(Protocol):
     async def get_successful_releases(self) -> list[model.Release]: pass
 
     @abstractmethod
-    async def get_failed_releases(self) -> list[model.Release]: pass
\ No newline at end of file
+    async def get_failed_releases(self) -> list[model.Release]: pass
+
+    @abstractmethod
+    async def get_successful_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]: pass
+
+    @abstractmethod
+    async def count_successful_releases(self) -> int: pass
+
+    @abstractmethod
+    async def get_failed_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]: pass
+
+    @abstractmethod
+    async def count_failed_releases(self) -> int: pass
+
+    @abstractmethod
+    async def get_releases_page(
+            self,
+            bucket: model.ReleaseBucket,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            service_name: str = None,
+    ) -> list[model.ReleaseListItem]: pass
+
+    @abstractmethod
+    async def search_releases(
+            self,
+            query: str,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+    ) -> list[model.ReleaseListItem]: pass
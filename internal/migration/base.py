@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Migration:
+    version: str
+    description: str
+    up_queries: list[str]
+    down_queries: list[str] = field(default_factory=list)
+
+    @property
+    def version_key(self) -> tuple[int, ...]:
+        return parse_version(self.version)
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in version.lstrip("v").split("."))
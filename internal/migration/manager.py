@@ -0,0 +1,144 @@
+import re
+from datetime import datetime
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface
+from internal.migration.base import Migration, parse_version
+from internal.migration.version import migrations
+from internal.repo.release import query as release_query
+
+create_migrations_table = """
+CREATE TABLE IF NOT EXISTS migrations (
+    version TEXT PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+get_applied_versions = """
+SELECT version FROM migrations;
+"""
+
+VERSION_PATTERN = re.compile(r"^v?\d+(\.\d+)*$")
+
+# Горячие запросы списков с примерами параметров для проверки планов через EXPLAIN
+EXPLAIN_QUERIES = {
+    "get_active_releases": (release_query.get_active_releases, {}),
+    "get_active_release_ids": (release_query.get_active_release_ids, {}),
+    "get_successful_releases_first_page": (release_query.get_successful_releases_first_page, {"limit": 1}),
+    "get_successful_releases_next_page": (
+        release_query.get_successful_releases_next_page,
+        {"limit": 1, "cursor_created_at": datetime.max, "cursor_id": 2 ** 31 - 1}
+    ),
+    "count_successful_releases": (release_query.count_successful_releases, {}),
+    "get_failed_releases_first_page": (release_query.get_failed_releases_first_page, {"limit": 1}),
+    "get_failed_releases_next_page": (
+        release_query.get_failed_releases_next_page,
+        {"limit": 1, "cursor_created_at": datetime.max, "cursor_id": 2 ** 31 - 1}
+    ),
+    "count_failed_releases": (release_query.count_failed_releases, {}),
+}
+
+
+class MigrationManager(interface.IMigrationManager):
+    def __init__(self, tel: interface.ITelemetry, db: interface.IDB):
+        self.db = db
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.migrations: list[Migration] = sorted(migrations, key=lambda m: m.version_key)
+
+    async def up(self, version: str = None) -> list[str]:
+        with self.tracer.start_as_current_span(
+                "MigrationManager.up",
+                kind=SpanKind.INTERNAL,
+                attributes={"version": version or "latest"}
+        ) as span:
+            try:
+                target = parse_version(self._validate_version(version)) if version else None
+                applied = set(await self.applied_versions())
+
+                applied_now = []
+                for migration in self.migrations:
+                    if target is not None and migration.version_key > target:
+                        break
+                    if migration.version in applied:
+                        continue
+
+                    # Миграция и запись о ней применяются в одной транзакции
+                    await self.db.multi_query([
+                        *migration.up_queries,
+                        f"INSERT INTO migrations (version) VALUES ('{migration.version}');",
+                    ])
+                    applied_now.append(migration.version)
+                    self.logger.info(f"Применена миграция {migration.version}: {migration.description}")
+
+                span.set_status(Status(StatusCode.OK))
+                return applied_now
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def down(self, version: str) -> list[str]:
+        with self.tracer.start_as_current_span(
+                "MigrationManager.down",
+                kind=SpanKind.INTERNAL,
+                attributes={"version": version}
+        ) as span:
+            try:
+                target = parse_version(self._validate_version(version))
+                applied = set(await self.applied_versions())
+
+                rolled_back = []
+                for migration in reversed(self.migrations):
+                    if migration.version_key <= target:
+                        break
+                    if migration.version not in applied:
+                        continue
+
+                    await self.db.multi_query([
+                        *migration.down_queries,
+                        f"DELETE FROM migrations WHERE version = '{migration.version}';",
+                    ])
+                    rolled_back.append(migration.version)
+                    self.logger.info(f"Откачена миграция {migration.version}: {migration.description}")
+
+                span.set_status(Status(StatusCode.OK))
+                return rolled_back
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def applied_versions(self) -> list[str]:
+        await self.db.multi_query([create_migrations_table])
+        rows = await self.db.select(get_applied_versions, {})
+        return sorted((row[0] for row in rows), key=parse_version)
+
+    async def explain(self, analyze: bool = False) -> dict[str, str]:
+        with self.tracer.start_as_current_span(
+                "MigrationManager.explain",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+                plans = {}
+                for name, (query, args) in EXPLAIN_QUERIES.items():
+                    rows = await self.db.select(f"EXPLAIN ({options}) {query}", args)
+                    plans[name] = "\n".join(row[0] for row in rows)
+
+                span.set_status(Status(StatusCode.OK))
+                return plans
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    @staticmethod
+    def _validate_version(version: str) -> str:
+        if not VERSION_PATTERN.match(version):
+            raise ValueError(f"Некорректная версия миграции: {version}")
+        return version
@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from infrastructure.pg.pg import PG
+from infrastructure.telemetry.telemetry import Telemetry
+from internal.config.config import Config
+from internal.migration.manager import MigrationManager
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Версионные миграции таблиц релизов")
+    parser.add_argument("environment", help="Окружение, для которого применяются миграции")
+    parser.add_argument("--command", choices=["up", "down", "explain"], default="up")
+    parser.add_argument("--version", default=None, help="Целевая версия миграции, например v1.0.1")
+    parser.add_argument("--analyze", action="store_true", help="Выполнить EXPLAIN ANALYZE вместо EXPLAIN")
+    args = parser.parse_args()
+
+    cfg = Config()
+    tel = Telemetry(
+        cfg.log_level,
+        cfg.root_path,
+        args.environment,
+        cfg.service_name,
+        cfg.service_version,
+        cfg.otlp_host,
+        cfg.otlp_port,
+    )
+    db = PG(tel, cfg.db_user, cfg.db_pass, cfg.db_host, cfg.db_port, cfg.db_name)
+    migration_manager = MigrationManager(tel, db)
+
+    if args.command == "up":
+        applied = await migration_manager.up(args.version)
+        print(f"Применены миграции: {', '.join(applied) or 'нет новых'}")
+    elif args.command == "down":
+        if args.version is None:
+            parser.error("Для отката нужно указать --version")
+        rolled_back = await migration_manager.down(args.version)
+        print(f"Откачены миграции: {', '.join(rolled_back) or 'нечего откатывать'}")
+    else:
+        plans = await migration_manager.explain(args.analyze)
+        for name, plan in plans.items():
+            print(f"-- {name}\n{plan}\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,11 @@
+from internal.migration.version import v1_0_0, v1_0_1, v1_0_2, v1_0_3, v1_0_4, v1_0_5, v1_0_6
+
+migrations = [
+    v1_0_0.migration,
+    v1_0_1.migration,
+    v1_0_2.migration,
+    v1_0_3.migration,
+    v1_0_4.migration,
+    v1_0_5.migration,
+    v1_0_6.migration,
+]
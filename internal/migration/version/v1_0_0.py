@@ -1,3 +1,5 @@
+from internal.migration.base import Migration
+
 create_release_table = """
 CREATE TABLE IF NOT EXISTS releases (
     id SERIAL PRIMARY KEY,
@@ -22,6 +24,9 @@ drop_release_table = """
 DROP TABLE IF EXISTS releases;
 """
 
-# Обновить существующие списки:
-create_queries = [create_release_table]
-drop_queries = [drop_release_table]
\ No newline at end of file
+migration = Migration(
+    version="v1.0.0",
+    description="Таблица релизов",
+    up_queries=[create_release_table],
+    down_queries=[drop_release_table],
+)
@@ -0,0 +1,73 @@
+from internal.migration.base import Migration
+
+# Частичные индексы повторяют фильтры горячих запросов из internal/repo/release/query.py,
+# поэтому списки по статусам читаются индексом уже в нужном порядке, без seq scan и сортировки
+create_active_releases_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_active_created_at
+ON releases (created_at DESC, id DESC)
+WHERE status IN (
+    'initiated',
+    'stage_building',
+    'stage_test_rollback',
+    'manual_testing',
+    'manual_test_passed',
+    'deploying',
+    'production_rollback'
+);
+"""
+
+create_successful_releases_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_successful_created_at
+ON releases (created_at DESC, id DESC)
+WHERE status IN (
+    'deployed',
+    'rollback_done'
+);
+"""
+
+create_failed_releases_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_failed_created_at
+ON releases (created_at DESC, id DESC)
+WHERE status IN (
+    'stage_building_failed',
+    'stage_test_rollback_failed',
+    'manual_test_failed',
+    'production_failed',
+    'rollback_failed'
+);
+"""
+
+create_service_releases_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_service_name_created_at
+ON releases (service_name, created_at DESC);
+"""
+
+create_successful_service_releases_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_successful_service_name_created_at
+ON releases (service_name, created_at DESC)
+WHERE status IN (
+    'deployed',
+    'rollback_done'
+);
+"""
+
+drop_indexes = [
+    "DROP INDEX IF EXISTS idx_releases_active_created_at;",
+    "DROP INDEX IF EXISTS idx_releases_successful_created_at;",
+    "DROP INDEX IF EXISTS idx_releases_failed_created_at;",
+    "DROP INDEX IF EXISTS idx_releases_service_name_created_at;",
+    "DROP INDEX IF EXISTS idx_releases_successful_service_name_created_at;",
+]
+
+migration = Migration(
+    version="v1.0.1",
+    description="Частичные индексы по корзинам статусов и индексы по сервису",
+    up_queries=[
+        create_active_releases_index,
+        create_successful_releases_index,
+        create_failed_releases_index,
+        create_service_releases_index,
+        create_successful_service_releases_index,
+    ],
+    down_queries=drop_indexes,
+)
@@ -0,0 +1,40 @@
+from internal.migration.base import Migration
+
+# JSONB позволяет дописывать подтверждение атомарно на стороне базы, без чтения списка в Python
+alter_approved_list_to_jsonb = [
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list DROP DEFAULT;
+    """,
+    """
+    ALTER TABLE releases
+    ALTER COLUMN approved_list TYPE JSONB USING COALESCE(NULLIF(approved_list, ''), '[]')::jsonb;
+    """,
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list SET DEFAULT '[]'::jsonb;
+    """,
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list SET NOT NULL;
+    """,
+]
+
+alter_approved_list_to_text = [
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list DROP NOT NULL;
+    """,
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list DROP DEFAULT;
+    """,
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list TYPE TEXT USING approved_list::text;
+    """,
+    """
+    ALTER TABLE releases ALTER COLUMN approved_list SET DEFAULT '[]';
+    """,
+]
+
+migration = Migration(
+    version="v1.0.2",
+    description="approved_list в JSONB для атомарных подтверждений",
+    up_queries=alter_approved_list_to_jsonb,
+    down_queries=alter_approved_list_to_text,
+)
@@ -0,0 +1,48 @@
+from internal.migration.base import Migration
+
+# Каждое изменение releases публикуется в канал release_changes,
+# чтобы реплики сбрасывали кеш и обновляли открытые карточки без опроса базы
+create_notify_function = """
+CREATE OR REPLACE FUNCTION notify_release_change() RETURNS trigger AS $$
+DECLARE
+    changed RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    PERFORM pg_notify(
+        'release_changes',
+        CAST(json_build_object(
+            'id', changed.id,
+            'status', changed.status,
+            'operation', TG_OP
+        ) AS TEXT)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+create_notify_trigger = """
+CREATE TRIGGER releases_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON releases
+FOR EACH ROW EXECUTE FUNCTION notify_release_change();
+"""
+
+drop_notify_trigger = """
+DROP TRIGGER IF EXISTS releases_notify_change ON releases;
+"""
+
+drop_notify_function = """
+DROP FUNCTION IF EXISTS notify_release_change();
+"""
+
+migration = Migration(
+    version="v1.0.3",
+    description="NOTIFY об изменениях релизов",
+    up_queries=[create_notify_function, drop_notify_trigger, create_notify_trigger],
+    down_queries=[drop_notify_trigger, drop_notify_function],
+)
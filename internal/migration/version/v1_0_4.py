@@ -0,0 +1,38 @@
+from internal.migration.base import Migration
+
+# Триграммные индексы обслуживают ILIKE-поиск релизов из inline-режима:
+# подстрока в имени сервиса и инициаторе, префикс тега
+create_pg_trgm_extension = "CREATE EXTENSION IF NOT EXISTS pg_trgm;"
+
+create_service_name_trgm_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_service_name_trgm
+ON releases USING GIN (service_name gin_trgm_ops);
+"""
+
+create_release_tag_trgm_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_release_tag_trgm
+ON releases USING GIN (release_tag gin_trgm_ops);
+"""
+
+create_initiated_by_trgm_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_initiated_by_trgm
+ON releases USING GIN (initiated_by gin_trgm_ops);
+"""
+
+drop_indexes = [
+    "DROP INDEX IF EXISTS idx_releases_service_name_trgm;",
+    "DROP INDEX IF EXISTS idx_releases_release_tag_trgm;",
+    "DROP INDEX IF EXISTS idx_releases_initiated_by_trgm;",
+]
+
+migration = Migration(
+    version="v1.0.4",
+    description="Триграммные индексы для поиска релизов",
+    up_queries=[
+        create_pg_trgm_extension,
+        create_service_name_trgm_index,
+        create_release_tag_trgm_index,
+        create_initiated_by_trgm_index,
+    ],
+    down_queries=drop_indexes,
+)
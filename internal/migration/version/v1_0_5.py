@@ -0,0 +1,31 @@
+from internal.migration.base import Migration
+
+# Повторы POST /release из GitHub Actions оставили дубли. Оставляем последнюю запись:
+# первый ответ до workflow не дошел, и дальше он работал с id из повтора
+delete_duplicate_releases = """
+DELETE FROM releases older
+USING releases newer
+WHERE older.service_name = newer.service_name
+  AND older.github_run_id = newer.github_run_id
+  AND older.id < newer.id;
+"""
+
+add_unique_run_constraint = """
+ALTER TABLE releases
+ADD CONSTRAINT releases_service_name_github_run_id_key UNIQUE (service_name, github_run_id);
+"""
+
+drop_unique_run_constraint = """
+ALTER TABLE releases
+DROP CONSTRAINT IF EXISTS releases_service_name_github_run_id_key;
+"""
+
+migration = Migration(
+    version="v1.0.5",
+    description="Уникальность релиза по сервису и запуску GitHub Actions",
+    up_queries=[
+        delete_duplicate_releases,
+        add_unique_run_constraint,
+    ],
+    down_queries=[drop_unique_run_constraint],
+)
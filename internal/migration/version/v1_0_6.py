@@ -0,0 +1,47 @@
+from internal.migration.base import Migration
+
+# Версия строки растет при каждом UPDATE и служит основой ETag в HTTP API чтения
+add_version_column = """
+ALTER TABLE releases
+ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 1;
+"""
+
+create_bump_version_function = """
+CREATE OR REPLACE FUNCTION bump_release_version() RETURNS trigger AS $$
+BEGIN
+    NEW.version := OLD.version + 1;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+create_bump_version_trigger = """
+CREATE TRIGGER releases_bump_version
+BEFORE UPDATE ON releases
+FOR EACH ROW EXECUTE FUNCTION bump_release_version();
+"""
+
+drop_bump_version_trigger = """
+DROP TRIGGER IF EXISTS releases_bump_version ON releases;
+"""
+
+drop_bump_version_function = """
+DROP FUNCTION IF EXISTS bump_release_version();
+"""
+
+drop_version_column = """
+ALTER TABLE releases
+DROP COLUMN IF EXISTS version;
+"""
+
+migration = Migration(
+    version="v1.0.6",
+    description="Версия строки релиза для ETag",
+    up_queries=[
+        add_version_column,
+        create_bump_version_function,
+        drop_bump_version_trigger,
+        create_bump_version_trigger,
+    ],
+    down_queries=[drop_bump_version_trigger, drop_bump_version_function, drop_version_column],
+)
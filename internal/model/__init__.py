@@ -1,5 +1,5 @@
-from internal.model.sql_model import *
 from internal.model.release import *
+from internal.model.navigation import *
 
 from internal.model.dialog_states.main_menu import *
 from internal.model.dialog_states.active_release import *
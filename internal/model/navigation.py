@@ -0,0 +1,95 @@
+import json
+from dataclasses import dataclass
+
+from internal.model.release import ReleaseCursor, PageDirection
+
+NAVIGATION_KEY = "nav"
+
+
+@dataclass
+class ReleaseNavigation:
+    """Компактное состояние навигации по карточкам релизов в dialog_data.
+
+    Вместо полных словарей релизов хранится либо упорядоченный список id
+    (активные релизы), либо keyset-курсор (успешные и провальные релизы).
+    Сам релиз загружается по требованию при отрисовке карточки.
+    """
+    current_index: int = 0
+    total_count: int = 0
+    release_ids: list[int] | None = None
+    cursor: ReleaseCursor | None = None
+    direction: PageDirection = PageDirection.CURRENT
+
+    @classmethod
+    def load(cls, dialog_data: dict) -> "ReleaseNavigation":
+        data = dialog_data.get(NAVIGATION_KEY)
+        if not data:
+            return cls()
+
+        cursor = data.get("c")
+        return cls(
+            current_index=data.get("i", 0),
+            total_count=data.get("n", 0),
+            release_ids=data.get("ids"),
+            cursor=ReleaseCursor.from_dict({"created_at": cursor[0], "id": cursor[1]}) if cursor else None,
+            direction=PageDirection(data.get("d", PageDirection.CURRENT.value)),
+        )
+
+    def save(self, dialog_data: dict) -> None:
+        data: dict = {"i": self.current_index, "n": self.total_count}
+
+        if self.release_ids is not None:
+            data["ids"] = self.release_ids
+        if self.cursor is not None:
+            data["c"] = [self.cursor.created_at.isoformat(), self.cursor.id]
+        if self.direction != PageDirection.CURRENT:
+            data["d"] = self.direction.value
+
+        dialog_data[NAVIGATION_KEY] = data
+
+    @staticmethod
+    def reset(dialog_data: dict) -> None:
+        dialog_data.pop(NAVIGATION_KEY, None)
+
+    @property
+    def current_release_id(self) -> int | None:
+        if self.release_ids:
+            return self.release_ids[self.current_index]
+        if self.cursor is not None:
+            return self.cursor.id
+        return None
+
+    def clamp(self) -> None:
+        if self.release_ids is not None:
+            self.total_count = len(self.release_ids)
+
+        if self.current_index >= self.total_count:
+            self.current_index = max(self.total_count - 1, 0)
+
+    def move(self, direction: PageDirection) -> bool:
+        # В пустом списке двигаться некуда: иначе NEXT дал бы индекс -1
+        if not self.total_count:
+            return False
+
+        if direction == PageDirection.PREV:
+            new_index = max(0, self.current_index - 1)
+        else:
+            new_index = min(self.total_count - 1, self.current_index + 1)
+
+        if new_index == self.current_index:
+            return False
+
+        self.current_index = new_index
+        if self.release_ids is None:
+            self.direction = direction
+        return True
+
+    def remove_current(self) -> None:
+        if self.release_ids and self.current_index < len(self.release_ids):
+            self.release_ids.pop(self.current_index)
+        self.clamp()
+
+
+def dialog_data_size(dialog_data: dict) -> int:
+    """Размер dialog_data в байтах в том виде, в котором он уходит в FSM storage"""
+    return len(json.dumps(dialog_data, default=str, ensure_ascii=False).encode())
@@ -1,3 +1,4 @@
+import base64
 import json
 from datetime import datetime
 from dataclasses import dataclass
@@ -25,6 +26,46 @@ class ReleaseStatus(Enum):
     ROLLBACK_DONE = "rollback_done"
 
 
+class ReleaseBucket(Enum):
+    ACTIVE = "active"
+    SUCCESSFUL = "successful"
+    FAILED = "failed"
+
+
+class PageDirection(Enum):
+    CURRENT = "current"
+    NEXT = "next"
+    PREV = "prev"
+
+
+@dataclass
+class ReleaseCursor:
+    created_at: datetime
+    id: int
+
+    @classmethod
+    def decode(cls, value: str) -> "ReleaseCursor":
+        created_at, release_id = base64.urlsafe_b64decode(value.encode()).decode().rsplit(",", 1)
+        return cls(created_at=datetime.fromisoformat(created_at), id=int(release_id))
+
+    def encode(self) -> str:
+        """Непрозрачный курсор для HTTP API"""
+        return base64.urlsafe_b64encode(f"{self.created_at.isoformat()},{self.id}".encode()).decode()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReleaseCursor":
+        return cls(
+            created_at=datetime.fromisoformat(data["created_at"]),
+            id=data["id"],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'created_at': self.created_at.isoformat(),
+            'id': self.id,
+        }
+
+
 @dataclass
 class Release:
     id: int
@@ -43,6 +84,11 @@ class Release:
     started_at: datetime
     completed_at: datetime
 
+    version: int
+
+    def cursor(self) -> ReleaseCursor:
+        return ReleaseCursor(created_at=self.created_at, id=self.id)
+
     @classmethod
     def serialize(cls, rows) -> list:
         return [
@@ -56,10 +102,11 @@ class Release:
                 github_run_id=row.github_run_id,
                 github_action_link=row.github_action_link,
                 github_ref=row.github_ref,
-                approved_list=json.loads(row.approved_list),
+                approved_list=_decode_approved_list(row.approved_list),
                 created_at=row.created_at,
                 started_at=row.started_at,
                 completed_at=row.completed_at,
+                version=row.version,
             )
             for row in rows
         ]
@@ -79,4 +126,132 @@ class Release:
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-        }
\ No newline at end of file
+            'version': self.version,
+        }
+
+
+@dataclass
+class ReleaseEvent:
+    """Изменение релиза для подписчиков ReleaseService.
+
+    status пустой, если статус не менялся; previous_status - статус до изменения, если он известен.
+    """
+    release_id: int
+    status: ReleaseStatus | None = None
+    previous_status: ReleaseStatus | None = None
+
+    @property
+    def status_changed(self) -> bool:
+        return self.status is not None and self.status != self.previous_status
+
+
+@dataclass
+class ReleaseUpdate:
+    """Одно изменение из пакетного обновления; пустые поля не меняются"""
+    release_id: int
+    status: ReleaseStatus | None = None
+    github_run_id: str | None = None
+    github_action_link: str | None = None
+
+
+class ReleaseListItem:
+    """Облегченная строка списка релизов поверх кортежа колонок RELEASE_LIST_COLUMNS.
+
+    Статус и approved_list декодируются только при обращении, поэтому карточка
+    не платит за поля, которые не показывает.
+    """
+    __slots__ = ("_row",)
+
+    def __init__(self, row):
+        self._row = row
+
+    @classmethod
+    def serialize(cls, rows) -> list["ReleaseListItem"]:
+        return [cls(row) for row in rows]
+
+    @property
+    def id(self) -> int:
+        return self._row[0]
+
+    @property
+    def service_name(self) -> str:
+        return self._row[1]
+
+    @property
+    def release_tag(self) -> str:
+        return self._row[2]
+
+    @property
+    def rollback_to_tag(self) -> str:
+        return self._row[3]
+
+    @property
+    def status(self) -> ReleaseStatus:
+        return ReleaseStatus(self._row[4])
+
+    @property
+    def initiated_by(self) -> str:
+        return self._row[5]
+
+    @property
+    def github_action_link(self) -> str:
+        return self._row[6]
+
+    @property
+    def approved_list(self) -> list[str]:
+        return _decode_approved_list(self._row[7])
+
+    @property
+    def created_at(self) -> datetime:
+        return self._row[8]
+
+    @property
+    def completed_at(self) -> datetime:
+        return self._row[9]
+
+    @property
+    def version(self) -> int:
+        return self._row[10]
+
+    def cursor(self) -> ReleaseCursor:
+        return ReleaseCursor(created_at=self.created_at, id=self.id)
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'service_name': self.service_name,
+            'release_tag': self.release_tag,
+            'rollback_to_tag': self.rollback_to_tag,
+            'status': self.status.value,
+            'initiated_by': self.initiated_by,
+            'github_action_link': self.github_action_link,
+            'approved_list': self.approved_list,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'version': self.version,
+        }
+
+
+# Порядок колонок совпадает с индексами в ReleaseListItem
+RELEASE_LIST_COLUMNS = (
+    "id",
+    "service_name",
+    "release_tag",
+    "rollback_to_tag",
+    "status",
+    "initiated_by",
+    "github_action_link",
+    "approved_list",
+    "created_at",
+    "completed_at",
+    "version",
+)
+
+
+def _decode_approved_list(approved_list) -> list[str]:
+    # JSONB приходит строкой через драйвер SQLAlchemy и списком через нативные кодеки
+    if approved_list is None:
+        return []
+    if isinstance(approved_list, str):
+        return json.loads(approved_list)
+    return list(approved_list)
@@ -0,0 +1,362 @@
+from typing import Any, Awaitable, Callable, Hashable
+
+from opentelemetry.trace import SpanKind, StatusCode
+
+from internal import model, interface, common
+from pkg.cache.lru import TTLCache, MISSING
+
+
+class CachedReleaseRepo(interface.IReleaseRepo):
+    """Кеш релизов в памяти процесса поверх ReleaseRepo.
+
+    Списки по статусам и карточки по id хранятся в отдельных LRU с TTL.
+    Любая запись через этот репозиторий сбрасывает списки и карточку измененного релиза.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            release_repo: interface.IReleaseRepo,
+            ttl: float,
+            max_size: int,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.release_repo = release_repo
+
+        self.lists = TTLCache(max_size, ttl)
+        self.items = TTLCache(max_size, ttl)
+
+        # Поколение растет при каждой инвалидации: результат чтения, начатого
+        # до записи, не попадет в кеш после нее
+        self.generation = 0
+
+        meter = tel.meter()
+        self.hit_counter = meter.create_counter(
+            name=common.RELEASE_CACHE_HIT_METRIC,
+            description="Release cache hits",
+            unit="1"
+        )
+        self.miss_counter = meter.create_counter(
+            name=common.RELEASE_CACHE_MISS_METRIC,
+            description="Release cache misses",
+            unit="1"
+        )
+
+    async def create_release(
+            self,
+            service_name: str,
+            release_tag: str,
+            status: model.ReleaseStatus,
+            initiated_by: str,
+            github_run_id: str,
+            github_action_link: str,
+            github_ref: str
+    ) -> tuple[int, bool]:
+        with self.tracer.start_as_current_span(
+                "CachedReleaseRepo.create_release",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                release_id, inserted = await self.release_repo.create_release(
+                    service_name=service_name,
+                    release_tag=release_tag,
+                    status=status,
+                    initiated_by=initiated_by,
+                    github_run_id=github_run_id,
+                    github_action_link=github_action_link,
+                    github_ref=github_ref,
+                )
+                self.invalidate(release_id)
+
+                span.set_status(StatusCode.OK)
+                return release_id, inserted
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def update_release(
+            self,
+            release_id: int,
+            status: model.ReleaseStatus = None,
+            github_run_id: str = None,
+            github_action_link: str = None,
+            rollback_to_tag: str = None,
+            approved_list: list[str] = None,
+    ) -> model.ReleaseStatus | None:
+        with self.tracer.start_as_current_span(
+                "CachedReleaseRepo.update_release",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                }
+        ) as span:
+            try:
+                try:
+                    previous_status = await self.release_repo.update_release(
+                        release_id=release_id,
+                        status=status,
+                        github_run_id=github_run_id,
+                        github_action_link=github_action_link,
+                        rollback_to_tag=rollback_to_tag,
+                        approved_list=approved_list,
+                    )
+                finally:
+                    # При ошибке запись могла примениться частично, поэтому сбрасываем в любом случае
+                    self.invalidate(release_id)
+
+                span.set_status(StatusCode.OK)
+                return previous_status
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def update_releases(self, updates: list[model.ReleaseUpdate]) -> list[model.ReleaseEvent]:
+        with self.tracer.start_as_current_span(
+                "CachedReleaseRepo.update_releases",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "updates": len(updates),
+                }
+        ) as span:
+            try:
+                try:
+                    events = await self.release_repo.update_releases(updates)
+                finally:
+                    # Один сброс на весь пакет
+                    self.invalidate_many([update.release_id for update in updates])
+
+                span.set_status(StatusCode.OK)
+                return events
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def approve_release(
+            self,
+            release_id: int,
+            approver: str,
+            required_approve_count: int,
+    ) -> list[model.Release]:
+        with self.tracer.start_as_current_span(
+                "CachedReleaseRepo.approve_release",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                }
+        ) as span:
+            try:
+                try:
+                    releases = await self.release_repo.approve_release(
+                        release_id=release_id,
+                        approver=approver,
+                        required_approve_count=required_approve_count,
+                    )
+                finally:
+                    self.invalidate(release_id)
+
+                span.set_status(StatusCode.OK)
+                return releases
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_release_by_id(self, release_id: int) -> list[model.Release]:
+        return await self._cached(
+            "get_release_by_id",
+            self.items,
+            ("release", release_id),
+            lambda: self.release_repo.get_release_by_id(release_id),
+        )
+
+    async def get_release_list_item_by_id(self, release_id: int) -> list[model.ReleaseListItem]:
+        return await self._cached(
+            "get_release_list_item_by_id",
+            self.items,
+            ("list_item", release_id),
+            lambda: self.release_repo.get_release_list_item_by_id(release_id),
+        )
+
+    async def get_active_release_ids(self) -> list[int]:
+        return await self._cached(
+            "get_active_release_ids",
+            self.lists,
+            ("active_ids",),
+            self.release_repo.get_active_release_ids,
+        )
+
+    async def get_active_release(self) -> list[model.Release]:
+        return await self._cached(
+            "get_active_release",
+            self.lists,
+            ("active",),
+            self.release_repo.get_active_release,
+        )
+
+    async def get_successful_releases(self) -> list[model.Release]:
+        return await self._cached(
+            "get_successful_releases",
+            self.lists,
+            ("successful",),
+            self.release_repo.get_successful_releases,
+        )
+
+    async def get_failed_releases(self) -> list[model.Release]:
+        return await self._cached(
+            "get_failed_releases",
+            self.lists,
+            ("failed",),
+            self.release_repo.get_failed_releases,
+        )
+
+    async def get_successful_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]:
+        return await self._cached(
+            "get_successful_releases_page",
+            self.lists,
+            ("successful_page", limit, *self._cursor_key(cursor, direction)),
+            lambda: self.release_repo.get_successful_releases_page(limit, cursor, direction),
+        )
+
+    async def count_successful_releases(self) -> int:
+        return await self._cached(
+            "count_successful_releases",
+            self.lists,
+            ("successful_count",),
+            self.release_repo.count_successful_releases,
+        )
+
+    async def get_failed_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]:
+        return await self._cached(
+            "get_failed_releases_page",
+            self.lists,
+            ("failed_page", limit, *self._cursor_key(cursor, direction)),
+            lambda: self.release_repo.get_failed_releases_page(limit, cursor, direction),
+        )
+
+    async def count_failed_releases(self) -> int:
+        return await self._cached(
+            "count_failed_releases",
+            self.lists,
+            ("failed_count",),
+            self.release_repo.count_failed_releases,
+        )
+
+    async def get_releases_page(
+            self,
+            bucket: model.ReleaseBucket,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            service_name: str = None,
+    ) -> list[model.ReleaseListItem]:
+        return await self._cached(
+            "get_releases_page",
+            self.lists,
+            ("releases_page", bucket, limit, service_name, *self._cursor_key(cursor, model.PageDirection.NEXT)),
+            lambda: self.release_repo.get_releases_page(bucket, limit, cursor, service_name),
+        )
+
+    async def search_releases(
+            self,
+            query: str,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+    ) -> list[model.ReleaseListItem]:
+        # Пользователь набирает запрос посимвольно: повторы одного префикса отдаются из кеша
+        return await self._cached(
+            "search_releases",
+            self.lists,
+            ("search", query.lower(), limit, *self._cursor_key(cursor, model.PageDirection.NEXT)),
+            lambda: self.release_repo.search_releases(query, limit, cursor),
+        )
+
+    async def on_release_changed(self, change: dict | None) -> None:
+        # None приходит после переподключения слушателя: часть уведомлений потеряна
+        if change is None:
+            self.invalidate()
+        else:
+            self.invalidate(change.get("id"))
+
+    def invalidate(self, release_id: int = None) -> None:
+        self.generation += 1
+        self.lists.clear()
+
+        if release_id is None:
+            self.items.clear()
+        else:
+            self._delete_items([release_id])
+
+    def invalidate_many(self, release_ids: list[int]) -> None:
+        self.generation += 1
+        self.lists.clear()
+        self._delete_items(release_ids)
+
+    def _delete_items(self, release_ids: list[int]) -> None:
+        for release_id in release_ids:
+            self.items.delete(("release", release_id))
+            self.items.delete(("list_item", release_id))
+
+    async def _cached(
+            self,
+            bucket: str,
+            cache: TTLCache,
+            key: Hashable,
+            loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        with self.tracer.start_as_current_span(
+                f"CachedReleaseRepo.{bucket}",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                attributes = {common.RELEASE_CACHE_BUCKET_KEY: bucket}
+
+                value = cache.get(key)
+                if value is not MISSING:
+                    self.hit_counter.add(1, attributes)
+                    span.set_attribute("cache.hit", True)
+                    span.set_status(StatusCode.OK)
+                    return self._copy(value)
+
+                self.miss_counter.add(1, attributes)
+                span.set_attribute("cache.hit", False)
+
+                generation = self.generation
+                value = await loader()
+                if generation == self.generation:
+                    cache.set(key, value)
+
+                span.set_status(StatusCode.OK)
+                return self._copy(value)
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        # Отдаем копию списка, чтобы вызывающий код не испортил закешированное значение
+        return list(value) if isinstance(value, list) else value
+
+    @staticmethod
+    def _cursor_key(cursor: model.ReleaseCursor | None, direction: model.PageDirection) -> tuple:
+        if cursor is None:
+            return None, None, None
+        return cursor.created_at, cursor.id, direction.value
@@ -1,3 +1,12 @@
+from internal.model.release import RELEASE_LIST_COLUMNS
+
+# Проекция для карточек списков, см. model.ReleaseListItem
+release_list_columns = ", ".join(RELEASE_LIST_COLUMNS)
+
+# Повторный запрос того же запуска GitHub Actions не создает второй релиз. Строка
+# переписывается, только если изменилась ссылка на запуск: иначе чистый повтор поднимал бы
+# version (ETag) и слал NOTIFY всем репликам. Если UPDATE не понадобился, RETURNING пуст
+# и id берется запросом get_release_id_by_run. inserted отличает новую строку (xmax = 0)
 create_release = """
 INSERT INTO releases (
     service_name, 
@@ -17,7 +26,32 @@ VALUES (
     :github_action_link, 
     :github_ref
 )
-RETURNING id;
+ON CONFLICT (service_name, github_run_id) DO UPDATE
+SET github_action_link = EXCLUDED.github_action_link
+WHERE releases.github_action_link IS DISTINCT FROM EXCLUDED.github_action_link
+RETURNING id, (xmax = 0) AS inserted;
+"""
+
+get_release_id_by_run = """
+SELECT id FROM releases
+WHERE service_name = :service_name
+  AND github_run_id = :github_run_id;
+"""
+
+# Подтверждение дописывается атомарно: повторный голос и голос по уже ушедшему
+# из ручного тестирования релизу отсекаются условием WHERE, а при наборе кворума
+# статус переключается в том же UPDATE
+approve_release = """
+UPDATE releases
+SET approved_list = approved_list || jsonb_build_array(CAST(:approver AS TEXT)),
+    status = CASE
+        WHEN jsonb_array_length(approved_list) + 1 >= :required_approve_count THEN 'manual_test_passed'
+        ELSE status
+    END
+WHERE id = :release_id
+  AND status = 'manual_testing'
+  AND NOT approved_list @> jsonb_build_array(CAST(:approver AS TEXT))
+RETURNING *;
 """
 
 get_release_by_id = """
@@ -25,6 +59,11 @@ SELECT * FROM releases
 WHERE id = :release_id
 """
 
+get_release_list_item_by_id = f"""
+SELECT {release_list_columns} FROM releases
+WHERE id = :release_id
+"""
+
 get_active_releases = """
 SELECT * FROM releases
 WHERE status IN (
@@ -40,6 +79,20 @@ WHERE status IN (
 ORDER BY created_at DESC;
 """
 
+get_active_release_ids = """
+SELECT id FROM releases
+WHERE status IN (
+    'initiated',
+    'stage_building',
+    'stage_test_rollback',
+    'manual_testing',
+    'manual_test_passed',
+    'deploying',
+    'production_rollback'
+)
+ORDER BY created_at DESC, id DESC;
+"""
+
 get_successful_releases = """
 SELECT * FROM releases
 WHERE status IN (
@@ -59,4 +112,188 @@ WHERE status IN (
     'rollback_failed'
 )
 ORDER BY created_at DESC;
-"""
\ No newline at end of file
+"""
+
+active_releases_filter = """
+status IN (
+    'initiated',
+    'stage_building',
+    'stage_test_rollback',
+    'manual_testing',
+    'manual_test_passed',
+    'deploying',
+    'production_rollback'
+)
+"""
+
+successful_releases_filter = """
+status IN (
+    'deployed',
+    'rollback_done'
+)
+"""
+
+failed_releases_filter = """
+status IN (
+    'stage_building_failed',
+    'stage_test_rollback_failed',
+    'manual_test_failed',
+    'production_failed',
+    'rollback_failed'
+)
+"""
+
+# Keyset-пагинация по (created_at, id): первая страница, страница начиная с курсора,
+# страница старше курсора (следующая) и страница новее курсора (предыдущая)
+get_successful_releases_first_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {successful_releases_filter}
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_successful_releases_current_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {successful_releases_filter}
+  AND (created_at, id) <= (:cursor_created_at, :cursor_id)
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_successful_releases_next_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {successful_releases_filter}
+  AND (created_at, id) < (:cursor_created_at, :cursor_id)
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_successful_releases_prev_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {successful_releases_filter}
+  AND (created_at, id) > (:cursor_created_at, :cursor_id)
+ORDER BY created_at ASC, id ASC
+LIMIT :limit;
+"""
+
+count_successful_releases = f"""
+SELECT COUNT(*) FROM releases
+WHERE {successful_releases_filter};
+"""
+
+get_failed_releases_first_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {failed_releases_filter}
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_failed_releases_current_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {failed_releases_filter}
+  AND (created_at, id) <= (:cursor_created_at, :cursor_id)
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_failed_releases_next_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {failed_releases_filter}
+  AND (created_at, id) < (:cursor_created_at, :cursor_id)
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_failed_releases_prev_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {failed_releases_filter}
+  AND (created_at, id) > (:cursor_created_at, :cursor_id)
+ORDER BY created_at ASC, id ASC
+LIMIT :limit;
+"""
+
+count_failed_releases = f"""
+SELECT COUNT(*) FROM releases
+WHERE {failed_releases_filter};
+"""
+
+# Страницы HTTP API чтения: корзина статусов, необязательный фильтр по сервису
+# и курсор (created_at, id) последней строки предыдущей страницы.
+# Варианты собираются заранее, чтобы у каждого был свой подготовленный план
+release_bucket_filters = {
+    "active": active_releases_filter,
+    "successful": successful_releases_filter,
+    "failed": failed_releases_filter,
+}
+
+
+def _releases_page_query(status_filter: str, by_service: bool, after_cursor: bool) -> str:
+    conditions = [status_filter.strip()]
+    if by_service:
+        conditions.append("service_name = :service_name")
+    if after_cursor:
+        conditions.append("(created_at, id) < (:cursor_created_at, :cursor_id)")
+
+    where = "\n  AND ".join(conditions)
+    return f"""
+SELECT {release_list_columns} FROM releases
+WHERE {where}
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+
+get_releases_page = {
+    (bucket, by_service, after_cursor): _releases_page_query(status_filter, by_service, after_cursor)
+    for bucket, status_filter in release_bucket_filters.items()
+    for by_service in (False, True)
+    for after_cursor in (False, True)
+}
+
+# Пакетное обновление одним запросом: массивы параметров разворачиваются UNNEST
+# в строки, NULL в массиве оставляет поле без изменений. CTE old видит строки до
+# обновления и отдает прежний статус; FOR UPDATE не дает статусу смениться между ними
+update_releases = """
+WITH old AS (
+    SELECT id, status FROM releases
+    WHERE id = ANY(CAST(:release_ids AS INTEGER[]))
+    FOR UPDATE
+)
+UPDATE releases AS r
+SET status = COALESCE(u.status, r.status),
+    github_run_id = COALESCE(u.github_run_id, r.github_run_id),
+    github_action_link = COALESCE(u.github_action_link, r.github_action_link)
+FROM UNNEST(
+    CAST(:release_ids AS INTEGER[]),
+    CAST(:statuses AS TEXT[]),
+    CAST(:github_run_ids AS TEXT[]),
+    CAST(:github_action_links AS TEXT[])
+) AS u(id, status, github_run_id, github_action_link), old
+WHERE r.id = u.id
+  AND old.id = r.id
+RETURNING r.id, r.status, old.status AS previous_status;
+"""
+
+# Поиск для inline-режима: подстрока в имени сервиса и инициаторе, префикс тега.
+# Все три условия покрыты триграммными индексами из миграции v1.0.4.
+# Страницы листаются курсором (created_at, id), как и списки релизов
+search_releases_filter = """(
+    service_name ILIKE :contains_pattern
+    OR release_tag ILIKE :prefix_pattern
+    OR initiated_by ILIKE :contains_pattern
+)"""
+
+search_releases_first_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {search_releases_filter}
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+search_releases_next_page = f"""
+SELECT {release_list_columns} FROM releases
+WHERE {search_releases_filter}
+  AND (created_at, id) < (:cursor_created_at, :cursor_id)
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
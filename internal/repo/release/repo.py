@@ -21,7 +21,7 @@ class ReleaseRepo(interface.IReleaseRepo):
             github_run_id: str,
             github_action_link: str,
             github_ref: str
-    ) -> int:
+    ) -> tuple[int, bool]:
         with self.tracer.start_as_current_span(
                 "ReleaseRepo.create_release",
                 kind=SpanKind.INTERNAL
@@ -36,10 +36,19 @@ class ReleaseRepo(interface.IReleaseRepo):
                     "github_action_link": github_action_link,
                     "github_ref": github_ref,
                 }
-                release_id = await self.db.insert(create_release, args)
+                rows = await self.db.update_returning(create_release, args)
+                if rows:
+                    span.set_status(StatusCode.OK)
+                    return rows[0].id, rows[0].inserted
+
+                # Чистый повтор: конфликт без изменений, строка не тронута
+                rows = await self.db.select(get_release_id_by_run, {
+                    "service_name": service_name,
+                    "github_run_id": github_run_id,
+                })
 
                 span.set_status(StatusCode.OK)
-                return release_id
+                return rows[0].id, False
 
             except Exception as err:
                 span.record_exception(err)
@@ -54,7 +63,7 @@ class ReleaseRepo(interface.IReleaseRepo):
             github_action_link: str = None,
             rollback_to_tag: str = None,
             approved_list: list[str] = None,
-    ) -> None:
+    ) -> model.ReleaseStatus | None:
         with self.tracer.start_as_current_span(
                 "ReleaseRepo.update_release",
                 kind=SpanKind.INTERNAL,
@@ -83,21 +92,89 @@ class ReleaseRepo(interface.IReleaseRepo):
                     args['rollback_to_tag'] = rollback_to_tag
 
                 if approved_list is not None:
-                    update_fields.append("approved_list = :approved_list")
+                    update_fields.append("approved_list = CAST(:approved_list AS JSONB)")
                     args['approved_list'] = json.dumps(approved_list, ensure_ascii=False)
 
                 if not update_fields:
                     span.set_status(Status(StatusCode.OK))
-                    return
+                    return None
 
+                # Прежний статус берем из той же строки под блокировкой, чтобы подписчики
+                # могли отличить смену статуса от повторной записи того же значения
                 query = f"""
-                UPDATE releases 
+                UPDATE releases AS r
                 SET {', '.join(update_fields)}
-                WHERE id = :release_id;
+                FROM (SELECT id, status FROM releases WHERE id = :release_id FOR UPDATE) AS old
+                WHERE r.id = old.id
+                RETURNING old.status AS previous_status;
                 """
 
-                await self.db.update(query, args)
+                rows = await self.db.update_returning(query, args)
+                span.set_status(StatusCode.OK)
+                return model.ReleaseStatus(rows[0].previous_status) if rows else None
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def update_releases(self, updates: list[model.ReleaseUpdate]) -> list[model.ReleaseEvent]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.update_releases",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "updates": len(updates),
+                }
+        ) as span:
+            try:
+                if not updates:
+                    span.set_status(StatusCode.OK)
+                    return []
+
+                args = {
+                    'release_ids': [update.release_id for update in updates],
+                    'statuses': [update.status.value if update.status is not None else None for update in updates],
+                    'github_run_ids': [update.github_run_id for update in updates],
+                    'github_action_links': [update.github_action_link for update in updates],
+                }
+                rows = await self.db.update_returning(update_releases, args)
+
+                span.set_status(StatusCode.OK)
+                return [
+                    model.ReleaseEvent(row.id, model.ReleaseStatus(row.status), model.ReleaseStatus(row.previous_status))
+                    for row in rows
+                ]
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def approve_release(
+            self,
+            release_id: int,
+            approver: str,
+            required_approve_count: int,
+    ) -> list[model.Release]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.approve_release",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                    "approver": approver,
+                }
+        ) as span:
+            try:
+                args = {
+                    'release_id': release_id,
+                    'approver': approver,
+                    'required_approve_count': required_approve_count,
+                }
+                rows = await self.db.update_returning(approve_release, args)
+                if rows:
+                    rows = model.Release.serialize(rows)
                 span.set_status(StatusCode.OK)
+                return rows
 
             except Exception as err:
                 span.record_exception(err)
@@ -110,7 +187,7 @@ class ReleaseRepo(interface.IReleaseRepo):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                rows = await self.db.select(get_active_releases, {})
+                rows = await self.db.select_readonly(get_active_releases, {})
                 if rows:
                     rows = model.Release.serialize(rows)
                 span.set_status(StatusCode.OK)
@@ -121,6 +198,21 @@ class ReleaseRepo(interface.IReleaseRepo):
                 span.set_status(StatusCode.ERROR, str(err))
                 raise
 
+    async def get_active_release_ids(self) -> list[int]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_active_release_ids",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                rows = await self.db.select_readonly(get_active_release_ids, {})
+                span.set_status(StatusCode.OK)
+                return [row[0] for row in rows]
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
     async def get_release_by_id(self, release_id: int) -> list[model.Release]:
         with self.tracer.start_as_current_span(
                 "ReleaseRepo.get_release_by_id",
@@ -128,7 +220,7 @@ class ReleaseRepo(interface.IReleaseRepo):
         ) as span:
             try:
                 args = {'release_id': release_id}
-                rows = await self.db.select(get_active_releases, args)
+                rows = await self.db.select_readonly(get_release_by_id, args)
                 if rows:
                     rows = model.Release.serialize(rows)
                 span.set_status(StatusCode.OK)
@@ -139,13 +231,31 @@ class ReleaseRepo(interface.IReleaseRepo):
                 span.set_status(StatusCode.ERROR, str(err))
                 raise
 
+    async def get_release_list_item_by_id(self, release_id: int) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_release_list_item_by_id",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                args = {'release_id': release_id}
+                rows = await self.db.select_readonly(get_release_list_item_by_id, args)
+                if rows:
+                    rows = model.ReleaseListItem.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
     async def get_successful_releases(self) -> list[model.Release]:
         with self.tracer.start_as_current_span(
                 "ReleaseRepo.get_successful_releases",
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                rows = await self.db.select(get_successful_releases, {})
+                rows = await self.db.select_readonly(get_successful_releases, {})
                 if rows:
                     rows = model.Release.serialize(rows)
                 span.set_status(StatusCode.OK)
@@ -162,7 +272,7 @@ class ReleaseRepo(interface.IReleaseRepo):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                rows = await self.db.select(get_failed_releases, {})
+                rows = await self.db.select_readonly(get_failed_releases, {})
                 if rows:
                     rows = model.Release.serialize(rows)
                 span.set_status(StatusCode.OK)
@@ -171,4 +281,197 @@ class ReleaseRepo(interface.IReleaseRepo):
             except Exception as err:
                 span.record_exception(err)
                 span.set_status(StatusCode.ERROR, str(err))
-                raise
\ No newline at end of file
+                raise
+
+    async def get_successful_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_successful_releases_page",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "limit": limit,
+                    "direction": direction.value,
+                }
+        ) as span:
+            try:
+                query = self._select_page_query(
+                    cursor,
+                    direction,
+                    first_page_query=get_successful_releases_first_page,
+                    current_page_query=get_successful_releases_current_page,
+                    next_page_query=get_successful_releases_next_page,
+                    prev_page_query=get_successful_releases_prev_page,
+                )
+                rows = await self.db.select_readonly(query, self._page_args(limit, cursor))
+                if rows:
+                    rows = model.ReleaseListItem.serialize(rows)
+                    if cursor is not None and direction == model.PageDirection.PREV:
+                        rows.reverse()
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def count_successful_releases(self) -> int:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.count_successful_releases",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                rows = await self.db.select_readonly(count_successful_releases, {})
+                span.set_status(StatusCode.OK)
+                return rows[0][0]
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_failed_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_failed_releases_page",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "limit": limit,
+                    "direction": direction.value,
+                }
+        ) as span:
+            try:
+                query = self._select_page_query(
+                    cursor,
+                    direction,
+                    first_page_query=get_failed_releases_first_page,
+                    current_page_query=get_failed_releases_current_page,
+                    next_page_query=get_failed_releases_next_page,
+                    prev_page_query=get_failed_releases_prev_page,
+                )
+                rows = await self.db.select_readonly(query, self._page_args(limit, cursor))
+                if rows:
+                    rows = model.ReleaseListItem.serialize(rows)
+                    if cursor is not None and direction == model.PageDirection.PREV:
+                        rows.reverse()
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def count_failed_releases(self) -> int:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.count_failed_releases",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                rows = await self.db.select_readonly(count_failed_releases, {})
+                span.set_status(StatusCode.OK)
+                return rows[0][0]
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_releases_page(
+            self,
+            bucket: model.ReleaseBucket,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            service_name: str = None,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_releases_page",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "bucket": bucket.value,
+                }
+        ) as span:
+            try:
+                query = get_releases_page[(bucket.value, service_name is not None, cursor is not None)]
+                args = self._page_args(limit, cursor)
+                if service_name is not None:
+                    args["service_name"] = service_name
+
+                rows = await self.db.select_readonly(query, args)
+                if rows:
+                    rows = model.ReleaseListItem.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def search_releases(
+            self,
+            query: str,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.search_releases",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                escaped_query = self._escape_like(query)
+                args = {
+                    "contains_pattern": f"%{escaped_query}%",
+                    "prefix_pattern": f"{escaped_query}%",
+                    **self._page_args(limit, cursor),
+                }
+                page_query = search_releases_first_page if cursor is None else search_releases_next_page
+                rows = await self.db.select_readonly(page_query, args)
+                if rows:
+                    rows = model.ReleaseListItem.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        # Пользовательский ввод не должен превращаться в шаблон LIKE
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _select_page_query(
+            cursor: model.ReleaseCursor | None,
+            direction: model.PageDirection,
+            first_page_query: str,
+            current_page_query: str,
+            next_page_query: str,
+            prev_page_query: str,
+    ) -> str:
+        if cursor is None:
+            return first_page_query
+
+        if direction == model.PageDirection.NEXT:
+            return next_page_query
+        elif direction == model.PageDirection.PREV:
+            return prev_page_query
+        return current_page_query
+
+    @staticmethod
+    def _page_args(limit: int, cursor: model.ReleaseCursor | None) -> dict:
+        args: dict = {"limit": limit}
+        if cursor is not None:
+            args["cursor_created_at"] = cursor.created_at
+            args["cursor_id"] = cursor.id
+        return args
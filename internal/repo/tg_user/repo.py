@@ -0,0 +1,52 @@
+import asyncio
+
+from opentelemetry.trace import SpanKind, StatusCode
+
+from internal import interface
+
+
+class TgUserRepo(interface.ITgUserRepo):
+    """Соответствие username -> chat_id: бот может писать только по chat_id,
+    а подтверждающие в конфиге заданы по username"""
+
+    def __init__(self, tel: interface.ITelemetry, redis: interface.IRedis, key_prefix: str = "tg_user_chat:"):
+        self.tracer = tel.tracer()
+        self.redis = redis
+        self.key_prefix = key_prefix
+
+    async def save_chat_id(self, username: str, chat_id: int) -> None:
+        with self.tracer.start_as_current_span(
+                "TgUserRepo.save_chat_id",
+                kind=SpanKind.INTERNAL,
+                attributes={"username": username}
+        ) as span:
+            try:
+                await self.redis.set(self._key(username), chat_id)
+                span.set_status(StatusCode.OK)
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_chat_ids(self, usernames: list[str]) -> dict[str, int]:
+        with self.tracer.start_as_current_span(
+                "TgUserRepo.get_chat_ids",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                chat_ids = await asyncio.gather(*(self.redis.get(self._key(username)) for username in usernames))
+                span.set_status(StatusCode.OK)
+                return {
+                    username: int(chat_id)
+                    for username, chat_id in zip(usernames, chat_ids)
+                    if chat_id is not None
+                }
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    def _key(self, username: str) -> str:
+        return f"{self.key_prefix}{username.lower()}"
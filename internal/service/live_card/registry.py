@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+from aiogram_dialog import DialogManager
+
+from pkg.cache.lru import TTLCache
+
+from internal import interface
+
+
+@dataclass
+class OpenCard:
+    chat_id: int
+    user_id: int
+    release_id: int
+    stack_id: str
+    intent_id: str
+
+
+class OpenCardRegistry(interface.IOpenCardRegistry):
+    """Какие чаты сейчас смотрят карточку какого релиза.
+
+    Запись обновляется при каждой отрисовке карточки геттером и живет ttl секунд,
+    так что брошенные диалоги сами выпадают из реестра.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10000):
+        self.cards = TTLCache(max_size, ttl)
+
+    def track(self, dialog_manager: DialogManager, release_id: int) -> None:
+        chat = dialog_manager.middleware_data.get("event_chat")
+        user = dialog_manager.middleware_data.get("event_from_user")
+        if chat is None or user is None:
+            return
+
+        self.cards.set(
+            (chat.id, user.id),
+            OpenCard(
+                chat_id=chat.id,
+                user_id=user.id,
+                release_id=release_id,
+                stack_id=dialog_manager.current_stack().id,
+                intent_id=dialog_manager.current_context().id,
+            )
+        )
+
+    def untrack(self, chat_id: int, user_id: int) -> None:
+        self.cards.delete((chat_id, user_id))
+
+    def find(self, release_ids: set[int]) -> list[OpenCard]:
+        return [card for _, card in self.cards.items() if card.release_id in release_ids]
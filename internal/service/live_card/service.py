@@ -0,0 +1,108 @@
+import asyncio
+
+from aiogram import Bot
+from aiogram_dialog import BgManagerFactory
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model
+
+
+class LiveCardUpdater(interface.ILiveCardUpdater):
+    """Перерисовывает открытые карточки релизов при их изменении.
+
+    Изменения копятся и раз в interval каждая затронутая карточка перерисовывается
+    один раз, сколько бы переходов статуса ни пришло за это время.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            bot: Bot,
+            dialog_bg_factory: BgManagerFactory,
+            open_card_registry: interface.IOpenCardRegistry,
+            interval: float,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.bot = bot
+        self.dialog_bg_factory = dialog_bg_factory
+        self.open_card_registry = open_card_registry
+        self.interval = interval
+
+        self.changed_release_ids: set[int] = set()
+        self._has_changes = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def on_releases_updated(self, events: list[model.ReleaseEvent]) -> None:
+        self._mark_changed(event.release_id for event in events)
+
+    async def on_release_changed(self, change: dict | None) -> None:
+        # Уведомление из Postgres: изменение могло прийти с другой реплики
+        if change is not None and change.get("id") is not None:
+            self._mark_changed([change["id"]])
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _mark_changed(self, release_ids) -> None:
+        self.changed_release_ids.update(release_ids)
+        if self.changed_release_ids:
+            self._has_changes.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_changes.wait()
+            await asyncio.sleep(self.interval)
+            try:
+                await self._flush()
+            except Exception as err:
+                self.logger.error(f"Ошибка обновления открытых карточек релизов: {err}")
+
+    async def _flush(self) -> None:
+        with self.tracer.start_as_current_span(
+                "LiveCardUpdater._flush",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                release_ids, self.changed_release_ids = self.changed_release_ids, set()
+                self._has_changes.clear()
+
+                cards = self.open_card_registry.find(release_ids)
+                for card in cards:
+                    await self._update_card(card)
+
+                span.set_attribute("cards", len(cards))
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _update_card(self, card) -> None:
+        try:
+            # Обновляем именно тот контекст диалога, в котором карточка была отрисована:
+            # если пользователь уже ушел из него, aiogram_dialog проигнорирует устаревший intent
+            bg_manager = self.dialog_bg_factory.bg(
+                bot=self.bot,
+                user_id=card.user_id,
+                chat_id=card.chat_id,
+                stack_id=card.stack_id,
+                intent_id=card.intent_id,
+            )
+            await bg_manager.update({})
+        except Exception as err:
+            self.open_card_registry.untrack(card.chat_id, card.user_id)
+            self.logger.warning(f"Не удалось обновить карточку релиза {card.release_id} в чате {card.chat_id}: {err}")
@@ -0,0 +1,148 @@
+import asyncio
+
+from aiogram import Bot
+from aiogram_dialog import BgManagerFactory, StartMode, ShowMode
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model
+
+
+class ReleaseNotificationService(interface.IReleaseNotificationService):
+    """Уведомляет подтверждающих о релизах в настроенных статусах.
+
+    События копятся в течение batch_interval и рассылаются одной пачкой: каждый
+    получатель получает одно сообщение со всеми релизами и открытый диалог
+    активных релизов на первом из них. Скорость отправки ограничивает лимитер сессии бота.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            bot: Bot,
+            dialog_bg_factory: BgManagerFactory,
+            release_repo: interface.IReleaseRepo,
+            tg_user_repo: interface.ITgUserRepo,
+            recipients: list[str],
+            notify_statuses: list[model.ReleaseStatus],
+            batch_interval: float = 1,
+            fan_out_concurrency: int = 5,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.bot = bot
+        self.dialog_bg_factory = dialog_bg_factory
+        self.release_repo = release_repo
+        self.tg_user_repo = tg_user_repo
+        self.recipients = recipients
+        self.notify_statuses = set(notify_statuses)
+        self.batch_interval = batch_interval
+        self.fan_out_concurrency = fan_out_concurrency
+
+        self.pending: dict[int, model.ReleaseStatus] = {}
+        self._has_pending = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def on_releases_updated(self, events: list[model.ReleaseEvent]) -> None:
+        for event in events:
+            # Голоса и правки ссылок статус не меняют - повторно не уведомляем
+            if event.status_changed and event.status in self.notify_statuses:
+                self.pending[event.release_id] = event.status
+
+        if self.pending:
+            self._has_pending.set()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Дорассылаем то, что успело накопиться
+        if self.pending:
+            await self._flush()
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_pending.wait()
+            await asyncio.sleep(self.batch_interval)
+            try:
+                await self._flush()
+            except Exception as err:
+                self.logger.error(f"Ошибка рассылки уведомлений о релизах: {err}")
+
+    async def _flush(self) -> None:
+        with self.tracer.start_as_current_span(
+                "ReleaseNotificationService._flush",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                pending, self.pending = self.pending, {}
+                self._has_pending.clear()
+
+                releases = []
+                for release_id, status in pending.items():
+                    rows = await self.release_repo.get_release_list_item_by_id(release_id)
+                    # Пока копилась пачка, релиз мог уйти дальше - о старом статусе не пишем
+                    if rows and rows[0].status == status:
+                        releases.append(rows[0])
+
+                if not releases:
+                    span.set_status(Status(StatusCode.OK))
+                    return
+
+                chat_ids = await self.tg_user_repo.get_chat_ids(self.recipients)
+                missing = set(self.recipients) - set(chat_ids)
+                if missing:
+                    self.logger.warning(f"Нет chat_id для {', '.join(sorted(missing))}: пользователи не запускали /start")
+
+                text = self._format_text(releases)
+                semaphore = asyncio.Semaphore(self.fan_out_concurrency)
+
+                async def notify(username: str, chat_id: int):
+                    async with semaphore:
+                        await self._notify(username, chat_id, text, releases[0].id)
+
+                await asyncio.gather(*(notify(username, chat_id) for username, chat_id in chat_ids.items()))
+
+                span.set_attribute("releases", len(releases))
+                span.set_attribute("recipients", len(chat_ids))
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _notify(self, username: str, chat_id: int, text: str, release_id: int) -> None:
+        try:
+            await self.bot.send_message(chat_id=chat_id, text=text)
+
+            # Открываем диалог активных релизов сразу на нужной карточке. Фоновый запуск
+            # идет от имени FakeUser без username, поэтому подтверждающего передаем явно
+            bg_manager = self.dialog_bg_factory.bg(bot=self.bot, user_id=chat_id, chat_id=chat_id)
+            await bg_manager.start(
+                model.ActiveReleaseStates.view_releases,
+                data={"release_id": release_id, "approver": username},
+                mode=StartMode.RESET_STACK,
+                show_mode=ShowMode.SEND,
+            )
+        except Exception as err:
+            self.logger.error(f"Не удалось отправить уведомление в чат {chat_id}: {err}")
+
+    @staticmethod
+    def _format_text(releases: list[model.ReleaseListItem]) -> str:
+        lines = ["🔔 Релизы ждут вашего внимания:" if len(releases) > 1 else "🔔 Релиз ждет вашего внимания:"]
+        for release in releases:
+            lines.append(
+                f"• {release.service_name} {release.release_tag} — {release.status.value} (@{release.initiated_by})"
+            )
+        return "\n".join(lines)
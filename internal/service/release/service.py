@@ -26,6 +26,11 @@ class ReleaseService(interface.IReleaseService):
         self.service_port_map = service_port_map
         self.service_prefix_map = service_prefix_map
 
+        self.event_handlers: list[interface.IReleaseEventHandler] = []
+
+    def add_event_handler(self, handler: interface.IReleaseEventHandler) -> None:
+        self.event_handlers.append(handler)
+
     async def create_release(
             self,
             service_name: str,
@@ -47,7 +52,7 @@ class ReleaseService(interface.IReleaseService):
                 }
         ) as span:
             try:
-                release_id = await self.release_repo.create_release(
+                release_id, inserted = await self.release_repo.create_release(
                     service_name=service_name,
                     release_tag=release_tag,
                     status=model.ReleaseStatus.INITIATED,
@@ -57,6 +62,10 @@ class ReleaseService(interface.IReleaseService):
                     github_ref=github_ref
                 )
 
+                # Повтор запроса того же прогона возвращает уже созданный релиз - событие не дублируем
+                if inserted:
+                    await self._emit([model.ReleaseEvent(release_id, model.ReleaseStatus.INITIATED)])
+
                 span.set_status(Status(StatusCode.OK))
                 return release_id
 
@@ -90,7 +99,7 @@ class ReleaseService(interface.IReleaseService):
                 }
         ) as span:
             try:
-                await self.release_repo.update_release(
+                previous_status = await self.release_repo.update_release(
                     release_id=release_id,
                     status=status,
                     github_run_id=github_run_id,
@@ -99,7 +108,91 @@ class ReleaseService(interface.IReleaseService):
                     approved_list=approved_list,
                 )
 
+                # Правило то же, что в update_releases: подписчики получают только смену статуса.
+                # Прежний статус пустой, если UPDATE не нашел строку или менять было нечего
+                event = model.ReleaseEvent(release_id, status, previous_status)
+                if previous_status is not None and event.status_changed:
+                    await self._emit([event])
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def update_releases(self, updates: list[model.ReleaseUpdate]) -> list[model.ReleaseEvent]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.update_releases",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "updates": len(updates),
+                }
+        ) as span:
+            try:
+                events = await self.release_repo.update_releases(self._merge_updates(updates))
+
+                # Подписчики получают весь пакет одним вызовом и только реальные смены статуса;
+                # вызывающему возвращаем все обновленные строки
+                changed = [event for event in events if event.status_changed]
+                if changed:
+                    await self._emit(changed)
+
+                span.set_status(Status(StatusCode.OK))
+                return events
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    @staticmethod
+    def _merge_updates(updates: list[model.ReleaseUpdate]) -> list[model.ReleaseUpdate]:
+        # UPDATE ... FROM меняет строку только один раз, поэтому несколько переходов
+        # одного релиза в пакете сворачиваем в один: побеждает последнее заданное значение
+        merged: dict[int, model.ReleaseUpdate] = {}
+        for update in updates:
+            current = merged.setdefault(update.release_id, model.ReleaseUpdate(update.release_id))
+            if update.status is not None:
+                current.status = update.status
+            if update.github_run_id is not None:
+                current.github_run_id = update.github_run_id
+            if update.github_action_link is not None:
+                current.github_action_link = update.github_action_link
+        return list(merged.values())
+
+    async def approve_release(
+            self,
+            release_id: int,
+            approver: str,
+            required_approve_count: int,
+    ) -> model.Release | None:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.approve_release",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                    "approver": approver,
+                }
+        ) as span:
+            try:
+                releases = await self.release_repo.approve_release(
+                    release_id=release_id,
+                    approver=approver,
+                    required_approve_count=required_approve_count,
+                )
+
+                # Голосовать можно только в ручном тестировании, поэтому прежний статус известен;
+                # голос без смены статуса подписчики видят как изменение карточки
+                if releases:
+                    await self._emit([model.ReleaseEvent(
+                        release_id,
+                        releases[0].status,
+                        model.ReleaseStatus.MANUAL_TESTING,
+                    )])
+
                 span.set_status(Status(StatusCode.OK))
+                return releases[0] if releases else None
 
             except Exception as err:
                 span.record_exception(err)
@@ -138,6 +231,44 @@ class ReleaseService(interface.IReleaseService):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def find_release(self, release_id: int) -> model.Release | None:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.find_release",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases = await self.release_repo.get_release_by_id(release_id)
+
+                span.set_status(Status(StatusCode.OK))
+                return releases[0] if releases else None
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def get_releases_page(
+            self,
+            bucket: model.ReleaseBucket,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            service_name: str = None,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_releases_page",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases = await self.release_repo.get_releases_page(bucket, limit, cursor, service_name)
+
+                span.set_status(Status(StatusCode.OK))
+                return releases
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
     async def get_successful_releases(self) -> list[model.Release]:
         with self.tracer.start_as_current_span(
                 "ReleaseService.get_successful_releases",
@@ -170,6 +301,80 @@ class ReleaseService(interface.IReleaseService):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def get_successful_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_successful_releases_page",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases = await self.release_repo.get_successful_releases_page(limit, cursor, direction)
+
+                span.set_status(Status(StatusCode.OK))
+                return releases
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def count_successful_releases(self) -> int:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.count_successful_releases",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                total_count = await self.release_repo.count_successful_releases()
+
+                span.set_status(Status(StatusCode.OK))
+                return total_count
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def get_failed_releases_page(
+            self,
+            limit: int,
+            cursor: model.ReleaseCursor = None,
+            direction: model.PageDirection = model.PageDirection.CURRENT,
+    ) -> list[model.ReleaseListItem]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_failed_releases_page",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases = await self.release_repo.get_failed_releases_page(limit, cursor, direction)
+
+                span.set_status(Status(StatusCode.OK))
+                return releases
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def count_failed_releases(self) -> int:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.count_failed_releases",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                total_count = await self.release_repo.count_failed_releases()
+
+                span.set_status(Status(StatusCode.OK))
+                return total_count
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
     async def rollback_to_tag(
             self,
             release_id: int,
@@ -383,3 +588,11 @@ tail -20 "$LOG_FILE"
 """
 
         return rollback_commands
+
+    async def _emit(self, events: list[model.ReleaseEvent]) -> None:
+        # Ошибка подписчика не должна ломать запись релиза
+        for handler in self.event_handlers:
+            try:
+                await handler.on_releases_updated(events)
+            except Exception as err:
+                self.logger.error(f"Ошибка обработчика событий релизов: {err}")
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model, common
+
+
+class ReleaseSubscription:
+    __slots__ = ("queue", "service_name", "release_id", "dropped")
+
+    def __init__(self, queue_size: int, service_name: str | None, release_id: int | None):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.service_name = service_name
+        self.release_id = release_id
+        self.dropped = asyncio.Event()
+
+    def matches(self, event: dict) -> bool:
+        if self.release_id is not None and event["id"] != self.release_id:
+            return False
+        if self.service_name is not None and event["service_name"] != self.service_name:
+            return False
+        return True
+
+
+class ReleaseEventHub(interface.IReleaseEventHub):
+    """Раздача изменений релизов подписчикам SSE внутри процесса.
+
+    Изменения приходят из LISTEN release_changes, поэтому подписчик любой реплики
+    видит и чужие записи, и прямые правки в базе.
+
+    У каждого подписчика своя ограниченная очередь. Подписчик, который не успевает
+    ее разбирать, отключается, а не тормозит остальных: клиент переподключится.
+    """
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            release_repo: interface.IReleaseRepo,
+            queue_size: int,
+            heartbeat_interval: float,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.release_repo = release_repo
+        self.queue_size = queue_size
+        self.heartbeat_interval = heartbeat_interval
+
+        self.subscriptions: set[ReleaseSubscription] = set()
+
+        meter = tel.meter()
+        self.subscribers = meter.create_up_down_counter(
+            name=common.RELEASE_STREAM_SUBSCRIBERS_METRIC,
+            description="Active release event stream subscribers",
+            unit="1"
+        )
+        self.dropped_counter = meter.create_counter(
+            name=common.RELEASE_STREAM_DROPPED_METRIC,
+            description="Release event stream subscribers dropped for falling behind",
+            unit="1"
+        )
+
+    def subscribe(self, service_name: str = None, release_id: int = None) -> ReleaseSubscription:
+        subscription = ReleaseSubscription(self.queue_size, service_name, release_id)
+        self.subscriptions.add(subscription)
+        self.subscribers.add(1)
+        return subscription
+
+    def unsubscribe(self, subscription: ReleaseSubscription) -> None:
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            self.subscribers.add(-1)
+
+    async def on_release_changed(self, change: dict | None) -> None:
+        # Уведомление из Postgres; None после переподключения слушателя означает потерянные
+        # уведомления, но какие релизы изменились, неизвестно - клиентам отдать нечего
+        if change is not None and change.get("id") is not None:
+            await self.on_releases_updated([model.ReleaseEvent(change["id"])])
+
+    async def on_releases_updated(self, events: list[model.ReleaseEvent]) -> None:
+        if not self.subscriptions:
+            return
+
+        with self.tracer.start_as_current_span(
+                "ReleaseEventHub.on_releases_updated",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                for event in events:
+                    releases = await self.release_repo.get_release_list_item_by_id(event.release_id)
+                    if not releases:
+                        continue
+                    self._publish(self._to_payload(releases[0]))
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def stream(self, service_name: str = None, release_id: int = None) -> AsyncIterator[str]:
+        # Подписка создается при первой итерации: если клиент отключится до начала ответа,
+        # генератор не запустится и очередь не повиснет в subscriptions
+        subscription = self.subscribe(service_name, release_id)
+
+        # Отключение ждем вместе с очередью, чтобы отставший подписчик узнал о нем сразу,
+        # а не после очередного heartbeat
+        dropped = asyncio.ensure_future(subscription.dropped.wait())
+        message = None
+        try:
+            # Первая строка сразу подтверждает клиенту и прокси, что поток открыт
+            yield ": connected\n\n"
+            while True:
+                message = asyncio.ensure_future(subscription.queue.get())
+                done, _ = await asyncio.wait(
+                    {message, dropped},
+                    timeout=self.heartbeat_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if dropped in done:
+                    break
+                if message in done:
+                    yield message.result()
+                else:
+                    message.cancel()
+                    yield ": heartbeat\n\n"
+
+            yield "event: dropped\ndata: {}\n\n"
+        finally:
+            # Ожидания не должны пережить отключение клиента
+            dropped.cancel()
+            if message is not None:
+                message.cancel()
+            self.unsubscribe(subscription)
+
+    def _publish(self, payload: dict) -> None:
+        # Поле id не отправляем: событий между переподключениями процесс не хранит,
+        # и Last-Event-ID клиента все равно не смог бы их восполнить
+        message = f"event: release\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        for subscription in list(self.subscriptions):
+            if not subscription.matches(payload):
+                continue
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.logger.warning("Подписчик потока релизов не успевает читать события и отключен")
+                self.dropped_counter.add(1)
+                self.unsubscribe(subscription)
+                subscription.dropped.set()
+
+    @staticmethod
+    def _to_payload(release: model.ReleaseListItem) -> dict:
+        return {
+            "id": release.id,
+            "service_name": release.service_name,
+            "release_tag": release.release_tag,
+            "status": release.status.value,
+            "initiated_by": release.initiated_by,
+            "github_action_link": release.github_action_link,
+        }
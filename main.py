@@ -1,11 +1,22 @@
+import argparse
+import asyncio
+
 import uvicorn
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 import redis.asyncio as redis
 from aiogram.fsm.storage.base import DefaultKeyBuilder
-from aiogram.fsm.storage.redis import RedisStorage
 from sulguk import AiogramSulgukMiddleware
 
 from infrastructure.pg.pg import PG
+from infrastructure.pg.listener import PGListener
+from infrastructure.redis_client.redis_client import RedisClient
+from infrastructure.fsm_storage.cached_storage import CachedRedisStorage
+from infrastructure.fsm_storage.serializer import FsmSerializer
+from infrastructure.fsm_storage.storage import SerializedRedisStorage
+from infrastructure.fsm_storage.sweeper import FsmSweeper
+from infrastructure.tg_rate_limiter.rate_limiter import TelegramRateLimiter, RateLimitMiddleware, Priority
 from infrastructure.telemetry.telemetry import Telemetry, AlertManager
 from pkg.client.external.github.client import GitHubClient
 
@@ -13,8 +24,12 @@ from internal.controller.http.middlerware.middleware import HttpMiddleware
 from internal.controller.tg.middleware.middleware import TgMiddleware
 
 from internal.controller.tg.command.handler import CommandController
+from internal.controller.tg.inline.handler import InlineQueryController
 from internal.controller.http.webhook.handler import TelegramWebhookController
+from internal.controller.http.webhook.scheduler import UpdateScheduler
+from internal.controller.http.webhook.deduplicator import UpdateDeduplicator
 from internal.controller.http.handler.release.handler import ReleaseController
+from internal.controller.http.handler.release_stream.handler import ReleaseStreamController
 
 from internal.dialog.main_menu.dialog import MainMenuDialog
 from internal.dialog.active_release.dialog import ActiveReleaseDialog
@@ -22,6 +37,10 @@ from internal.dialog.success_release.dialog import SuccessfulReleasesDialog
 from internal.dialog.failed_release.dialog import FailedReleasesDialog
 
 from internal.service.release.service import ReleaseService
+from internal.service.notification.service import ReleaseNotificationService
+from internal.service.live_card.registry import OpenCardRegistry
+from internal.service.live_card.service import LiveCardUpdater
+from internal.service.release_stream.hub import ReleaseEventHub
 from internal.dialog.main_menu.service import MainMenuService
 from internal.dialog.active_release.service import ActiveReleaseService
 from internal.dialog.success_release.service import SuccessfulReleasesService
@@ -33,11 +52,16 @@ from internal.dialog.success_release.getter import SuccessfulReleasesGetter
 from internal.dialog.failed_release.getter import FailedReleasesGetter
 
 from internal.repo.release.repo import ReleaseRepo
+from internal.repo.release.cached_repo import CachedReleaseRepo
+from internal.repo.tg_user.repo import TgUserRepo
+from internal.migration.manager import MigrationManager
 
 from internal.app.tg.app import NewTg
+from internal.app.tg.polling import RunPolling, RunReplay
 from internal.app.server.app import NewServer
 
 from internal.config.config import Config
+from internal import common, model
 
 cfg = Config()
 
@@ -72,23 +96,87 @@ redis_client = redis.Redis(
     db=3
 )
 key_builder = DefaultKeyBuilder(with_destiny=True)
-storage = RedisStorage(
+fsm_serializer = FsmSerializer(cfg.fsm_serializer, cfg.fsm_compress_threshold)
+storage = SerializedRedisStorage(
     redis=redis_client,
-    key_builder=key_builder
+    key_builder=key_builder,
+    state_ttl=cfg.fsm_state_ttl or None,
+    data_ttl=cfg.fsm_data_ttl or None,
+    serializer=fsm_serializer,
 )
+if cfg.fsm_cache_mode != "off":
+    storage = CachedRedisStorage(
+        tel,
+        storage,
+        cfg.fsm_cache_mode,
+        cfg.fsm_cache_size,
+        cfg.fsm_cache_ttl,
+    )
 dp = Dispatcher(storage=storage)
-bot = Bot(token=cfg.release_tg_bot_token)
+
+# Брошенные контексты диалогов, на которые не ссылается ни один стек
+fsm_sweeper = FsmSweeper(
+    tel,
+    redis_client,
+    fsm_serializer,
+    cfg.fsm_sweep_interval,
+)
+if cfg.tg_bot_api_url:
+    bot = Bot(
+        token=cfg.release_tg_bot_token,
+        session=AiohttpSession(api=TelegramAPIServer.from_base(cfg.tg_bot_api_url))
+    )
+else:
+    bot = Bot(token=cfg.release_tg_bot_token)
 bot.session.middleware(AiogramSulgukMiddleware())
 
+# Один лимитер на бота и алерты: алерты получают токены после интерактивных ответов
+tg_rate_limiter = TelegramRateLimiter(
+    tel,
+    cfg.tg_global_rate,
+    cfg.tg_chat_rate,
+    cfg.tg_group_chat_rate,
+)
+bot.session.middleware(RateLimitMiddleware(tg_rate_limiter))
+alert_manager.bot.session.middleware(RateLimitMiddleware(tg_rate_limiter, Priority.ALERT))
+
 # Инициализация клиентов
 db = PG(tel, cfg.db_user, cfg.db_pass, cfg.db_host, cfg.db_port, cfg.db_name)
+migration_manager = MigrationManager(tel, db)
+
+bot_redis = RedisClient(
+    cfg.monitoring_redis_host,
+    cfg.monitoring_redis_port,
+    3,
+    cfg.monitoring_redis_password
+)
 
 github_client = GitHubClient(
     tel,
     cfg.github_token
 )
 
-release_repo = ReleaseRepo(tel, db)
+release_repo = CachedReleaseRepo(
+    tel,
+    ReleaseRepo(tel, db),
+    cfg.release_cache_ttl,
+    cfg.release_cache_size
+)
+
+# Изменения релизов с других реплик сбрасывают локальный кеш
+db_listener = PGListener(
+    tel,
+    cfg.db_user,
+    cfg.db_pass,
+    cfg.db_host,
+    cfg.db_port,
+    cfg.db_name,
+    common.RELEASE_CHANGES_CHANNEL,
+)
+db_listener.subscribe(release_repo.on_release_changed)
+
+tg_user_repo = TgUserRepo(tel, bot_redis)
+open_card_registry = OpenCardRegistry(cfg.live_card_ttl)
 
 main_menu_getter = MainMenuGetter(
     tel
@@ -97,7 +185,8 @@ main_menu_getter = MainMenuGetter(
 active_release_getter = ActiveReleaseGetter(
     tel,
     release_repo,
-    cfg.required_approve_list
+    cfg.required_approve_list,
+    open_card_registry,
 )
 
 successful_releases_getter = SuccessfulReleasesGetter(
@@ -107,7 +196,8 @@ successful_releases_getter = SuccessfulReleasesGetter(
 
 failed_releases_getter = FailedReleasesGetter(
     tel,
-    release_repo
+    release_repo,
+    open_card_registry,
 )
 
 # Инициализация сервисов
@@ -167,45 +257,153 @@ failed_releases_dialog = FailedReleasesDialog(
     failed_releases_getter,
 )
 
-command_controller = CommandController(tel)
+command_controller = CommandController(
+    tel,
+    tg_user_repo
+)
+
+inline_query_controller = InlineQueryController(
+    tel,
+    release_repo,
+    [*cfg.admins, *cfg.required_approve_list],
+    cfg.tg_inline_page_size,
+    cfg.tg_inline_cache_time,
+)
+
+tg_middleware = TgMiddleware(
+    tel,
+    bot,
+)
 
 dialog_bg_factory = NewTg(
     dp,
+    tg_middleware,
+    cfg.tg_middleware_mode == "combined",
     command_controller,
+    inline_query_controller,
     main_menu_dialog,
     active_release_dialog,
     successful_releases_dialog,
     failed_releases_dialog
 )
 
-# Инициализация middleware
-tg_middleware = TgMiddleware(
+# Уведомления подтверждающим о релизах в нужных статусах
+release_notification_service = ReleaseNotificationService(
     tel,
     bot,
+    dialog_bg_factory,
+    release_repo,
+    tg_user_repo,
+    cfg.required_approve_list,
+    [model.ReleaseStatus(status) for status in cfg.notify_release_statuses],
 )
+release_service.add_event_handler(release_notification_service)
+
+# Открытые карточки релизов обновляются на месте при изменении релиза
+live_card_updater = LiveCardUpdater(
+    tel,
+    bot,
+    dialog_bg_factory,
+    open_card_registry,
+    cfg.live_card_update_interval,
+)
+release_service.add_event_handler(live_card_updater)
+db_listener.subscribe(live_card_updater.on_release_changed)
+
+# Инициализация middleware
 http_middleware = HttpMiddleware(
     tel,
     cfg.prefix,
 )
+update_scheduler = UpdateScheduler(
+    tel,
+    cfg.tg_update_lanes,
+    cfg.tg_update_queue_size,
+    cfg.tg_update_drain_timeout,
+) if cfg.tg_webhook_async else None
+
+update_deduplicator = UpdateDeduplicator(
+    tel,
+    bot_redis,
+    cfg.tg_update_dedup_ttl,
+)
+
 tg_webhook_controller = TelegramWebhookController(
     tel,
     dp,
     bot,
     cfg.prod_domain,
     cfg.prefix,
+    update_scheduler,
+    update_deduplicator,
+)
+
+# db первым: останавливается последним, когда остальным сервисам база уже не нужна
+background_services = [db, db_listener, release_notification_service, live_card_updater, fsm_sweeper]
+if update_scheduler is not None:
+    background_services.append(update_scheduler)
+
+# События релизов для SSE-подписчиков
+release_event_hub = ReleaseEventHub(
+    tel,
+    release_repo,
+    cfg.release_stream_queue_size,
+    cfg.release_stream_heartbeat,
+)
+# Только через LISTEN: уведомление приходит и о своих записях, и о записях других реплик
+# и прямых правках в базе, поэтому события ReleaseService дублировали бы его. Кеш
+# release_repo подписан раньше и успевает сбросить запись до чтения хабом
+db_listener.subscribe(release_event_hub.on_release_changed)
+
+release_stream_controller = ReleaseStreamController(
+    tel,
+    release_event_hub,
 )
 
 release_controller = ReleaseController(
     tel,
     release_service,
+    bot_redis,
+    cfg.release_idempotency_ttl,
+    cfg.release_batch_max_size,
 )
 
 if __name__ == "__main__":
-    app = NewServer(
-        db,
-        http_middleware,
-        tg_webhook_controller,
-        release_controller,
-        cfg.prefix,
-    )
-    uvicorn.run(app, host="0.0.0.0", port=int(cfg.http_port), access_log=False)
+    parser = argparse.ArgumentParser()
+    # tg - прежнее имя режима server, им запускается образ из .github/Dockerfile
+    parser.add_argument("mode", nargs="?", choices=["server", "tg", "polling", "replay"], default="server")
+    parser.add_argument("--updates", help="JSON Lines с апдейтами для replay")
+    parser.add_argument("--record", help="Дописывать полученные в polling апдейты в файл для replay")
+    parser.add_argument("--delete-webhook", action="store_true", help="Снять вебхук перед polling")
+    args = parser.parse_args()
+
+    if args.mode == "polling":
+        asyncio.run(RunPolling(
+            dp,
+            bot,
+            [db, db_listener, release_notification_service, live_card_updater, fsm_sweeper],
+            args.delete_webhook,
+            args.record,
+        ))
+    elif args.mode == "replay":
+        if not args.updates:
+            parser.error("Для replay нужно указать --updates")
+        asyncio.run(RunReplay(
+            tg_webhook_controller.process_update,
+            args.updates,
+            tel.logger(),
+            [db, db_listener],
+            update_scheduler,
+        ))
+    else:
+        app = NewServer(
+            migration_manager,
+            background_services,
+            http_middleware,
+            cfg.http_middleware_mode == "combined",
+            tg_webhook_controller,
+            release_controller,
+            release_stream_controller,
+            cfg.prefix,
+        )
+        uvicorn.run(app, host="0.0.0.0", port=int(cfg.http_port), access_log=False)
@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiogram")
+pytest.importorskip("opentelemetry")
+
+from aiogram.fsm.storage.base import StorageKey
+
+from infrastructure.fsm_storage.cached_storage import CachedRedisStorage, VERSIONED_MODE, AFFINITY_MODE
+from infrastructure.fsm_storage.serializer import FsmSerializer
+from infrastructure.fsm_storage.storage import SerializedRedisStorage
+from infrastructure.telemetry.noop import NoopTelemetry
+
+KEY = StorageKey(bot_id=1, chat_id=10, user_id=10)
+
+
+class InMemoryRedis:
+    """Общий для реплик Redis: только команды, которые использует CachedRedisStorage"""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.commands: list[str] = []
+        # Вызывается перед выполнением pipeline, чтобы вклинить запись другой реплики
+        self.before_execute = None
+
+    async def get(self, key: str):
+        self.commands.append("get")
+        return self.values.get(key)
+
+    async def set(self, key: str, value, ex=None):
+        self.commands.append("set")
+        self.values[key] = value.encode("utf-8") if isinstance(value, str) else value
+        return True
+
+    async def delete(self, *keys: str):
+        self.commands.append("delete")
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key: str):
+        self.commands.append("incr")
+        value = int(self.values.get(key, 0)) + 1
+        self.values[key] = str(value).encode("utf-8")
+        return value
+
+    async def expire(self, key: str, seconds):
+        self.commands.append("expire")
+        return key in self.values
+
+    def pipeline(self, transaction: bool = True):
+        return InMemoryPipeline(self, transaction)
+
+
+class InMemoryPipeline:
+    def __init__(self, redis: InMemoryRedis, transaction: bool):
+        self.redis = redis
+        self.transaction = transaction
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name: str):
+        command = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.calls.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        if self.redis.before_execute is not None:
+            await self.redis.before_execute()
+        self.redis.commands.append("multi" if self.transaction else "pipeline")
+        return [await command(*args, **kwargs) for command, args, kwargs in self.calls]
+
+
+def make_storage(redis: InMemoryRedis, mode: str = VERSIONED_MODE) -> CachedRedisStorage:
+    storage = SerializedRedisStorage(redis=redis, serializer=FsmSerializer())
+    return CachedRedisStorage(NoopTelemetry(), storage, mode, max_size=100, ttl=60)
+
+
+def test_versioned_hit_reads_only_version():
+    async def scenario():
+        redis = InMemoryRedis()
+        replica = make_storage(redis)
+
+        await replica.set_state(KEY, "Main:menu")
+        await replica.set_data(KEY, {"nav": [1, 2]})
+        await replica.get_state(KEY)
+        redis.commands.clear()
+
+        assert await replica.get_state(KEY) == "Main:menu"
+        assert await replica.get_data(KEY) == {"nav": [1, 2]}
+        # Только проверка версии, без чтения state и data
+        assert redis.commands == ["get", "get"]
+
+    asyncio.run(scenario())
+
+
+def test_versioned_sees_write_from_other_replica():
+    async def scenario():
+        redis = InMemoryRedis()
+        first, second = make_storage(redis), make_storage(redis)
+
+        await first.set_state(KEY, "Main:menu")
+        assert await second.get_state(KEY) == "Main:menu"
+
+        await first.set_state(KEY, "Release:view")
+        assert await second.get_state(KEY) == "Release:view"
+
+    asyncio.run(scenario())
+
+
+def test_versioned_does_not_merge_over_foreign_write():
+    async def scenario():
+        redis = InMemoryRedis()
+        first, second = make_storage(redis), make_storage(redis)
+
+        await first.set_state(KEY, "Main:menu")
+        await first.set_data(KEY, {"step": 1})
+
+        # Вторая реплика пишет data между проверкой версии и записью state первой:
+        # версия первой записи уходит на два шага, и старая data в кеше остаться не должна
+        async def foreign_write():
+            redis.before_execute = None
+            await second.set_data(KEY, {"step": 2})
+
+        redis.before_execute = foreign_write
+        await first.set_state(KEY, "Release:view")
+
+        assert KEY not in first.entries
+        assert await first.get_data(KEY) == {"step": 2}
+        assert await first.get_state(KEY) == "Release:view"
+
+    asyncio.run(scenario())
+
+
+def test_versioned_merges_own_consecutive_writes():
+    async def scenario():
+        redis = InMemoryRedis()
+        replica = make_storage(redis)
+
+        await replica.set_state(KEY, "Main:menu")
+        await replica.get_data(KEY)
+        await replica.set_data(KEY, {"step": 1})
+
+        entry = replica.entries.get(KEY)
+        assert entry.state == "Main:menu"
+        assert replica.serializer.loads(entry.data) == {"step": 1}
+
+    asyncio.run(scenario())
+
+
+def test_versioned_write_of_stale_value_is_not_skipped():
+    async def scenario():
+        redis = InMemoryRedis()
+        first, second = make_storage(redis), make_storage(redis)
+
+        await first.set_state(KEY, "Main:menu")
+        await second.get_state(KEY)
+        await first.set_state(KEY, "Release:view")
+
+        # В кеше второй реплики устаревшее значение, совпадающее с записываемым
+        await second.set_state(KEY, "Main:menu")
+        assert await first.get_state(KEY) == "Main:menu"
+
+    asyncio.run(scenario())
+
+
+def test_versioned_write_is_single_transaction():
+    async def scenario():
+        redis = InMemoryRedis()
+        replica = make_storage(redis)
+
+        await replica.set_state(KEY, "Main:menu")
+        await replica.get_state(KEY)
+        redis.commands.clear()
+
+        await replica.set_state(KEY, "Release:view")
+        await replica.set_state(KEY, "Release:view")
+        # Без отдельного GET версии перед записью; в versioned неизмененная запись не пропускается
+        assert redis.commands == ["multi", "set", "incr", "multi", "set", "incr"]
+        assert replica.entries.get(KEY).state == "Release:view"
+
+    asyncio.run(scenario())
+
+
+def test_miss_loads_in_transaction():
+    async def scenario():
+        redis = InMemoryRedis()
+        await make_storage(redis).set_state(KEY, "Main:menu")
+        redis.commands.clear()
+
+        assert await make_storage(redis).get_state(KEY) == "Main:menu"
+        assert "multi" in redis.commands
+
+    asyncio.run(scenario())
+
+
+def test_affinity_skips_unchanged_write():
+    async def scenario():
+        redis = InMemoryRedis()
+        replica = make_storage(redis, AFFINITY_MODE)
+
+        await replica.set_state(KEY, "Main:menu")
+        await replica.get_state(KEY)
+        redis.commands.clear()
+
+        await replica.set_state(KEY, "Main:menu")
+        assert await replica.get_state(KEY) == "Main:menu"
+        assert redis.commands == []
+
+    asyncio.run(scenario())
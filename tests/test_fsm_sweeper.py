@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("opentelemetry")
+
+from infrastructure.fsm_storage.serializer import FsmSerializer
+from infrastructure.fsm_storage.sweeper import FsmSweeper
+from infrastructure.telemetry.noop import NoopTelemetry
+
+STACK_KEY = "fsm:10:10:aiogd:stack::data"
+LIVE_CONTEXT_KEY = "fsm:10:10:aiogd:context:live1:data"
+ORPHAN_CONTEXT_KEY = "fsm:10:10:aiogd:context:orph1:data"
+OTHER_USER_CONTEXT_KEY = "fsm:20:20:aiogd:context:live1:data"
+
+
+def make_sweeper(redis) -> FsmSweeper:
+    return FsmSweeper(NoopTelemetry(), redis, FsmSerializer(), interval=60)
+
+
+async def plant(redis, serializer: FsmSerializer, stack_value: bytes = None) -> None:
+    await redis.set(STACK_KEY, stack_value or serializer.dumps({"intents": ["live1"]}))
+    await redis.set(LIVE_CONTEXT_KEY, serializer.dumps({"intent_id": "live1"}))
+    await redis.set(ORPHAN_CONTEXT_KEY, serializer.dumps({"intent_id": "orph1"}))
+
+
+def test_sweep_deletes_only_orphan_context():
+    async def scenario():
+        redis = fakeredis.aioredis.FakeRedis()
+        sweeper = make_sweeper(redis)
+        await plant(redis, sweeper.serializer)
+        # Контекст другого пользователя не спасается стеком первого
+        await redis.set(OTHER_USER_CONTEXT_KEY, sweeper.serializer.dumps({"intent_id": "live1"}))
+
+        # Первый обход только запоминает кандидатов
+        assert await sweeper.sweep() == 0
+        assert sweeper.key_counts == {"stack": 1, "context": 3, "orphan": 2}
+
+        assert await sweeper.sweep() == 2
+        assert await redis.exists(STACK_KEY, LIVE_CONTEXT_KEY) == 2
+        assert await redis.exists(ORPHAN_CONTEXT_KEY, OTHER_USER_CONTEXT_KEY) == 0
+
+    asyncio.run(scenario())
+
+
+def test_sweep_keeps_contexts_of_unreadable_stack():
+    async def scenario():
+        redis = fakeredis.aioredis.FakeRedis()
+        sweeper = make_sweeper(redis)
+        await plant(redis, sweeper.serializer, stack_value=b"{broken")
+
+        assert await sweeper.sweep() == 0
+        assert await sweeper.sweep() == 0
+        assert await redis.exists(STACK_KEY, LIVE_CONTEXT_KEY, ORPHAN_CONTEXT_KEY) == 3
+
+    asyncio.run(scenario())
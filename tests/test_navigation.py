@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("aiogram")
+
+from internal.model.navigation import ReleaseNavigation
+from internal.model.release import PageDirection
+
+
+def test_move_in_empty_list_stays_put():
+    navigation = ReleaseNavigation(release_ids=[])
+    navigation.clamp()
+
+    assert navigation.move(PageDirection.NEXT) is False
+    assert navigation.move(PageDirection.PREV) is False
+    assert navigation.current_index == 0
+    assert navigation.current_release_id is None
+
+
+def test_move_stops_at_list_bounds():
+    navigation = ReleaseNavigation(release_ids=[3, 2, 1])
+    navigation.clamp()
+
+    assert navigation.move(PageDirection.PREV) is False
+    assert navigation.move(PageDirection.NEXT) is True
+    assert navigation.move(PageDirection.NEXT) is True
+    assert navigation.move(PageDirection.NEXT) is False
+    assert navigation.current_release_id == 1
+
+
+def test_move_by_cursor_remembers_direction():
+    navigation = ReleaseNavigation(current_index=0, total_count=2)
+
+    assert navigation.move(PageDirection.NEXT) is True
+    assert navigation.direction == PageDirection.NEXT
+    assert navigation.current_index == 1
@@ -0,0 +1,172 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("asyncpg")
+pytest.importorskip("opentelemetry")
+
+# Тесты пересоздают таблицы, поэтому запускаются только на выделенной базе
+if not os.getenv("TEST_DB_HOST"):
+    pytest.skip("TEST_DB_HOST не задан: нужна отдельная база PostgreSQL", allow_module_level=True)
+
+from infrastructure.pg.pg import PG
+from internal import model
+from internal.migration.manager import MigrationManager
+from internal.repo.release.repo import ReleaseRepo
+from internal.service.release.service import ReleaseService
+from infrastructure.telemetry.noop import NoopTelemetry
+
+
+def run(scenario):
+    async def wrapper():
+        tel = NoopTelemetry()
+        db = PG(
+            tel,
+            os.getenv("TEST_DB_USER", "postgres"),
+            os.getenv("TEST_DB_PASSWORD", "postgres"),
+            os.getenv("TEST_DB_HOST"),
+            os.getenv("TEST_DB_PORT", "5432"),
+            os.getenv("TEST_DB_NAME", "postgres"),
+        )
+        try:
+            await db.multi_query([
+                "DROP TABLE IF EXISTS releases CASCADE;",
+                "DROP TABLE IF EXISTS migrations;",
+            ])
+            await MigrationManager(tel, db).up()
+            await scenario(db, ReleaseRepo(tel, db))
+        finally:
+            await db.pool.kw["bind"].dispose()
+
+    asyncio.run(wrapper())
+
+
+async def create(repo: ReleaseRepo, github_run_id: str = "run-1", link: str = "https://ci/1") -> tuple[int, bool]:
+    return await repo.create_release(
+        service_name="loom-tg-bot",
+        release_tag="v1.0.0",
+        status=model.ReleaseStatus.INITIATED,
+        initiated_by="dev",
+        github_run_id=github_run_id,
+        github_action_link=link,
+        github_ref="refs/tags/v1.0.0",
+    )
+
+
+def test_create_release_replay_returns_existing_row():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        release_id, inserted = await create(repo, link="https://ci/1")
+        replay_id, replay_inserted = await create(repo, link="https://ci/1-retry")
+
+        assert inserted is True
+        assert replay_inserted is False
+        assert replay_id == release_id
+
+        rows = await db.select("SELECT count(*) AS total, max(github_action_link) AS link FROM releases", {})
+        assert rows[0].total == 1
+        assert rows[0].link == "https://ci/1-retry"
+
+    run(scenario)
+
+
+def test_create_release_pure_retry_leaves_row_untouched():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        release_id, _ = await create(repo, link="https://ci/1")
+        replay_id, replay_inserted = await create(repo, link="https://ci/1")
+
+        assert replay_id == release_id
+        assert replay_inserted is False
+
+        # Без UPDATE триггер версии не срабатывает, и ETag не меняется
+        rows = await db.select("SELECT version FROM releases WHERE id = :id", {"id": release_id})
+        assert rows[0].version == 1
+
+    run(scenario)
+
+
+def test_create_release_other_run_inserts_new_row():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        first_id, _ = await create(repo, github_run_id="run-1")
+        second_id, inserted = await create(repo, github_run_id="run-2")
+
+        assert inserted is True
+        assert second_id != first_id
+
+    run(scenario)
+
+
+def test_update_releases_reports_previous_status():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        release_id, _ = await create(repo)
+
+        events = await repo.update_releases([
+            model.ReleaseUpdate(release_id, status=model.ReleaseStatus.STAGE_BUILDING),
+        ])
+
+        assert events == [model.ReleaseEvent(
+            release_id,
+            model.ReleaseStatus.STAGE_BUILDING,
+            model.ReleaseStatus.INITIATED,
+        )]
+        assert events[0].status_changed
+
+    run(scenario)
+
+
+def test_update_releases_without_status_keeps_status():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        release_id, _ = await create(repo)
+
+        events = await repo.update_releases([
+            model.ReleaseUpdate(release_id, github_action_link="https://ci/2"),
+        ])
+
+        assert len(events) == 1
+        assert events[0].status == model.ReleaseStatus.INITIATED
+        assert not events[0].status_changed
+
+        rows = await db.select("SELECT status, github_action_link FROM releases WHERE id = :id", {"id": release_id})
+        assert rows[0].status == model.ReleaseStatus.INITIATED.value
+        assert rows[0].github_action_link == "https://ci/2"
+
+    run(scenario)
+
+
+def test_update_releases_duplicate_ids_update_row_once():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        release_id, _ = await create(repo)
+        updates = [
+            model.ReleaseUpdate(release_id, status=model.ReleaseStatus.STAGE_BUILDING),
+            model.ReleaseUpdate(release_id, github_action_link="https://ci/2"),
+            model.ReleaseUpdate(release_id, status=model.ReleaseStatus.MANUAL_TESTING),
+        ]
+
+        # Без свертки UPDATE ... FROM применяет к строке только одну из записей
+        events = await repo.update_releases(updates)
+        assert len(events) == 1
+        assert events[0].previous_status == model.ReleaseStatus.INITIATED
+
+        events = await repo.update_releases(ReleaseService._merge_updates(updates))
+        assert len(events) == 1
+        assert events[0].status == model.ReleaseStatus.MANUAL_TESTING
+
+        rows = await db.select("SELECT github_action_link FROM releases WHERE id = :id", {"id": release_id})
+        assert rows[0].github_action_link == "https://ci/2"
+
+    run(scenario)
+
+
+def test_update_releases_skips_unknown_ids():
+    async def scenario(db: PG, repo: ReleaseRepo):
+        release_id, _ = await create(repo)
+
+        events = await repo.update_releases([
+            model.ReleaseUpdate(release_id, status=model.ReleaseStatus.STAGE_BUILDING),
+            model.ReleaseUpdate(release_id + 1000, status=model.ReleaseStatus.DEPLOYED),
+        ])
+
+        assert [event.release_id for event in events] == [release_id]
+
+    run(scenario)